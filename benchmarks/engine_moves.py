@@ -0,0 +1,119 @@
+"""Throughput of the headless game engines.
+
+Run from the repository root:
+
+    python benchmarks/engine_moves.py [--moves N] [--seed S]
+
+Plays random moves against each engine (restarting finished games) and
+prints moves per second. ``snake-long`` instead steers one snake round a
+Hamiltonian cycle so it grows to hundreds of cells without dying, which is
+where per-tick cost that scales with the body length shows up. No Tk is
+imported.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engines import Game2048, HangmanGame, SlidingPuzzle, SnakeGame, TicTacToe
+from engines.game_2048 import DIRECTIONS as DIRECTIONS_2048
+from engines.snake import DIRECTIONS as SNAKE_DIRECTIONS
+
+WORDS = ["python", "programming", "computer", "algorithm", "database"]
+LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+
+
+def bench_2048(moves, rng):
+    game = Game2048(rng)
+    for _ in range(moves):
+        if game.over:
+            game.reset()
+        game.step(rng.choice(DIRECTIONS_2048))
+
+
+def bench_snake(moves, rng):
+    directions = list(SNAKE_DIRECTIONS)
+    game = SnakeGame(rng=rng)
+    for _ in range(moves):
+        if not game.alive:
+            game = SnakeGame(rng=rng)
+        game.queue_direction(rng.choice(directions))
+        game.step()
+
+
+def cycle_direction(cell, width, height):
+    # Serpentine rows over columns 1.., then back up column 0
+    x, y = cell
+    if x == 0:
+        return 'Right' if y == 0 else 'Up'
+    if y % 2 == 0:
+        return 'Right' if x < width - 1 else 'Down'
+    if x > 1 or y == height - 1:
+        return 'Left'
+    return 'Down'
+
+
+def bench_snake_long(moves, rng):
+    game = SnakeGame(food_count=10, rng=rng)
+    for _ in range(moves):
+        game.queue_direction(cycle_direction(game.body[0], game.width, game.height))
+        game.step()
+    assert game.alive
+
+
+def bench_puzzle(moves, rng):
+    directions = ['Left', 'Right', 'Up', 'Down']
+    game = SlidingPuzzle(4, rng)
+    game.shuffle()
+    for _ in range(moves):
+        position = game.tile_for_direction(rng.choice(directions))
+        if position is not None:
+            game.move(position)
+
+
+def bench_tictactoe(moves, rng):
+    game = TicTacToe()
+    for _ in range(moves):
+        if game.over:
+            game.reset()
+        game.play(rng.choice([i for i, cell in enumerate(game.board) if cell == '']))
+
+
+def bench_hangman(moves, rng):
+    game = HangmanGame(rng.choice(WORDS))
+    for _ in range(moves):
+        if game.won or game.lost:
+            game = HangmanGame(rng.choice(WORDS))
+        game.guess(rng.choice(LETTERS))
+
+
+BENCHMARKS = {
+    '2048': bench_2048,
+    'snake': bench_snake,
+    'snake-long': bench_snake_long,
+    'puzzle': bench_puzzle,
+    'tictactoe': bench_tictactoe,
+    'hangman': bench_hangman,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--moves', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('games', nargs='*', default=list(BENCHMARKS))
+    args = parser.parse_args()
+
+    for name in args.games:
+        rng = random.Random(args.seed)
+        started = time.perf_counter()
+        BENCHMARKS[name](args.moves, rng)
+        elapsed = time.perf_counter() - started
+        print(f"{name:<10} {args.moves / elapsed:12,.0f} moves/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Import cost of the login module, measured with ``python -X importtime``.
+
+Run from the repository root:
+
+    python benchmarks/import_time.py [--runs N] [--top N] [--budget-ms MS]
+
+Each run imports ``login`` in a fresh interpreter. The report shows the
+median cumulative import time of ``login`` and the modules with the largest
+self time. With ``--budget-ms`` the script exits with status 1 when the
+median is over budget, so it can gate CI.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_once(module):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    timings = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--module', default='login')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--budget-ms', type=float)
+    args = parser.parse_args()
+
+    runs = [run_once(args.module) for _ in range(args.runs)]
+    totals = [run[args.module][1] / 1000 for run in runs]
+    median = statistics.median(totals)
+
+    print(f"{args.module}: median {median:.1f} ms, "
+          f"min {min(totals):.1f} ms, max {max(totals):.1f} ms over {args.runs} runs")
+
+    # Median self time per module across runs
+    names = set().union(*runs)
+    self_times = {name: statistics.median(run[name][0] for run in runs if name in run)
+                  for name in names}
+    print(f"Top {args.top} modules by self time:")
+    for name, self_us in sorted(self_times.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {self_us / 1000:8.2f} ms  {name}")
+
+    if args.budget_ms is not None and median > args.budget_ms:
+        print(f"FAIL: {median:.1f} ms is over the {args.budget_ms:.1f} ms budget")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""Latency of sliding puzzle hints.
+
+Run from the repository root:
+
+    python benchmarks/puzzle_hints.py [--boards N] [--budget S] [--seed S]
+
+Solves random boards of each size and level in-process and prints the
+median and worst search time, how many searches finished inside the
+budget, and whether the pattern databases were used (build them with
+``python -m engines.puzzle_pdb build``).
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engines import SlidingPuzzle, puzzle_pdb, puzzle_solver
+from engines.puzzle import DIFFICULTIES
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--boards', type=int, default=20)
+    parser.add_argument('--budget', type=float, default=0.1)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('sizes', nargs='*', type=int, default=[3, 4, 5])
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        heuristic = 'pdb' if puzzle_pdb.load(size) is not None else 'manhattan+lc'
+        for level in DIFFICULTIES:
+            puzzle = SlidingPuzzle(size, random.Random(args.seed))
+            times = []
+            solved = 0
+            for _ in range(args.boards):
+                puzzle.shuffle(level)
+                started = time.perf_counter()
+                if puzzle_solver.solve(puzzle.tiles, size, args.budget) is not None:
+                    solved += 1
+                times.append(time.perf_counter() - started)
+            print(f"{size}x{size} {level:<7} {heuristic:<13} median {statistics.median(times) * 1000:6.1f} ms"
+                  f"  max {max(times) * 1000:6.1f} ms  solved {solved}/{args.boards}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,13 @@
+"""Headless game engines.
+
+Pure-Python game state and rules with no Tk dependency. GameApp drives
+these and only handles drawing, so the engines can be benchmarked and
+simulated on their own.
+"""
+from engines.game_2048 import Game2048
+from engines.hangman import HangmanGame
+from engines.puzzle import SlidingPuzzle
+from engines.snake import SnakeGame, SnakeStep
+from engines.tictactoe import TicTacToe
+
+__all__ = ['Game2048', 'HangmanGame', 'SlidingPuzzle', 'SnakeGame', 'SnakeStep', 'TicTacToe']
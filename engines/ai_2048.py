@@ -0,0 +1,152 @@
+"""Expectimax search for 2048 hints and autoplay.
+
+Works on the packed boards from engines.game_2048. The search alternates
+player moves (max) with tile spawns (expectation over every empty cell,
+2 with p=0.9 and 4 with p=0.1), deepens iteratively until the time budget
+runs out and caches board values in a transposition table that survives
+between calls, so autoplay reuses work from the previous move.
+"""
+import time
+from array import array
+
+from engines import game_2048
+from engines.game_2048 import DIRECTIONS, ROW_MASK
+
+# Row heuristic weights (monotonic rows, empty cells, merge chances and a
+# penalty for large tiles away from the edges)
+LOST_PENALTY = 200000.0
+MONOTONICITY_POWER = 4.0
+MONOTONICITY_WEIGHT = 47.0
+SUM_POWER = 3.5
+SUM_WEIGHT = 11.0
+MERGES_WEIGHT = 700.0
+EMPTY_WEIGHT = 270.0
+
+# Chance branches less likely than this are scored by the heuristic alone
+MIN_PROBABILITY = 0.0001
+CACHE_LIMIT = 500000
+
+_row_heuristic = None
+_cache = {}
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+def _build_row_heuristic():
+    table = array('d', bytes(8 * 65536))
+    for row in range(65536):
+        cells = [row & 0xF, row >> 4 & 0xF, row >> 8 & 0xF, row >> 12 & 0xF]
+        total = sum(c ** SUM_POWER for c in cells)
+        empty = cells.count(0)
+        
+        merges = 0
+        counter = 0
+        prev = 0
+        for cell in cells:
+            if not cell:
+                continue
+            if prev == cell:
+                counter += 1
+            elif counter > 0:
+                merges += 1 + counter
+                counter = 0
+            prev = cell
+        if counter > 0:
+            merges += 1 + counter
+            
+        mono_left = mono_right = 0.0
+        for i in range(1, 4):
+            a = cells[i - 1] ** MONOTONICITY_POWER
+            b = cells[i] ** MONOTONICITY_POWER
+            if cells[i - 1] > cells[i]:
+                mono_left += a - b
+            else:
+                mono_right += b - a
+                
+        table[row] = (LOST_PENALTY + EMPTY_WEIGHT * empty + MERGES_WEIGHT * merges
+                      - MONOTONICITY_WEIGHT * min(mono_left, mono_right)
+                      - SUM_WEIGHT * total)
+    return table
+
+
+def evaluate(board):
+    global _row_heuristic
+    if _row_heuristic is None:
+        _row_heuristic = _build_row_heuristic()
+    h = _row_heuristic
+    t = game_2048.transpose(board)
+    return (h[board & ROW_MASK] + h[board >> 16 & ROW_MASK] +
+            h[board >> 32 & ROW_MASK] + h[board >> 48 & ROW_MASK] +
+            h[t & ROW_MASK] + h[t >> 16 & ROW_MASK] +
+            h[t >> 32 & ROW_MASK] + h[t >> 48 & ROW_MASK])
+
+
+def _max_node(board, depth, probability, deadline):
+    best = 0.0
+    for direction in DIRECTIONS:
+        moved, _ = game_2048.move(board, direction)
+        if moved != board:
+            best = max(best, _chance_node(moved, depth, probability, deadline))
+    return best
+
+
+def _chance_node(board, depth, probability, deadline):
+    if depth <= 0 or probability < MIN_PROBABILITY:
+        return evaluate(board)
+    key = (board, depth)
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
+    if time.monotonic() > deadline:
+        raise SearchTimeout
+        
+    shifts = game_2048.spawn_shifts(board)
+    if not shifts:
+        return evaluate(board)
+    weight = 1.0 / len(shifts)
+    total = 0.0
+    for shift in shifts:
+        total += 0.9 * _max_node(board | (1 << shift), depth - 1,
+                                 probability * weight * 0.9, deadline)
+        total += 0.1 * _max_node(board | (2 << shift), depth - 1,
+                                 probability * weight * 0.1, deadline)
+    value = total * weight
+    
+    if len(_cache) >= CACHE_LIMIT:
+        _cache.clear()
+    _cache[key] = value
+    return value
+
+
+def warm_up():
+    # Build the lookup tables up front (used as the worker initializer)
+    game_2048.tables()
+    evaluate(0)
+
+
+def best_move(board, max_depth=4, time_budget=0.25):
+    # Returns the best direction, or None if no move changes the board.
+    # Depth counts player moves; the result of the deepest search that
+    # finished inside the budget is used, falling back to a greedy pick.
+    moves = []
+    for direction in DIRECTIONS:
+        moved, gained = game_2048.move(board, direction)
+        if moved != board:
+            moves.append((direction, moved, gained))
+    if not moves:
+        return None
+    if len(moves) == 1:
+        return moves[0][0]
+        
+    deadline = time.monotonic() + time_budget
+    best = max(moves, key=lambda m: evaluate(m[1]) + m[2])[0]
+    for depth in range(1, max_depth + 1):
+        try:
+            scored = [(_chance_node(moved, depth, 1.0, deadline) + gained, direction)
+                      for direction, moved, gained in moves]
+        except SearchTimeout:
+            break
+        best = max(scored)[1]
+    return best
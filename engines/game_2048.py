@@ -0,0 +1,224 @@
+"""2048 rules on a packed 64-bit board.
+
+Each of the 16 cells is a 4-bit tile exponent (0 = empty, k = tile 2**k),
+cell (i, j) lives at bits 4 * (4 * i + j). A row is therefore one 16-bit
+chunk, and every possible row has its left/right result and score
+precomputed in 65,536-entry tables. A move is four table lookups (plus one
+transpose for up/down), change detection is one integer compare and the
+game over check is a fixed number of bit operations.
+
+Because a cell is a nibble, 32768 (2**15) is the largest tile: two 32768
+tiles do not merge, where the old list version would have made 65536.
+
+Building the tables takes a noticeable fraction of a second, so the app
+calls tables() from a background thread at startup; a caller that gets
+there first builds them itself and later callers wait for it.
+"""
+import random
+import threading
+from array import array
+
+SIZE = 4
+DIRECTIONS = ('left', 'right', 'up', 'down')
+ROW_MASK = 0xFFFF
+MAX_EXPONENT = 15  # 32768 is the largest tile that fits in a nibble
+
+# Lookup tables, filled in by tables() on first use
+LEFT = RIGHT = UP = DOWN = SCORE_LEFT = SCORE_RIGHT = None
+_tables_lock = threading.Lock()
+
+
+def _merge_row(cells):
+    # Same merge rule as the original list version, on exponents
+    line = [c for c in cells if c]
+    gained = 0
+    for j in range(len(line) - 1):
+        if line[j] and line[j] == line[j + 1] and line[j] < MAX_EXPONENT:
+            line[j] += 1
+            gained += 1 << line[j]
+            line[j + 1] = 0
+    line = [c for c in line if c]
+    line.extend([0] * (SIZE - len(line)))
+    return line, gained
+
+
+def _pack_row(cells):
+    return cells[0] | cells[1] << 4 | cells[2] << 8 | cells[3] << 12
+
+
+def _row_to_column(row):
+    # Spread a 16-bit row into column 0 of a board
+    return ((row & 0xF) | (row & 0xF0) << 12 |
+            (row & 0xF00) << 24 | (row & 0xF000) << 36)
+
+
+def _reverse_row(row):
+    return (row >> 12 | (row >> 4 & 0xF0) | (row << 4 & 0xF00) | (row << 12 & 0xF000))
+
+
+def tables():
+    # Built on first use so importing the module stays cheap. Safe to call
+    # from several threads; only one of them does the work.
+    if LEFT is None:
+        with _tables_lock:
+            if LEFT is None:
+                _build_tables()
+
+
+def _build_tables():
+    global LEFT, RIGHT, UP, DOWN, SCORE_LEFT, SCORE_RIGHT
+    left = array('H', bytes(2 * 65536))
+    score_left = array('L', bytes(array('L').itemsize * 65536))
+    for row in range(65536):
+        merged, gained = _merge_row([row & 0xF, row >> 4 & 0xF, row >> 8 & 0xF, row >> 12 & 0xF])
+        left[row] = _pack_row(merged)
+        score_left[row] = gained
+    
+    # Moving right is moving the mirrored row left
+    right = array('H', bytes(2 * 65536))
+    score_right = array('L', bytes(array('L').itemsize * 65536))
+    for row in range(65536):
+        mirrored = _reverse_row(row)
+        right[row] = _reverse_row(left[mirrored])
+        score_right[row] = score_left[mirrored]
+    
+    UP = array('Q', map(_row_to_column, left))
+    DOWN = array('Q', map(_row_to_column, right))
+    RIGHT, SCORE_LEFT, SCORE_RIGHT = right, score_left, score_right
+    # Published last: move() only checks LEFT
+    LEFT = left
+
+
+def transpose(board):
+    a1 = board & 0xF0F00F0FF0F00F0F
+    a2 = board & 0x0000F0F00000F0F0
+    a3 = board & 0x0F0F00000F0F0000
+    a = a1 | (a2 << 12) | (a3 >> 12)
+    b1 = a & 0xFF00FF0000FF00FF
+    b2 = a & 0x00FF00FF00000000
+    b3 = a & 0x00000000FF00FF00
+    return b1 | (b2 >> 24) | (b3 << 24)
+
+
+def move(board, direction):
+    # Returns (new_board, points gained); new_board == board means no move
+    if LEFT is None:
+        tables()
+    if direction == 'left' or direction == 'right':
+        table, scores = (LEFT, SCORE_LEFT) if direction == 'left' else (RIGHT, SCORE_RIGHT)
+        r0 = board & ROW_MASK
+        r1 = board >> 16 & ROW_MASK
+        r2 = board >> 32 & ROW_MASK
+        r3 = board >> 48 & ROW_MASK
+        return (table[r0] | table[r1] << 16 | table[r2] << 32 | table[r3] << 48,
+                scores[r0] + scores[r1] + scores[r2] + scores[r3])
+    if direction == 'up' or direction == 'down':
+        table, scores = (UP, SCORE_LEFT) if direction == 'up' else (DOWN, SCORE_RIGHT)
+        t = transpose(board)
+        c0 = t & ROW_MASK
+        c1 = t >> 16 & ROW_MASK
+        c2 = t >> 32 & ROW_MASK
+        c3 = t >> 48 & ROW_MASK
+        return (table[c0] | table[c1] << 4 | table[c2] << 8 | table[c3] << 12,
+                scores[c0] + scores[c1] + scores[c2] + scores[c3])
+    raise ValueError(f"Unknown direction: {direction}")
+
+
+def empty_mask(board):
+    # One bit (the lowest of its nibble) set for every empty cell
+    x = board | (board >> 2)
+    x |= x >> 1
+    return ~x & 0x1111111111111111
+
+
+def spawn_shifts(board):
+    # Bit offsets of the empty cells, lowest first
+    mask = empty_mask(board)
+    shifts = []
+    while mask:
+        low = mask & -mask
+        shifts.append(low.bit_length() - 1)
+        mask ^= low
+    return shifts
+
+
+def is_game_over(board):
+    if empty_mask(board):
+        return False
+    # A full board can only move if some row or column has an equal pair,
+    # and then the left (or up) table changes it
+    if move(board, 'left')[0] != board:
+        return False
+    return move(board, 'up')[0] == board
+
+
+def from_rows(rows):
+    board = 0
+    for i, row in enumerate(rows):
+        for j, value in enumerate(row):
+            if value:
+                board |= (value.bit_length() - 1) << (4 * (4 * i + j))
+    return board
+
+
+def to_rows(board):
+    rows = []
+    for i in range(SIZE):
+        row = []
+        for j in range(SIZE):
+            exponent = board >> (4 * (4 * i + j)) & 0xF
+            row.append(1 << exponent if exponent else 0)
+        rows.append(row)
+    return rows
+
+
+class Game2048:
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+        tables()
+        self.reset()
+
+    def reset(self):
+        self.bits = 0
+        self.score = 0
+        self.over = False
+        self.spawn_tile()
+        self.spawn_tile()
+
+    @property
+    def board(self):
+        # Tile values as a list of rows, for drawing
+        return to_rows(self.bits)
+
+    def spawn_tile(self):
+        mask = empty_mask(self.bits)
+        if mask:
+            # Pick the k-th empty cell by clearing the k lowest set bits
+            for _ in range(self.rng.randrange(mask.bit_count())):
+                mask &= mask - 1
+            shift = (mask & -mask).bit_length() - 1
+            exponent = 1 if self.rng.random() < 0.9 else 2
+            self.bits |= exponent << shift
+
+    def apply(self, direction):
+        # Slide and merge without spawning; returns True if anything moved
+        new_bits, gained = move(self.bits, direction)
+        if new_bits == self.bits:
+            return False
+        self.bits = new_bits
+        self.score += gained
+        return True
+
+    def step(self, direction):
+        # One player move: slide, spawn a tile if the board changed and
+        # update the game over flag
+        if self.over:
+            return False
+        moved = self.apply(direction)
+        if moved:
+            self.spawn_tile()
+        self.over = is_game_over(self.bits)
+        return moved
+
+    def is_game_over(self):
+        return is_game_over(self.bits)
@@ -0,0 +1,33 @@
+"""Hangman rules for a single word."""
+
+MAX_TRIES = 6
+
+
+class HangmanGame:
+    def __init__(self, word, tries=MAX_TRIES):
+        self.word = word
+        self.tries = tries
+        self.guessed = set()
+
+    def guess(self, letter):
+        # Returns True for a hit, False for a miss and None if the letter
+        # was already guessed or the game is already over
+        if letter in self.guessed or self.won or self.lost:
+            return None
+        self.guessed.add(letter)
+        if letter in self.word:
+            return True
+        self.tries -= 1
+        return False
+
+    def masked(self):
+        return " ".join(letter.upper() if letter in self.guessed else "_"
+                        for letter in self.word)
+
+    @property
+    def won(self):
+        return all(letter in self.guessed for letter in self.word)
+
+    @property
+    def lost(self):
+        return self.tries <= 0
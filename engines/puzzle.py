@@ -0,0 +1,119 @@
+"""Sliding tile puzzle on an N x N board (None marks the blank)."""
+import random
+
+# Random-walk length from the solved board, per board side; 'hard' boards
+# are drawn uniformly from all solvable arrangements instead
+DIFFICULTY_MOVES = {'easy': 4, 'medium': 12}
+DIFFICULTIES = ['easy', 'medium', 'hard']
+
+
+def is_solvable(tiles, size):
+    # Every move keeps this parity, so only half of all shuffles are reachable
+    # from the solved board. Sliding the blank along a row leaves the
+    # inversion count alone; moving it a row changes it by size - 1.
+    numbers = [tile for tile in tiles if tile is not None]
+    inversions = sum(1 for i, a in enumerate(numbers) for b in numbers[i + 1:] if a > b)
+    if size % 2 == 1:
+        return inversions % 2 == 0
+    blank_row = tiles.index(None) // size
+    return (inversions + size - 1 - blank_row) % 2 == 0
+
+
+class SlidingPuzzle:
+    # The blank position and the number of tiles already on their goal cell
+    # are kept up to date on every slide, so moves and the win check are
+    # O(1) for any board size
+    def __init__(self, size=4, rng=None):
+        self.size = size
+        self.rng = rng or random.Random()
+        self.set_tiles(list(range(1, size * size)) + [None])
+        self.moves = 0
+
+    def set_tiles(self, tiles):
+        self.tiles = tiles
+        self.blank_pos = tiles.index(None)
+        self.in_place = sum(1 for i, tile in enumerate(tiles) if tile == i + 1)
+
+    def shuffle(self, difficulty='hard'):
+        tiles = list(range(1, self.size * self.size)) + [None]
+        if difficulty == 'hard':
+            self.rng.shuffle(tiles)
+            if not is_solvable(tiles, self.size):
+                # Swapping two tiles flips the parity
+                first, second = [i for i, tile in enumerate(tiles) if tile is not None][:2]
+                tiles[first], tiles[second] = tiles[second], tiles[first]
+            self.set_tiles(tiles)
+        else:
+            self.set_tiles(tiles)
+            self.random_walk(DIFFICULTY_MOVES[difficulty] * self.size)
+        self.moves = 0
+
+    def random_walk(self, steps):
+        # Slide random tiles into the blank, never undoing the previous slide
+        previous = None
+        for _ in range(steps):
+            empty_pos = self.blank_pos
+            choices = [position for position in self.neighbours(empty_pos) if position != previous]
+            self.slide(self.rng.choice(choices))
+            previous = empty_pos
+
+    def neighbours(self, position):
+        row, col = divmod(position, self.size)
+        cells = []
+        if row > 0:
+            cells.append(position - self.size)
+        if row < self.size - 1:
+            cells.append(position + self.size)
+        if col > 0:
+            cells.append(position - 1)
+        if col < self.size - 1:
+            cells.append(position + 1)
+        return cells
+
+    def blank(self):
+        return self.blank_pos
+
+    def can_move(self, position):
+        # A tile can move if it is next to the blank
+        offset = position - self.blank_pos
+        if offset in (1, -1):
+            return position // self.size == self.blank_pos // self.size
+        return offset in (self.size, -self.size) and 0 <= position < len(self.tiles)
+
+    def slide(self, position):
+        # Move the tile at position into the blank, keeping the counters
+        empty_pos = self.blank_pos
+        tile = self.tiles[position]
+        if tile == position + 1:
+            self.in_place -= 1
+        if tile == empty_pos + 1:
+            self.in_place += 1
+        self.tiles[empty_pos] = tile
+        self.tiles[position] = None
+        self.blank_pos = position
+        return empty_pos
+
+    def move(self, position):
+        # Slide the tile at position into the blank; returns the old blank
+        # position, or None if the move is not allowed
+        if not self.can_move(position):
+            return None
+        self.moves += 1
+        return self.slide(position)
+
+    def tile_for_direction(self, direction):
+        # Position of the tile that an arrow key would slide into the blank
+        empty_pos = self.blank_pos
+        size = self.size
+        if direction == 'Left' and empty_pos % size < size - 1:
+            return empty_pos + 1
+        if direction == 'Right' and empty_pos % size > 0:
+            return empty_pos - 1
+        if direction == 'Up' and empty_pos < len(self.tiles) - size:
+            return empty_pos + size
+        if direction == 'Down' and empty_pos >= size:
+            return empty_pos - size
+        return None
+
+    def is_solved(self):
+        return self.in_place == len(self.tiles) - 1
@@ -0,0 +1,173 @@
+"""Additive pattern databases for the 4x4 and 5x5 sliding puzzle.
+
+The tiles are split into disjoint groups (5-5-5 on 4x4, six groups of 4 on
+5x5). For each group a table stores the fewest moves *of that group's
+tiles* needed to bring them home from any placement, found by a backwards
+breadth-first search in which blank moves over other cells are free.
+Because no move is counted twice, the group values add up to an admissible
+heuristic that is far tighter than Manhattan distance.
+
+Tables are indexed base-N on the tile positions (N = cells on the board),
+one byte per entry, and written to one binary file per board size:
+
+    python -m engines.puzzle_pdb build [4] [5]
+
+The files are not checked in. load() maps them read-only with mmap the
+first time a solver asks for them and returns None when they are missing
+or damaged, in which case the solver falls back to Manhattan + linear
+conflict. A damaged file is reported once and left for a rebuild.
+"""
+import logging
+import mmap
+import os
+import sys
+import time
+
+MAGIC = b'PDB1'
+UNKNOWN = 255
+
+GROUPS = {
+    4: [(1, 2, 3, 4, 7), (5, 6, 9, 10, 13), (8, 11, 12, 14, 15)],
+    5: [(1, 2, 6, 7), (3, 4, 5, 8), (9, 10, 14, 15), (11, 12, 16, 17),
+        (13, 18, 19, 20), (21, 22, 23, 24)],
+}
+
+log = logging.getLogger(__name__)
+
+_loaded = {}
+
+
+def path_for(size):
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), f'puzzle_pdb_{size}.bin')
+
+
+def _neighbours(size):
+    cells = []
+    for position in range(size * size):
+        row, col = divmod(position, size)
+        cells.append([p for p, ok in ((position - size, row > 0), (position + size, row < size - 1),
+                                      (position - 1, col > 0), (position + 1, col < size - 1)) if ok])
+    return cells
+
+
+def build_group(size, tiles):
+    # Moves of the group's tiles needed from every placement, as a bytearray
+    # indexed by sum(position_i * cells**i)
+    cells = size * size
+    powers = [cells ** i for i in range(len(tiles))]
+    neighbours = _neighbours(size)
+    table = bytearray([UNKNOWN]) * cells ** len(tiles)
+    # (placement, blank) states already reached, one bit each
+    seen = bytearray(cells ** len(tiles) * cells // 8 + 1)
+
+    goal = sum((tile - 1) * power for tile, power in zip(tiles, powers))
+    frontier = [goal * cells + cells - 1]
+    depth = 0
+    while frontier:
+        stack = []
+        for state in frontier:
+            if not seen[state >> 3] & (1 << (state & 7)):
+                seen[state >> 3] |= 1 << (state & 7)
+                stack.append(state)
+        following = []
+        while stack:
+            state = stack.pop()
+            placement, blank = divmod(state, cells)
+            if table[placement] == UNKNOWN:
+                table[placement] = depth
+            positions = [placement // power % cells for power in powers]
+            for target in neighbours[blank]:
+                if target in positions:
+                    # Sliding a group tile into the blank costs one move
+                    i = positions.index(target)
+                    following.append((placement + (blank - target) * powers[i]) * cells + target)
+                else:
+                    # Moving the blank over any other tile is free
+                    moved = placement * cells + target
+                    if not seen[moved >> 3] & (1 << (moved & 7)):
+                        seen[moved >> 3] |= 1 << (moved & 7)
+                        stack.append(moved)
+        frontier = following
+        depth += 1
+    return table
+
+
+def build(size, out=None):
+    groups = GROUPS[size]
+    path = out or path_for(size)
+    with open(path + '.tmp', 'wb') as f:
+        f.write(MAGIC + bytes([size, len(groups)]))
+        for tiles in groups:
+            started = time.perf_counter()
+            f.write(build_group(size, tiles))
+            print(f"{size}x{size} group {tiles}: {time.perf_counter() - started:.1f}s")
+    os.replace(path + '.tmp', path)
+    return path
+
+
+class PatternDatabase:
+    # Read-only view of one board size's tables over an mmap
+    def __init__(self, size, data):
+        self.size = size
+        self.data = data
+        cells = size * size
+        self.groups = GROUPS[size]
+        self.offsets = []
+        offset = len(MAGIC) + 2
+        for tiles in self.groups:
+            self.offsets.append(offset)
+            offset += cells ** len(tiles)
+        if len(data) != offset or data[:len(MAGIC)] != MAGIC or data[len(MAGIC)] != size:
+            raise ValueError(f"{path_for(size)} does not match the {size}x{size} layout")
+        # For each tile: its group number and the weight of its position
+        self.group_of = [None] * cells
+        self.power_of = [0] * cells
+        for g, tiles in enumerate(self.groups):
+            for i, tile in enumerate(tiles):
+                self.group_of[tile] = g
+                self.power_of[tile] = cells ** i
+
+    def indices(self, board):
+        # Per-group table offsets for a board (0 marks the blank)
+        indices = list(self.offsets)
+        for position, tile in enumerate(board):
+            if tile:
+                indices[self.group_of[tile]] += position * self.power_of[tile]
+        return indices
+
+    def value(self, indices):
+        data = self.data
+        return sum(data[i] for i in indices)
+
+
+def load(size):
+    # PatternDatabase for size, or None when it has not been built or
+    # cannot be read. Either answer is remembered for the process.
+    if size not in _loaded:
+        database = None
+        if size in GROUPS and os.path.exists(path_for(size)):
+            try:
+                with open(path_for(size), 'rb') as f:
+                    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                database = PatternDatabase(size, data)
+            except (OSError, ValueError):
+                log.warning("Ignoring pattern database %s, rebuild it with "
+                            "'python -m engines.puzzle_pdb build %d'",
+                            path_for(size), size, exc_info=True)
+        _loaded[size] = database
+    return _loaded[size]
+
+
+def main(argv):
+    if not argv or argv[0] != 'build':
+        print("usage: python -m engines.puzzle_pdb build [4] [5]")
+        return 2
+    for size in [int(arg) for arg in argv[1:]] or sorted(GROUPS):
+        started = time.perf_counter()
+        path = build(size)
+        print(f"wrote {path} in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,248 @@
+"""IDA* solver for the sliding puzzle, used for hints and auto-solve.
+
+Boards are SlidingPuzzle.tiles lists (None is the blank). The heuristic is
+Manhattan distance plus linear conflicts: two tiles in their goal row (or
+column) but in the wrong order cost at least two extra moves. Both parts
+are updated incrementally: a slide changes the Manhattan distance of one
+tile and the conflicts of at most two lines.
+
+When engines.puzzle_pdb has been built for the board size, its additive
+pattern databases replace that heuristic; they are loaded on first use.
+
+3x3 boards are solved optimally. Larger boards start optimal and fall back
+to weighted search (f = g + w * h) with growing weights when the time
+budget runs short, trading solution length for a quick answer.
+"""
+import time
+
+from engines import puzzle_pdb
+
+# Weights tried in turn; each attempt gets half of the remaining budget
+WEIGHTS = {3: [1.0], 4: [1.0, 1.5, 2.5, 5.0], 5: [1.5, 2.5, 5.0, 10.0]}
+PDB_WEIGHTS = {4: [1.0, 1.2, 1.5, 2.5], 5: [1.2, 1.5, 2.5, 5.0]}
+DEFAULT_TIME_BUDGET = 5.0
+CHECK_EVERY = 4096
+FOUND = -1
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+def _neighbours(size):
+    cells = []
+    for position in range(size * size):
+        row, col = divmod(position, size)
+        adjacent = []
+        if row > 0:
+            adjacent.append(position - size)
+        if row < size - 1:
+            adjacent.append(position + size)
+        if col > 0:
+            adjacent.append(position - 1)
+        if col < size - 1:
+            adjacent.append(position + 1)
+        cells.append(adjacent)
+    return cells
+
+
+def _distances(size):
+    # distance[tile][position]: Manhattan distance from position to the goal
+    # cell of tile (tile 0 is the blank and never counts)
+    cells = size * size
+    distance = [[0] * cells]
+    for tile in range(1, cells):
+        goal_row, goal_col = divmod(tile - 1, size)
+        distance.append([abs(p // size - goal_row) + abs(p % size - goal_col)
+                         for p in range(cells)])
+    return distance
+
+
+def _conflicts(goals):
+    # Tiles out of order in their goal line: every tile that is not part of
+    # the longest increasing run has to leave the line and come back
+    if len(goals) < 2:
+        return 0
+    longest = [1] * len(goals)
+    for i in range(1, len(goals)):
+        for j in range(i):
+            if goals[j] < goals[i] and longest[j] + 1 > longest[i]:
+                longest[i] = longest[j] + 1
+    return 2 * (len(goals) - max(longest))
+
+
+class LinearConflicts:
+    # Memoised conflict cost of each row and column of a board
+    def __init__(self, size):
+        self.size = size
+        self.row_cache = [{} for _ in range(size)]
+        self.col_cache = [{} for _ in range(size)]
+
+    def row(self, board, row):
+        size = self.size
+        line = tuple(board[row * size:(row + 1) * size])
+        cache = self.row_cache[row]
+        cost = cache.get(line)
+        if cost is None:
+            goals = [(tile - 1) % size for tile in line if tile and (tile - 1) // size == row]
+            cost = cache[line] = _conflicts(goals)
+        return cost
+
+    def col(self, board, col):
+        size = self.size
+        line = tuple(board[col::size])
+        cache = self.col_cache[col]
+        cost = cache.get(line)
+        if cost is None:
+            goals = [(tile - 1) // size for tile in line if tile and (tile - 1) % size == col]
+            cost = cache[line] = _conflicts(goals)
+        return cost
+
+    def total(self, board):
+        return (sum(self.row(board, r) for r in range(self.size)) +
+                sum(self.col(board, c) for c in range(self.size)))
+
+
+def ida_star(tiles, size, weight=1.0, deadline=None):
+    # Returns the positions to slide into the blank, in order. Raises
+    # SearchTimeout once deadline (a time.monotonic() value) has passed.
+    board = [tile or 0 for tile in tiles]
+    neighbours = _neighbours(size)
+    distance = _distances(size)
+    lines = LinearConflicts(size)
+    manhattan = sum(distance[tile][p] for p, tile in enumerate(board))
+    conflicts = lines.total(board)
+    if manhattan == 0:
+        return []
+
+    path = []
+    nodes = [0]
+
+    def search(blank, previous, g, manhattan, conflicts, bound):
+        h = manhattan + conflicts
+        f = g + weight * h
+        if f > bound:
+            return f
+        if h == 0:
+            return FOUND
+        nodes[0] += 1
+        if deadline is not None and nodes[0] % CHECK_EVERY == 0 and time.monotonic() > deadline:
+            raise SearchTimeout()
+
+        lowest = float('inf')
+        for position in neighbours[blank]:
+            if position == previous:
+                continue
+            tile = board[position]
+            # Only the lines the tile leaves and enters can change conflicts
+            if position // size == blank // size:
+                line_cost, first, second = lines.col, position % size, blank % size
+            else:
+                line_cost, first, second = lines.row, position // size, blank // size
+            before = line_cost(board, first) + line_cost(board, second)
+            board[blank], board[position] = tile, 0
+            after = line_cost(board, first) + line_cost(board, second)
+            
+            path.append(position)
+            result = search(position, blank, g + 1,
+                            manhattan - distance[tile][position] + distance[tile][blank],
+                            conflicts - before + after, bound)
+            if result == FOUND:
+                return FOUND
+            path.pop()
+            board[blank], board[position] = 0, tile
+            if result < lowest:
+                lowest = result
+        return lowest
+
+    bound = weight * (manhattan + conflicts)
+    blank = board.index(0)
+    while True:
+        result = search(blank, None, 0, manhattan, conflicts, bound)
+        if result == FOUND:
+            return path
+        if result == float('inf'):
+            return None
+        bound = result
+
+
+def ida_star_pdb(tiles, size, database, weight=1.0, deadline=None):
+    # ida_star() driven by a puzzle_pdb.PatternDatabase. A slide changes the
+    # table index of the moved tile's group only.
+    board = [tile or 0 for tile in tiles]
+    neighbours = _neighbours(size)
+    data = database.data
+    group_of = database.group_of
+    power_of = database.power_of
+    indices = database.indices(board)
+    h = database.value(indices)
+    if h == 0:
+        return []
+
+    path = []
+    nodes = [0]
+
+    def search(blank, previous, g, h, bound):
+        f = g + weight * h
+        if f > bound:
+            return f
+        if h == 0:
+            return FOUND
+        nodes[0] += 1
+        if deadline is not None and nodes[0] % CHECK_EVERY == 0 and time.monotonic() > deadline:
+            raise SearchTimeout()
+
+        lowest = float('inf')
+        for position in neighbours[blank]:
+            if position == previous:
+                continue
+            tile = board[position]
+            group = group_of[tile]
+            old_index = indices[group]
+            new_index = old_index + (blank - position) * power_of[tile]
+            board[blank], board[position] = tile, 0
+            indices[group] = new_index
+            
+            path.append(position)
+            result = search(position, blank, g + 1, h - data[old_index] + data[new_index], bound)
+            if result == FOUND:
+                return FOUND
+            path.pop()
+            board[blank], board[position] = 0, tile
+            indices[group] = old_index
+            if result < lowest:
+                lowest = result
+        return lowest
+
+    bound = weight * h
+    blank = board.index(0)
+    while True:
+        result = search(blank, None, 0, h, bound)
+        if result == FOUND:
+            return path
+        if result == float('inf'):
+            return None
+        bound = result
+
+
+def solve(tiles, size, time_budget=DEFAULT_TIME_BUDGET):
+    # Moves that solve the board, or None if no attempt finished in time
+    deadline = time.monotonic() + time_budget
+    database = puzzle_pdb.load(size)
+    if database is not None:
+        weights = PDB_WEIGHTS[size]
+    else:
+        weights = WEIGHTS.get(size, WEIGHTS[5])
+    for i, weight in enumerate(weights):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        budget = remaining if i == len(weights) - 1 else remaining / 2
+        attempt_deadline = time.monotonic() + budget
+        try:
+            if database is not None:
+                return ida_star_pdb(tiles, size, database, weight, attempt_deadline)
+            return ida_star(tiles, size, weight, attempt_deadline)
+        except SearchTimeout:
+            continue
+    return None
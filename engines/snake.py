@@ -0,0 +1,135 @@
+"""Snake rules on a grid of cells, independent of how cells are drawn.
+
+The body is a deque (head on the left) mirrored by an occupancy set, and
+every cell that is neither snake nor food sits in a free-cell index (a list
+plus a cell -> slot map with swap-remove). Each tick and each food spawn is
+O(1) no matter how long the snake gets.
+"""
+import random
+from collections import deque, namedtuple
+
+DIRECTIONS = {
+    'Left': (-1, 0),
+    'Right': (1, 0),
+    'Up': (0, -1),
+    'Down': (0, 1),
+}
+OPPOSITES = {'Left': 'Right', 'Right': 'Left', 'Up': 'Down', 'Down': 'Up'}
+
+# Outcome of one tick: the new head cell, the tail cell that was vacated
+# (None when the snake grew), the food cell eaten and the food cell spawned
+SnakeStep = namedtuple('SnakeStep', 'alive head tail eaten spawned')
+
+
+# Full-board cell list and slot map per (width, height), copied by each new game
+_board_cache = {}
+
+
+class FreeCells:
+    # Set of cells with O(1) add, remove and uniform random choice
+    def __init__(self, width, height):
+        board = _board_cache.get((width, height))
+        if board is None:
+            cells = [(x, y) for y in range(height) for x in range(width)]
+            board = _board_cache[width, height] = (cells, {cell: i for i, cell in enumerate(cells)})
+        self.cells = board[0][:]
+        self.slots = board[1].copy()
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __contains__(self, cell):
+        return cell in self.slots
+
+    def add(self, cell):
+        self.slots[cell] = len(self.cells)
+        self.cells.append(cell)
+
+    def remove(self, cell):
+        # Move the last cell into the vacated slot
+        slot = self.slots.pop(cell)
+        last = self.cells.pop()
+        if last != cell:
+            self.cells[slot] = last
+            self.slots[last] = slot
+
+    def choice(self, rng):
+        return self.cells[rng.randrange(len(self.cells))]
+
+
+class SnakeGame:
+    def __init__(self, width=40, height=40, start_length=3, food_count=1, rng=None):
+        self.width = width
+        self.height = height
+        self.rng = rng or random.Random()
+        if not 1 <= start_length <= width // 2 or height <= 10:
+            raise ValueError(f"A snake of length {start_length} does not fit a {width}x{height} board")
+        # Heading right along row 10, with at least half the row ahead of it
+        head_x = max(10, start_length - 1)
+        self.body = deque((head_x - i, 10) for i in range(start_length))
+        self.occupied = set(self.body)
+        self.free = FreeCells(width, height)
+        for cell in self.body:
+            self.free.remove(cell)
+        self.direction = 'Right'
+        self.movement_queue = deque()
+        self.food = set()
+        self.score = 0
+        self.alive = True
+        for _ in range(food_count):
+            self.spawn_food()
+
+    def spawn_food(self):
+        # Returns the new food cell, or None when the board is full
+        if not self.free:
+            return None
+        cell = self.free.choice(self.rng)
+        self.free.remove(cell)
+        self.food.add(cell)
+        return cell
+
+    def queue_direction(self, new_dir):
+        if len(self.movement_queue) < 2:  # Limit queue size
+            if not self.movement_queue:
+                current_dir = self.direction
+            else:
+                current_dir = self.movement_queue[-1]
+                
+            if OPPOSITES[new_dir] != current_dir:
+                self.movement_queue.append(new_dir)
+
+    def step(self):
+        # At most one queued turn is taken per tick, so two quick key
+        # presses turn the snake on consecutive ticks
+        if not self.alive:
+            return SnakeStep(False, None, None, None, None)
+        if self.movement_queue:
+            self.direction = self.movement_queue.popleft()
+            
+        dx, dy = DIRECTIONS[self.direction]
+        head = self.body[0]
+        new_head = (head[0] + dx, head[1] + dy)
+        
+        # Check for collisions (the tail cell is about to move out of the way)
+        if (not (0 <= new_head[0] < self.width and 0 <= new_head[1] < self.height) or
+            (new_head in self.occupied and new_head != self.body[-1])):
+            self.alive = False
+            return SnakeStep(False, None, None, None, None)
+            
+        # Check if food is eaten
+        if new_head in self.food:
+            self.food.remove(new_head)
+            self.body.appendleft(new_head)
+            self.occupied.add(new_head)
+            self.score += 1
+            spawned = self.spawn_food()
+            return SnakeStep(True, new_head, None, new_head, spawned)
+            
+        tail = self.body.pop()
+        self.occupied.discard(tail)
+        if new_head != tail:
+            self.free.remove(new_head)
+            self.free.add(tail)
+        self.body.appendleft(new_head)
+        self.occupied.add(new_head)
+        return SnakeStep(True, new_head, tail, None, None)
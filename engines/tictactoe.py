@@ -0,0 +1,62 @@
+"""Tic Tac Toe rules on a 3x3 board stored as a flat list.
+
+Each player's marks are also kept as a 9-bit mask, and WINNING_LINE maps
+every mask to the line it completes (or None), so checking for a winner is
+one table lookup.
+"""
+
+WIN_COMBINATIONS = [
+    [0, 1, 2], [3, 4, 5], [6, 7, 8],  # Rows
+    [0, 3, 6], [1, 4, 7], [2, 5, 8],  # Columns
+    [0, 4, 8], [2, 4, 6]  # Diagonals
+]
+WIN_MASKS = [sum(1 << cell for cell in combo) for combo in WIN_COMBINATIONS]
+
+
+def _winning_lines():
+    lines = [None] * 512
+    for mask in range(512):
+        for combo, win in zip(WIN_COMBINATIONS, WIN_MASKS):
+            if mask & win == win:
+                lines[mask] = combo
+                break
+    return lines
+
+
+WINNING_LINE = _winning_lines()
+
+
+class TicTacToe:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.board = [''] * 9
+        self.masks = {'X': 0, 'O': 0}
+        self.current_player = 'X'
+        self.moves_made = 0
+        self.winner = None
+        self.winning_line = None
+        self.over = False
+
+    def play(self, position):
+        # Place the current player's mark; returns False for illegal moves
+        if self.over or self.board[position] != '':
+            return False
+        self.board[position] = self.current_player
+        self.masks[self.current_player] |= 1 << position
+        self.moves_made += 1
+        
+        line = self.check_winner()
+        if line:
+            self.winner = self.current_player
+            self.winning_line = line
+            self.over = True
+        elif self.moves_made == 9:
+            self.over = True
+        else:
+            self.current_player = 'O' if self.current_player == 'X' else 'X'
+        return True
+
+    def check_winner(self):
+        return WINNING_LINE[self.masks[self.current_player]]
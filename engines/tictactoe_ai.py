@@ -0,0 +1,190 @@
+"""Perfect-play Tic Tac Toe opponent.
+
+The whole game tree is searched once with negamax. Positions are keyed by
+a base-3 code of the board (empty 0, X 1, O 2) after reducing them by the
+8 symmetries of the square, which leaves 627 positions with a move to
+make. For each one the table stores the score of every move in the
+canonical orientation: positive wins (sooner is higher), 0 draws and
+negative losses.
+
+The table is written to a small binary file in the user's cache directory
+and read back on later runs. A file that fails its checksum or layout
+checks is rebuilt, and if the file cannot be written the table simply
+lives in memory. Choosing a reply is then one canonicalisation and one
+lookup.
+"""
+import hashlib
+import os
+import random
+import sys
+
+from engines.tictactoe import WINNING_LINE
+
+MAGIC = b'TTT2'
+ENTRIES = 627  # Positions with a move to make, up to symmetry
+ILLEGAL = 255  # Stored move score for an occupied cell
+DIFFICULTIES = ['easy', 'medium', 'hard']
+# Chance that the opponent plays a best move instead of a random one
+SKILL = {'easy': 0.2, 'medium': 0.7, 'hard': 1.0}
+
+POWERS = [3 ** i for i in range(9)]
+MARKS = {'': 0, 'X': 1, 'O': 2}
+
+
+def _rotate(perm):
+    return [perm[6 - 3 * (i % 3) + i // 3] for i in range(9)]
+
+
+def _symmetries():
+    # Canonical cell i is taken from board cell perm[i]
+    identity = list(range(9))
+    mirror = [3 * (i // 3) + 2 - i % 3 for i in range(9)]
+    perms = []
+    for start in (identity, mirror):
+        perm = start
+        for _ in range(4):
+            perms.append(perm)
+            perm = _rotate(perm)
+    return perms
+
+
+SYMMETRIES = _symmetries()
+
+_table = None
+
+
+def cache_dir():
+    # Per-user cache directory, since the install itself may be read-only
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'gameapp')
+
+
+def path_for():
+    return os.path.join(cache_dir(), 'tictactoe_minimax.bin')
+
+
+def canonical(cells):
+    # (code, perm) of the smallest code among the board's symmetric images
+    best = None
+    for perm in SYMMETRIES:
+        code = sum(cells[cell] * power for cell, power in zip(perm, POWERS))
+        if best is None or code < best[0]:
+            best = (code, perm)
+    return best
+
+
+def _mask(cells, mark):
+    return sum(1 << i for i, cell in enumerate(cells) if cell == mark)
+
+
+def solve():
+    # {canonical code: bytes of 9 move scores (offset by 128)}
+    table = {}
+
+    def search(cells, mark, filled):
+        code, perm = canonical(cells)
+        scores = table.get(code)
+        if scores is None:
+            board = [cells[cell] for cell in perm]
+            values = [ILLEGAL] * 9
+            for position in range(9):
+                if board[position]:
+                    continue
+                board[position] = mark
+                if WINNING_LINE[_mask(board, mark)] is not None:
+                    value = 10 - filled
+                elif filled == 8:
+                    value = 0
+                else:
+                    value = -search(board, 3 - mark, filled + 1)
+                board[position] = 0
+                values[position] = value + 128
+            scores = table[code] = bytes(values)
+        return max(value for value in scores if value != ILLEGAL) - 128
+
+    search([0] * 9, 1, 0)
+    return table
+
+
+def _valid_entry(code, scores):
+    # The code must be a canonical board and its scores must mark exactly
+    # the occupied cells as illegal, with every other score a win, draw or
+    # loss in range
+    cells = [code // power % 3 for power in POWERS]
+    if code >= 3 ** 9 or canonical(cells)[0] != code:
+        return False
+    for cell, value in zip(cells, scores):
+        if (value == ILLEGAL) != bool(cell):
+            return False
+        if value != ILLEGAL and not -10 <= value - 128 <= 10:
+            return False
+    return True
+
+
+def _read(path):
+    # File layout: MAGIC, ENTRIES records of (2-byte code, 9 move scores),
+    # then the SHA-256 of the records
+    with open(path, 'rb') as f:
+        data = f.read()
+    body = data[len(MAGIC):-32]
+    if (data[:len(MAGIC)] != MAGIC or len(body) != ENTRIES * 11 or
+            hashlib.sha256(body).digest() != data[-32:]):
+        raise ValueError(f"{path} is not a Tic Tac Toe table")
+    table = {}
+    for offset in range(0, len(body), 11):
+        code = int.from_bytes(body[offset:offset + 2], 'little')
+        scores = body[offset + 2:offset + 11]
+        if code in table or not _valid_entry(code, scores):
+            raise ValueError(f"{path} has a damaged entry at byte {len(MAGIC) + offset}")
+        table[code] = scores
+    return table
+
+
+def _write(path, table):
+    body = b''.join(code.to_bytes(2, 'little') + scores
+                    for code, scores in sorted(table.items()))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'wb') as f:
+        f.write(MAGIC + body + hashlib.sha256(body).digest())
+    os.replace(path + '.tmp', path)
+
+
+def load():
+    global _table
+    if _table is None:
+        path = path_for()
+        try:
+            _table = _read(path)
+        except (OSError, ValueError):
+            # Missing or damaged, either way the search is cheap to redo
+            _table = solve()
+            try:
+                _write(path, _table)
+            except OSError:
+                pass
+    return _table
+
+
+def move_scores(board):
+    # {position: score} for every empty cell of a TicTacToe.board list
+    # (empty once the game is over)
+    cells = [MARKS[cell] for cell in board]
+    code, perm = canonical(cells)
+    scores = load().get(code, b'')
+    return {perm[i]: value - 128 for i, value in enumerate(scores) if value != ILLEGAL}
+
+
+def choose_move(board, difficulty='hard', rng=random):
+    # Position for the player to move, or None once the game is over
+    scores = move_scores(board)
+    if not scores:
+        return None
+    if rng.random() >= SKILL[difficulty]:
+        return rng.choice(sorted(scores))
+    best = max(scores.values())
+    return rng.choice(sorted(p for p, value in scores.items() if value == best))
@@ -1,22 +1,1229 @@
+import time
+STARTUP_T0 = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk, messagebox
-import json
-import hashlib
+import csv
+import importlib
+import logging
+import math
 import os
+import queue
 import random
-import time
+import re
+import sys
+import threading
+from collections import OrderedDict, deque
 from datetime import datetime
 import sqlite3
-from PIL import Image, ImageTk
 
-class GameApp:
+from engines import Game2048, HangmanGame, SlidingPuzzle, SnakeGame, TicTacToe
+from engines import ai_2048, game_2048, puzzle_solver, tictactoe_ai
+
+CELL_SIZE = 10  # Snake cell size in pixels
+
+# 2048 hint/autoplay search settings
+AI_2048_DEPTH = 4
+AI_2048_TIME_BUDGET = 0.25  # seconds per move
+AI_POLL_MS = 30
+ARROWS = {'left': '⬅️', 'right': '➡️', 'up': '⬆️', 'down': '⬇️'}
+
+# Sliding puzzle hint/solve settings
+PUZZLE_HINT_BUDGET = 0.1  # seconds for the first hint search
+PUZZLE_SOLVE_BUDGET = 5.0  # seconds per search
+PUZZLE_PLAYBACK_INTERVAL = 0.3  # seconds between solver moves
+
+WORD_IMPORT_POLL_MS = 100
+WORD_BANK_POLL_MS = 50
+
+# Password hashing cost. Raising these only affects new hashes; older ones
+# are upgraded the next time their owner logs in.
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+PBKDF2_ITERATIONS = 600000  # used when hashlib has no scrypt
+PASSWORD_SALT_BYTES = 16
+PASSWORD_HASH_BYTES = 32
+# Salt for the stand-in check made when a username does not exist
+DUMMY_SALT = bytes(PASSWORD_SALT_BYTES)
+CREDENTIAL_WORKERS = 2
+CREDENTIAL_POLL_MS = 30
+CREDENTIAL_CACHE_TTL = 15 * 60  # seconds a verified login skips the KDF
+CREDENTIAL_CACHE_SIZE = 32
+LOGIN_MAX_FAILURES = 3
+LOGIN_LOCKOUT_SECONDS = 300
+# Failed logins across all usernames on this kiosk: a burst of this many,
+# then one attempt every KIOSK_FAILURE_REFILL seconds for everyone
+KIOSK_FAILURE_BURST = 10
+KIOSK_FAILURE_REFILL = 5
+LOGIN_LIMITER_MAX_TRACKED = 1024
+USERNAME_CHECK_DELAY_MS = 250  # quiet time before checking a typed username
+USERNAME_MIN_LENGTH = 3
+
+
+class LazyModule:
+    # Placeholder that imports the real module on first attribute access
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+def lazy_import(name):
+    return LazyModule(name)
+
+
+# Not needed to draw the login screen, so they are only imported when first used
+hashlib = lazy_import('hashlib')
+hmac = lazy_import('hmac')
+futures = lazy_import('concurrent.futures')
+filedialog = lazy_import('tkinter.filedialog')
+multiprocessing = lazy_import('multiprocessing')
+
+DB_PATH = 'gameapp.db'
+SCORE_FLUSH_TIMEOUT = 2.0  # seconds the Tk thread waits for queued scores
+SCORE_POLL_MS = 100  # how often views waiting on queued scores check again
+
+log = logging.getLogger(__name__)
+
+# Each entry upgrades the schema by one version (tracked in PRAGMA user_version)
+SCHEMA_MIGRATIONS = [
+    # 1: indexes for the per-user dashboard/stats queries and the global
+    # login screen queries on scores
+    [
+        'CREATE INDEX IF NOT EXISTS idx_scores_user_date ON scores (username, date)',
+        'CREATE INDEX IF NOT EXISTS idx_scores_user_game_score ON scores (username, game, score)',
+        'CREATE INDEX IF NOT EXISTS idx_scores_game ON scores (game)',
+        'CREATE INDEX IF NOT EXISTS idx_scores_score ON scores (score)',
+    ],
+    # 2: keep game_stats up to date on every score insert so views read
+    # one row per game instead of aggregating the whole score history
+    [
+        'ALTER TABLE scores ADD COLUMN duration INTEGER DEFAULT 0',
+        'ALTER TABLE game_stats ADD COLUMN low_score INTEGER',
+        '''
+        INSERT OR REPLACE INTO game_stats
+            (username, game, total_time, games_played, high_score, low_score)
+        SELECT username, game, COALESCE(SUM(duration), 0), COUNT(*), MAX(score), MIN(score)
+        FROM scores GROUP BY username, game
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_scores_game_stats AFTER INSERT ON scores
+        BEGIN
+            INSERT INTO game_stats
+                (username, game, total_time, games_played, high_score, low_score)
+            VALUES (NEW.username, NEW.game, COALESCE(NEW.duration, 0), 1, NEW.score, NEW.score)
+            ON CONFLICT (username, game) DO UPDATE SET
+                total_time = total_time + excluded.total_time,
+                games_played = games_played + 1,
+                high_score = MAX(high_score, excluded.high_score),
+                low_score = MIN(COALESCE(low_score, excluded.low_score), excluded.low_score);
+        END
+        ''',
+    ],
+    # 3: per-game totals for the community stats reconciliation
+    [
+        'CREATE INDEX IF NOT EXISTS idx_game_stats_game ON game_stats (game, games_played)',
+    ],
+    # 4: word bank shared by the typing, scramble and hangman games
+    [
+        '''
+        CREATE TABLE IF NOT EXISTS words (
+            word TEXT PRIMARY KEY,
+            hint TEXT,
+            difficulty TEXT NOT NULL,
+            length INTEGER NOT NULL,
+            letter_score INTEGER NOT NULL
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_words_difficulty_length ON words (difficulty, length)',
+    ],
+    # 5: last_attempt as integer epoch seconds, compared directly in SQL
+    # instead of parsing a datetime string on every login
+    [
+        '''
+        UPDATE users SET last_attempt = CAST(strftime('%s', last_attempt, 'utc') AS INTEGER)
+        WHERE typeof(last_attempt) = 'text'
+        ''',
+    ],
+    # 6: per-game reads moved to game_stats, so these only slowed down
+    # score inserts. Recent games and deletes use idx_scores_user_date, the
+    # best score uses idx_scores_score.
+    [
+        'DROP INDEX IF EXISTS idx_scores_user_game_score',
+        'DROP INDEX IF EXISTS idx_scores_game',
+    ],
+]
+SCHEMA_VERSION = len(SCHEMA_MIGRATIONS)
+
+# Read queries the app runs against hot tables. audit_query_plans() checks
+# every one of them so an index regression fails at startup instead of
+# silently turning into a full table scan.
+APP_QUERIES = {
+    'user_games_played': 'SELECT SUM(games_played) FROM game_stats WHERE username=?',
+    'user_best_score': 'SELECT high_score FROM game_stats WHERE username=? AND game=?',
+    'user_lowest_score': 'SELECT low_score FROM game_stats WHERE username=? AND game=?',
+    'user_recent_games': '''
+        SELECT game, score, date FROM scores
+        WHERE username=? ORDER BY date DESC LIMIT 3
+    ''',
+    'user_game_summary': '''
+        SELECT game, games_played, high_score, low_score, total_time
+        FROM game_stats WHERE username=?
+    ''',
+    'user_login': '''
+        SELECT password, theme, failed_attempts, last_attempt
+        FROM users WHERE username=?
+    ''',
+    'total_users': 'SELECT COUNT(*) FROM users',
+    'game_play_counts': '''
+        SELECT game, SUM(games_played)
+        FROM game_stats
+        GROUP BY game
+    ''',
+    'best_score': '''
+        SELECT username, game, score
+        FROM scores
+        ORDER BY score DESC
+        LIMIT 1
+    ''',
+}
+
+# Games where a smaller score is the better result (moves or milliseconds)
+LOWER_IS_BETTER = {'memory', 'puzzle', 'reaction'}
+
+# Matches a plan step that reads a whole table without any index (SQLite
+# before 3.36 prints "SCAN TABLE name")
+FULL_SCAN_RE = re.compile(r'^SCAN (?:TABLE )?(\w+)$')
+
+
+class PasswordHasher:
+    # Salted, deliberately slow password hashes, stored as
+    # 'scrypt$n$r$p$salt$hash' or 'pbkdf2_sha256$iterations$salt$hash'
+    # (salt and hash in hex) so the cost can change without breaking old
+    # rows. Rows from before hashing hold the plain password; verify()
+    # still accepts them and asks for a rehash. hash() and verify() take
+    # tens of milliseconds on purpose, so they only run on worker threads.
+    def __init__(self, scheme='scrypt', scrypt_n=SCRYPT_N, scrypt_r=SCRYPT_R,
+                 scrypt_p=SCRYPT_P, pbkdf2_iterations=PBKDF2_ITERATIONS):
+        self.scheme = scheme
+        self.scrypt_params = (scrypt_n, scrypt_r, scrypt_p)
+        self.pbkdf2_params = (pbkdf2_iterations,)
+
+    def current(self):
+        # (scheme, params) for new hashes. scrypt needs OpenSSL 1.1+.
+        if self.scheme == 'scrypt' and hasattr(hashlib, 'scrypt'):
+            return 'scrypt', self.scrypt_params
+        return 'pbkdf2_sha256', self.pbkdf2_params
+
+    def derive(self, scheme, params, password, salt):
+        data = password.encode('utf-8')
+        if scheme == 'scrypt':
+            n, r, p = params
+            return hashlib.scrypt(data, salt=salt, n=n, r=r, p=p,
+                                  maxmem=256 * r * (n + p + 2), dklen=PASSWORD_HASH_BYTES)
+        return hashlib.pbkdf2_hmac('sha256', data, salt, params[0], PASSWORD_HASH_BYTES)
+
+    def hash(self, password):
+        scheme, params = self.current()
+        salt = os.urandom(PASSWORD_SALT_BYTES)
+        digest = self.derive(scheme, params, password, salt)
+        return '$'.join([scheme, *map(str, params), salt.hex(), digest.hex()])
+
+    def parse(self, stored):
+        # (scheme, params, salt, digest), or None for a plain text row
+        parts = (stored or '').split('$')
+        try:
+            if parts[0] == 'scrypt' and len(parts) == 6:
+                params = tuple(int(value) for value in parts[1:4])
+            elif parts[0] == 'pbkdf2_sha256' and len(parts) == 4:
+                params = (int(parts[1]),)
+            else:
+                return None
+            return parts[0], params, bytes.fromhex(parts[-2]), bytes.fromhex(parts[-1])
+        except ValueError:
+            return None
+
+    def verify(self, password, stored):
+        # (matches, needs_rehash). stored is None for a missing user or a
+        # row without a password: that never matches, but still costs one
+        # hash so the answer takes as long as for a real account.
+        if not stored:
+            scheme, params = self.current()
+            self.derive(scheme, params, password, DUMMY_SALT)
+            return False, False
+        parsed = self.parse(stored)
+        if parsed is None:
+            matches = hmac.compare_digest(password.encode('utf-8'), stored.encode('utf-8'))
+            return matches, matches
+        scheme, params, salt, digest = parsed
+        matches = hmac.compare_digest(self.derive(scheme, params, password, salt), digest)
+        return matches, matches and (scheme, params) != self.current()
+
+    def describe(self, stored):
+        if not stored:
+            return "No password set"
+        parsed = self.parse(stored)
+        if parsed is None:
+            return "Plain text (secured at next login)"
+        scheme, params = parsed[:2]
+        if scheme == 'scrypt':
+            return "Salted scrypt hash (N={}, r={}, p={})".format(*params)
+        return f"Salted PBKDF2-SHA256 hash ({params[0]} rounds)"
+
+
+class CredentialCache:
+    # Recently verified logins, so the same accounts logging in again and
+    # again on a shared kiosk skip the KDF. Entries hold an HMAC of the
+    # password under a key that only lives in this process, plus the stored
+    # hash it was checked against, so a password changed elsewhere misses.
+    # Least recently used entries are evicted first.
+    def __init__(self, ttl=CREDENTIAL_CACHE_TTL, size=CREDENTIAL_CACHE_SIZE, clock=time.monotonic):
+        self.ttl = ttl
+        self.size = size
+        self.clock = clock
+        self.key = os.urandom(32)
+        self.entries = OrderedDict()  # username -> (digest, stored hash, expires)
+
+    def digest(self, password):
+        return hmac.new(self.key, password.encode('utf-8'), 'sha256').digest()
+
+    def check(self, username, password, stored):
+        entry = self.entries.get(username)
+        if entry is None:
+            return False
+        digest, cached_hash, expires = entry
+        if expires <= self.clock() or cached_hash != stored:
+            del self.entries[username]
+            return False
+        if not hmac.compare_digest(digest, self.digest(password)):
+            return False
+        self.entries.move_to_end(username)
+        return True
+
+    def add(self, username, password, stored):
+        self.entries[username] = (self.digest(password), stored, self.clock() + self.ttl)
+        self.entries.move_to_end(username)
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, username):
+        self.entries.pop(username, None)
+
+    def clear(self):
+        self.entries.clear()
+
+
+class LoginRateLimiter:
+    # Failed-login throttling kept in memory, so bursts are turned away
+    # before SQLite is touched. Each username has a sliding window of its
+    # recent failures and is locked once the window holds max_failures. The
+    # kiosk as a whole has a token bucket that every failure drains, which
+    # catches guessing spread over many usernames: while it is empty every
+    # attempt waits for the next token, so spraying names is slowed to one
+    # attempt per kiosk_refill seconds rather than locking anyone out.
+    #
+    # Only a username becoming locked is written to the database, so the
+    # lockout reaches other kiosks and survives a restart. Failures short of
+    # a lock and the kiosk bucket are per process: attempts spread across
+    # kiosks, or across a restart, are counted separately by each.
+    def __init__(self, max_failures=LOGIN_MAX_FAILURES, window=LOGIN_LOCKOUT_SECONDS,
+                 kiosk_burst=KIOSK_FAILURE_BURST, kiosk_refill=KIOSK_FAILURE_REFILL,
+                 max_tracked=LOGIN_LIMITER_MAX_TRACKED, clock=time.time):
+        self.max_failures = max_failures
+        self.window = window
+        self.kiosk_burst = kiosk_burst
+        self.kiosk_refill = kiosk_refill
+        self.max_tracked = max_tracked
+        self.clock = clock
+        self.failures = {}  # username -> deque of failure times
+        self.locked_until = {}  # username -> time the lockout ends
+        self.tokens = kiosk_burst
+        self.refilled = clock()
+
+    def _refill(self, now):
+        self.tokens = min(self.kiosk_burst, self.tokens + (now - self.refilled) / self.kiosk_refill)
+        self.refilled = now
+
+    def _recent(self, username, now):
+        times = self.failures.get(username)
+        while times and times[0] <= now - self.window:
+            times.popleft()
+        return times
+
+    def _prune(self, now):
+        # Unknown usernames from a guessing run must not pile up
+        for username in list(self.failures):
+            if not self._recent(username, now):
+                del self.failures[username]
+        for username, until in list(self.locked_until.items()):
+            if until <= now:
+                del self.locked_until[username]
+
+    def retry_after(self, username):
+        # Whole seconds until username may try again, 0 when it may now
+        now = self.clock()
+        self._refill(now)
+        wait = self.locked_until.get(username, now) - now
+        if self.tokens < 1:
+            wait = max(wait, (1 - self.tokens) * self.kiosk_refill)
+        return max(0, int(-(-wait // 1)))
+
+    def lock(self, username, until):
+        # Lockout read back from the database (e.g. after a restart)
+        if until > self.clock():
+            self.locked_until[username] = until
+
+    def failure(self, username):
+        # Returns True when this failure locks the username
+        now = self.clock()
+        self._refill(now)
+        self.tokens = max(0, self.tokens - 1)
+        times = self._recent(username, now)
+        if times is None:
+            if len(self.failures) >= self.max_tracked:
+                self._prune(now)
+            times = self.failures[username] = deque()
+        times.append(now)
+        if len(times) < self.max_failures:
+            return False
+        del self.failures[username]
+        self.locked_until[username] = now + self.window
+        return True
+
+    def success(self, username):
+        self.failures.pop(username, None)
+        self.locked_until.pop(username, None)
+
+
+def is_busy_error(error):
+    # SQLITE_BUSY or SQLITE_LOCKED (including extended codes), which go away
+    # when the other connection finishes. Disk-full, I/O and schema errors
+    # are OperationalError too but retrying will not help them.
+    code = getattr(error, 'sqlite_errorcode', None)
+    if code is None:
+        message = str(error)
+        return 'locked' in message or 'busy' in message
+    return code & 0xff in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+
+
+class ScoreRecorder:
+    # Writes score rows from a background thread with its own connection so
+    # a slow commit on the shared disk never blocks the Tk main loop.
+    # Rows that arrive within one flush window are committed together. A
+    # batch that hits a busy or locked database stays queued and is retried
+    # every retry_interval; flush() only returns True once it is committed.
+    # Any other database error drops the rows it affects, with a log entry.
+    # The Tk thread never waits on the writer: unsaved() says how many
+    # recorded rows have not been committed or dropped yet.
+    def __init__(self, db_path, flush_interval=0.5, batch_size=500,
+                 retry_interval=1.0, busy_timeout=2.0):
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.retry_interval = retry_interval
+        self.busy_timeout = busy_timeout
+        self.queue = queue.Queue()
+        self.stopped = False
+        self.recorded = 0  # counted by the caller of record()
+        self.settled = 0  # rows committed or dropped, counted by the writer
+        self.thread = threading.Thread(target=self._writer_loop,
+                                       name='score-writer', daemon=True)
+        self.thread.start()
+
+    def record(self, username, game, score, duration=0, date=None):
+        if self.stopped:
+            raise RuntimeError("Score recorder has been shut down")
+        self.recorded += 1
+        self.queue.put(('score', (username, game, score, duration, date or datetime.now())))
+
+    def unsaved(self):
+        return self.recorded - self.settled
+
+    def flush(self, timeout=None):
+        # Block until every row queued so far has been committed. False if
+        # that did not happen within timeout.
+        if self.stopped:
+            return not self.thread.is_alive()
+        done = threading.Event()
+        self.queue.put(('flush', done))
+        return done.wait(timeout)
+
+    def shutdown(self, timeout=10):
+        if self.stopped:
+            return
+        self.stopped = True
+        self.queue.put(('stop', None))
+        self.thread.join(timeout)
+
+    def _writer_loop(self):
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout)
+        pending = []
+        waiters = []
+        running = True
+        try:
+            while running:
+                try:
+                    # While a batch is waiting to be retried, wake up for it
+                    item = self.queue.get(timeout=self.retry_interval if pending else None)
+                except queue.Empty:
+                    item = None
+                deadline = time.monotonic() + self.flush_interval
+                # Gather rows until the window closes, a flush/stop arrives
+                # or the batch is full
+                while item is not None:
+                    kind, payload = item
+                    if kind == 'score':
+                        pending.append(payload)
+                    elif kind == 'flush':
+                        waiters.append(payload)
+                        break
+                    else:
+                        running = False
+                        break
+                    if len(pending) >= self.batch_size:
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self.queue.get(timeout=remaining)
+                    except queue.Empty:
+                        item = None
+                if pending:
+                    pending = self._settle(conn, pending)
+                if not pending:
+                    for waiter in waiters:
+                        waiter.set()
+                    waiters = []
+                    
+            # Stopping: give a failing batch a few more tries before the
+            # process exits
+            attempts = 3
+            while pending and attempts:
+                time.sleep(self.retry_interval)
+                pending = self._settle(conn, pending)
+                attempts -= 1
+            if pending:
+                log.error("Dropped %d score rows that could not be written: %r",
+                          len(pending), pending)
+                self.settled += len(pending)
+        finally:
+            conn.close()
+
+    def _insert(self, conn, rows):
+        with conn:
+            conn.executemany('''
+                INSERT INTO scores (username, game, score, duration, date)
+                VALUES (?, ?, ?, ?, ?)
+            ''', rows)
+
+    def _settle(self, conn, rows):
+        left = self._write(conn, rows)
+        self.settled += len(rows) - len(left)
+        return left
+
+    def _write(self, conn, rows):
+        # Returns the rows that still need writing
+        try:
+            self._insert(conn, rows)
+            return []
+        except sqlite3.Error as e:
+            if is_busy_error(e):
+                # Keep the rows for a retry
+                log.warning("Score write failed, retrying %d rows", len(rows), exc_info=True)
+                return rows
+            log.warning("Score batch rejected, writing rows one by one", exc_info=True)
+        # Something in the batch will never be accepted; write the rows one
+        # at a time so only the bad ones are lost
+        for i, row in enumerate(rows):
+            try:
+                self._insert(conn, [row])
+            except sqlite3.Error as e:
+                if is_busy_error(e):
+                    return rows[i:]
+                log.exception("Dropped score row %r", row)
+        return []
+
+
+class CommunityStats:
+    # In-memory copy of the login screen's community numbers. Counters are
+    # bumped from account/score events and the whole thing is reconciled
+    # against SQLite only once the TTL has expired, so rendering the banner
+    # never runs the global queries.
+    def __init__(self, conn, ttl=600):
+        self.conn = conn
+        self.ttl = ttl
+        self.loaded_at = None
+        self.total_users = 0
+        self.total_games = 0
+        self.game_counts = {}
+        self.most_played = None
+        self.best = None
+
+    def is_stale(self):
+        return self.loaded_at is None or time.monotonic() - self.loaded_at >= self.ttl
+
+    def invalidate(self):
+        self.loaded_at = None
+
+    def reconcile(self):
+        cursor = self.conn.cursor()
+        cursor.execute(APP_QUERIES['total_users'])
+        self.total_users = cursor.fetchone()[0]
+        
+        cursor.execute(APP_QUERIES['game_play_counts'])
+        self.game_counts = {game: count for game, count in cursor.fetchall()}
+        self.total_games = sum(self.game_counts.values())
+        self.most_played = max(self.game_counts, key=self.game_counts.get, default=None)
+        
+        cursor.execute(APP_QUERIES['best_score'])
+        row = cursor.fetchone()
+        self.best = (row[2], row[0], row[1]) if row else None
+        self.loaded_at = time.monotonic()
+
+    def add_user(self, **event):
+        self.total_users += 1
+
+    def remove_user(self, **event):
+        # Their scores are gone as well, so the rest needs a reload
+        self.total_users -= 1
+        self.invalidate()
+
+    def add_score(self, username, game, score, **event):
+        self.total_games += 1
+        count = self.game_counts.get(game, 0) + 1
+        self.game_counts[game] = count
+        if self.most_played is None or count > self.game_counts[self.most_played]:
+            self.most_played = game
+        
+        entry = (score, username, game)
+        if self.best is None or entry > self.best:
+            self.best = entry
+
+    def summary_text(self):
+        most_played = self.most_played.title() if self.most_played else "None"
+        
+        # Format stats text with emojis
+        stats_text = f"👥 Total Users: {self.total_users}\n"
+        stats_text += f"🎮 Games Played: {self.total_games}\n"
+        stats_text += f"🏆 Most Popular: {most_played}\n"
+        
+        if self.best:
+            score, username, game = self.best
+            stats_text += f"⭐ Best Score: {username} ({game}: {score})"
+        return stats_text
+
+
+class UsernameIndex:
+    # Bloom filter over existing usernames and their prefixes, so the signup
+    # screen can answer "probably available" from memory. A hit may be a
+    # false positive (about 1%) and is confirmed in SQLite. A miss is only
+    # certain for names this process has seen: the filter is built at
+    # startup, so a name registered on another kiosk since then is missed
+    # until the next reload (signup reloads when its INSERT collides). A
+    # prefix miss means no username starts with the typed text, so any
+    # longer text is available too. Bits cannot be removed, so deleted names
+    # stay as false positives until enough of them pile up to rebuild.
+    def __init__(self, conn, error_rate=0.01):
+        self.conn = conn
+        self.error_rate = error_rate
+        self.reload()
+
+    def reload(self):
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT username FROM users')
+        usernames = [row[0] for row in cursor.fetchall()]
+        keys = sum(len(username) for username in usernames)
+        self._allocate(max(1024, 2 * keys))
+        for username in usernames:
+            self._insert(username)
+        self.names = len(usernames)
+        self.stale = 0  # deleted usernames still in the filter
+        self.clear_prefix = None
+
+    def _allocate(self, capacity):
+        # m = -n ln(p) / ln(2)^2 bits and k = m/n ln(2) probes per key
+        self.capacity = capacity
+        self.size = int(-capacity * math.log(self.error_rate) / math.log(2) ** 2)
+        self.probes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray(self.size // 8 + 1)
+        self.keys = 0
+
+    def _positions(self, key):
+        # Double hashing. hash() is salted per process, which is fine for a
+        # filter that only lives in memory.
+        first = hash(key)
+        second = hash((key, 'bloom')) | 1
+        return [(first + i * second) % self.size for i in range(self.probes)]
+
+    def _add_key(self, key):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.keys += 1
+
+    def _contains(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7))
+                   for position in self._positions(key))
+
+    def _insert(self, username):
+        self._add_key('=' + username)
+        for end in range(USERNAME_MIN_LENGTH, len(username)):
+            self._add_key('<' + username[:end])
+
+    def might_exist(self, username):
+        return self._contains('=' + username)
+
+    def might_extend(self, prefix):
+        # False when no username is longer than prefix and starts with it
+        return self._contains('<' + prefix)
+
+    def probably_free(self, username):
+        # True when username is not in the filter; False means ask SQLite
+        clear = self.clear_prefix
+        if clear is not None and username.startswith(clear) and username != clear:
+            return True
+        if not self.might_extend(username):
+            # Remembered so the next keystrokes skip the filter entirely
+            self.clear_prefix = username
+        return not self.might_exist(username)
+
+    def add(self, username, **event):
+        self.clear_prefix = None
+        if self.keys + len(username) > self.capacity:
+            self.reload()
+        else:
+            self._insert(username)
+            self.names += 1
+
+    def remove(self, username, **event):
+        self.stale += 1
+        if self.stale * 10 > self.names:
+            self.reload()
+
+
+# Words the bank starts with (word: hint)
+DEFAULT_WORDS = {
+    "python": "A popular programming language named after a snake",
+    "programming": "Writing instructions for computers",
+    "computer": "An electronic device that processes data",
+    "algorithm": "A step-by-step procedure to solve a problem",
+    "database": "A structured collection of data",
+    "interface": "A point where two systems meet and interact",
+    "software": "Programs and other operating information",
+    "developer": "Someone who creates computer programs",
+    "keyboard": "Device used to input text",
+    "function": "A reusable block of code",
+    "variable": "A container for storing data values",
+    "network": "Interconnected computers sharing resources",
+    "security": "Protection against cyber threats",
+    "application": "A program designed for end users",
+    "framework": "A platform for developing software applications"
+}
+WORD_DIFFICULTIES = ['easy', 'medium', 'hard']
+WORD_RE = re.compile(r'^[a-z]{2,20}$')
+# Extra difficulty points for uncommon letters (by English letter frequency)
+LETTER_RARITY = {letter: 1 for letter in 'bcfgkmpvwy'}
+LETTER_RARITY.update({letter: 3 for letter in 'jqxz'})
+
+
+def normalize_word(text):
+    # Lower-case word of 2-20 letters, or None if text is not one
+    word = text.strip().lower()
+    return word if WORD_RE.match(word) else None
+
+
+def word_row(word, hint=None):
+    # (word, hint, difficulty, length, letter_score) for the words table
+    letter_score = sum(LETTER_RARITY.get(letter, 0) for letter in word)
+    points = len(word) + letter_score
+    if points <= 8:
+        difficulty = 'easy'
+    elif points <= 12:
+        difficulty = 'medium'
+    else:
+        difficulty = 'hard'
+    return (word, hint, difficulty, len(word), letter_score)
+
+
+def signature(word):
+    # Letters in sorted order; two words are anagrams if these match
+    return ''.join(sorted(word))
+
+
+class RandomSet:
+    # Set with O(1) add, remove and uniform random choice (a list plus a
+    # position map; removal moves the last item into the hole)
+    def __init__(self):
+        self.items = []
+        self.positions = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def add(self, item):
+        if item not in self.positions:
+            self.positions[item] = len(self.items)
+            self.items.append(item)
+
+    def remove(self, item):
+        position = self.positions.pop(item)
+        last = self.items.pop()
+        if last != item:
+            self.items[position] = last
+            self.positions[last] = position
+
+    def choice(self, rng=random):
+        return rng.choice(self.items) if self.items else None
+
+
+def insert_words(conn, rows):
+    # One transaction per call; words already in the table are skipped
+    with conn:
+        conn.executemany('''
+            INSERT OR IGNORE INTO words (word, hint, difficulty, length, letter_score)
+            VALUES (?, ?, ?, ?, ?)
+        ''', rows)
+
+
+WORD_BANK_QUERY = 'SELECT word, hint, difficulty, length FROM words'
+
+
+def read_word_bank(db_path):
+    # WordBank read and indexed through a connection of its own, for a
+    # background thread. Not attached to any connection yet.
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(WORD_BANK_QUERY).fetchall()
+    finally:
+        conn.close()
+    return WordBank(None, rows)
+
+
+class WordBank:
+    # Words for the typing, scramble and hangman games. SQLite holds the
+    # bank; memory holds a set for duplicate checks, the hints and one list
+    # per (difficulty, length) filter, so sampling is a single random.choice.
+    #
+    # Words are also grouped by anagram signature. Word Scramble accepts any
+    # word of the same class, and a word whose class has other members is
+    # one level easier to unscramble (there is more than one answer).
+    # Words made of a single repeated letter cannot be scrambled and are
+    # left out of the scramble levels.
+    #
+    # rows, when given, are (word, hint, difficulty, length) already read
+    # from the words table, so the bank can be built on a background thread
+    # with conn=None and attach()ed to the Tk thread's connection later.
+    def __init__(self, conn, rows=None):
+        self.conn = None
+        self.words = set()
+        self.hints = {}
+        self.index = {}
+        self.difficulty = {}
+        self.anagrams = {}
+        self.scramble_levels = {level: RandomSet() for level in [None] + WORD_DIFFICULTIES}
+        if rows is None:
+            rows = conn.execute(WORD_BANK_QUERY)
+        for row in rows:
+            self.remember(*row)
+        if conn is not None:
+            self.attach(conn)
+
+    def attach(self, conn):
+        # Writes go through conn from here on; an empty bank gets the
+        # default words
+        self.conn = conn
+        if not self.words:
+            self.bulk_add(DEFAULT_WORDS.items())
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        return word in self.words
+
+    def remember(self, word, hint, difficulty, length):
+        self.words.add(word)
+        self.difficulty[word] = difficulty
+        if hint:
+            self.hints[word] = hint
+        for key in ((None, None), (difficulty, None), (None, length), (difficulty, length)):
+            self.index.setdefault(key, []).append(word)
+            
+        members = self.anagrams.setdefault(signature(word), [])
+        members.append(word)
+        if len(set(word)) > 1:
+            self.scramble_levels[None].add(word)
+            if len(members) == 2 and len(set(members[0])) > 1:
+                # The first member now has a second answer as well
+                self.scramble_levels[self.scramble_level(members[0], 1)].remove(members[0])
+                self.scramble_levels[self.scramble_level(members[0])].add(members[0])
+            self.scramble_levels[self.scramble_level(word)].add(word)
+
+    def scramble_level(self, word, class_size=None):
+        # The word's difficulty, one step easier when it has anagrams
+        level = WORD_DIFFICULTIES.index(self.difficulty[word])
+        if (class_size or len(self.anagrams[signature(word)])) > 1:
+            level = max(level - 1, 0)
+        return WORD_DIFFICULTIES[level]
+
+    def add(self, word, hint=None):
+        # Returns False if the word is invalid or already in the bank
+        return self.bulk_add([(word, hint)]) == 1
+
+    def bulk_add(self, entries, batch_size=1000):
+        # Streams words or (word, hint) pairs into the bank, one transaction
+        # per batch; returns how many new words were added
+        added = 0
+        batch = {}
+        for entry in entries:
+            word, hint = (entry, None) if isinstance(entry, str) else entry
+            word = normalize_word(word)
+            if word is None or word in self.words or word in batch:
+                continue
+            batch[word] = word_row(word, hint or None)
+            if len(batch) >= batch_size:
+                added += self.write(list(batch.values()))
+                batch = {}
+        if batch:
+            added += self.write(list(batch.values()))
+        return added
+
+    def write(self, rows):
+        # Memory only learns about a batch once it is committed, so a failed
+        # write leaves both sides as they were
+        insert_words(self.conn, rows)
+        for word, hint, difficulty, length, letter_score in rows:
+            self.remember(word, hint, difficulty, length)
+        return len(rows)
+
+    def sample(self, difficulty=None, length=None, rng=random):
+        # Random word matching the filters (None means any), or None
+        words = self.index.get((difficulty, length))
+        return rng.choice(words) if words else None
+
+    def hint(self, word):
+        return self.hints.get(word)
+
+    def sample_scramble(self, difficulty=None, rng=random):
+        # Random word that can be scrambled at the given scramble level, or
+        # None when there is none
+        return self.scramble_levels[difficulty].choice(rng)
+
+    def is_anagram(self, answer, word):
+        # True if answer is a word in the bank spelled with word's letters
+        return answer in self.words and signature(answer) == signature(word)
+
+    def scramble(self, word, rng=random):
+        # Shuffle once, then take the first rotation of the shuffle that is
+        # not itself an answer; None if every rotation is (e.g. "ab"/"ba")
+        # or there is no word
+        if not word:
+            return None
+        chars = list(word)
+        rng.shuffle(chars)
+        answers = self.anagrams.get(signature(word), [word])
+        for shift in range(len(chars)):
+            candidate = ''.join(chars[shift:] + chars[:shift])
+            if candidate not in answers:
+                return candidate
+        return None
+
+
+class WordImporter:
+    # Streams a dictionary file into the words table from a background
+    # thread with its own connection. Plain files hold one word per line;
+    # .csv files hold word,hint rows. Each committed batch is handed to the
+    # Tk thread through a queue (see GameApp.poll_word_import) together
+    # with the progress so far.
+    def __init__(self, db_path, path, known_words, batch_size=2000):
+        self.db_path = db_path
+        self.path = path
+        self.known = set(known_words)
+        self.batch_size = batch_size
+        self.bytes_read = 0
+        self.events = queue.Queue()
+        self.cancelled = threading.Event()
+        self.thread = threading.Thread(target=self._run, name='word-import', daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def cancel(self, timeout=None):
+        self.cancelled.set()
+        if self.thread.is_alive():
+            self.thread.join(timeout)
+
+    def _lines(self, f):
+        for line in f:
+            self.bytes_read += len(line)
+            yield line
+
+    def _entries(self, f):
+        if self.path.lower().endswith('.csv'):
+            for row in csv.reader(self._lines(f)):
+                if row:
+                    yield row[0], row[1].strip() if len(row) > 1 else None
+        else:
+            for line in self._lines(f):
+                yield line, None
+
+    def _run(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        lines = 0
+        added = 0
+        batch = []
+        try:
+            total = os.path.getsize(self.path) or 1
+            with open(self.path, encoding='utf-8', errors='replace', newline='') as f:
+                for word, hint in self._entries(f):
+                    if self.cancelled.is_set():
+                        break
+                    lines += 1
+                    word = normalize_word(word)
+                    if word is None or word in self.known:
+                        continue
+                    self.known.add(word)
+                    batch.append(word_row(word, hint or None))
+                    if len(batch) >= self.batch_size:
+                        insert_words(conn, batch)
+                        added += len(batch)
+                        self.events.put(('progress', batch, lines, added, min(self.bytes_read / total, 1.0)))
+                        batch = []
+            if self.cancelled.is_set():
+                # Batches already committed stay; the partial one is dropped
+                self.events.put(('cancelled', [], lines, added, None))
+                return
+            if batch:
+                insert_words(conn, batch)
+                added += len(batch)
+            self.events.put(('done', batch, lines, added, 1.0))
+        except (OSError, csv.Error, sqlite3.Error) as e:
+            self.events.put(('error', [], lines, added, str(e)))
+        finally:
+            conn.close()
+
+
+class FrameRegistry:
+    # Builds each application frame the first time it is shown and caches
+    # it afterwards, so startup only pays for the login screen
     def __init__(self):
+        self.factories = {}
+        self.frames = {}
+        self.build_times = {}
+
+    def register(self, name, factory):
+        self.factories[name] = factory
+
+    def get(self, name):
+        frame = self.frames.get(name)
+        if frame is None:
+            started = time.perf_counter()
+            frame = self.factories[name]()
+            self.build_times[name] = time.perf_counter() - started
+            self.frames[name] = frame
+        return frame
+
+    def built(self):
+        return list(self.frames.values())
+
+
+class EventBus:
+    # Publish/subscribe hub for data changes (scores, todos, accounts).
+    # Callbacks run synchronously on the Tk thread in subscription order.
+    def __init__(self):
+        self.subscribers = {}
+
+    def subscribe(self, topic, callback):
+        self.subscribers.setdefault(topic, []).append(callback)
+
+    def unsubscribe(self, topic, callback):
+        if callback in self.subscribers.get(topic, []):
+            self.subscribers[topic].remove(callback)
+
+    def publish(self, topic, **payload):
+        for callback in list(self.subscribers.get(topic, [])):
+            callback(**payload)
+
+
+class SnakeRenderer:
+    # Retained-mode canvas view of a SnakeGame. Each body cell keeps its
+    # rectangle item; a normal tick moves the tail item to the new head, a
+    # growing tick adds one item, and an eaten food oval is moved to the
+    # spawned cell. Items that are no longer needed are hidden and pooled.
+    def __init__(self, canvas, game, cell_size=CELL_SIZE):
+        self.canvas = canvas
+        self.cell_size = cell_size
+        self.pool = {'snake': [], 'food': []}
+        self.segments = deque(self.take('snake', cell) for cell in game.body)
+        self.food_items = {cell: self.take('food', cell) for cell in game.food}
+
+    def bounds(self, cell):
+        x, y = cell[0] * self.cell_size, cell[1] * self.cell_size
+        return x, y, x + self.cell_size, y + self.cell_size
+
+    def take(self, kind, cell):
+        # Reuse a pooled item when there is one, otherwise create it
+        if self.pool[kind]:
+            item = self.pool[kind].pop()
+            self.canvas.coords(item, *self.bounds(cell))
+            self.canvas.itemconfigure(item, state='normal')
+        elif kind == 'snake':
+            item = self.canvas.create_rectangle(*self.bounds(cell), fill='green', tags='snake')
+        else:
+            item = self.canvas.create_oval(*self.bounds(cell), fill='red', tags='food')
+        return item
+
+    def release(self, kind, item):
+        self.canvas.itemconfigure(item, state='hidden')
+        self.pool[kind].append(item)
+
+    def apply(self, step):
+        # Update the canvas for one SnakeStep from SnakeGame.step()
+        if step.tail is None:
+            self.segments.appendleft(self.take('snake', step.head))
+        else:
+            item = self.segments.pop()
+            self.canvas.coords(item, *self.bounds(step.head))
+            self.segments.appendleft(item)
+
+        if step.eaten is not None:
+            item = self.food_items.pop(step.eaten)
+            if step.spawned is None:
+                self.release('food', item)
+            else:
+                self.canvas.coords(item, *self.bounds(step.spawned))
+                self.food_items[step.spawned] = item
+
+
+class ScheduledTask:
+    # One repeating callback registered with GameScheduler
+    def __init__(self, interval, callback, policy, due):
+        self.interval = interval
+        self.callback = callback
+        self.policy = policy
+        self.due = due
+        self.remaining = 0
+        self.paused = False
+        self.cancelled = False
+        self.window = None  # path of the window that owns the task
+
+
+class GameScheduler:
+    # Drives every timed game from one Tk after() loop on a monotonic clock.
+    # Ticks are due at fixed multiples of the interval from the start, so a
+    # slow callback does not push later ticks back. When the loop falls
+    # behind, CATCH_UP tasks run the missed ticks (up to MAX_CATCH_UP at
+    # once) and SKIP tasks run once and drop the rest.
+    CATCH_UP = 'catch_up'
+    SKIP = 'skip'
+    MAX_CATCH_UP = 5
+
+    def __init__(self, root, clock=time.monotonic):
+        self.root = root
+        self.clock = clock
+        self.tasks = []
+        self.window_tasks = {}  # window path -> its running tasks
+        self.after_id = None
+
+    def every(self, interval, callback, window=None, policy=CATCH_UP, delay=None):
+        # Call callback every interval seconds, first after delay (default
+        # one interval). The task is cancelled when window is destroyed.
+        if delay is None:
+            delay = interval
+        task = ScheduledTask(interval, callback, policy, self.clock() + delay)
+        self.tasks.append(task)
+        if window is not None:
+            path = task.window = str(window)
+            if path not in self.window_tasks:
+                # One <Destroy> binding per window, however many rounds it runs
+                self.window_tasks[path] = []
+                window.bind('<Destroy>',
+                            lambda e: self.close_window(path) if e.widget is window else None,
+                            add='+')
+            self.window_tasks[path].append(task)
+        self.arm()
+        return task
+
+    def close_window(self, path):
+        for task in self.window_tasks.pop(path, []):
+            self.cancel(task)
+
+    def cancel(self, task):
+        if task is not None and not task.cancelled:
+            task.cancelled = True
+            self.tasks.remove(task)
+            if task.window in self.window_tasks:
+                self.window_tasks[task.window].remove(task)
+            self.arm()
+
+    def pause(self, task):
+        if not task.paused and not task.cancelled:
+            task.remaining = max(0, task.due - self.clock())
+            task.paused = True
+            self.arm()
+
+    def resume(self, task):
+        if task.paused and not task.cancelled:
+            task.due = self.clock() + task.remaining
+            task.paused = False
+            self.arm()
+
+    def set_interval(self, task, interval):
+        # Takes effect from the tick after the one already due
+        task.interval = interval
+
+    def arm(self):
+        # Wake up for the earliest running task, or stop when there is none
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        due = [task.due for task in self.tasks if not task.paused]
+        if due:
+            delay_ms = int((min(due) - self.clock()) * 1000) + 1
+            self.after_id = self.root.after(max(delay_ms, 0), self.pump)
+
+    def pump(self):
+        self.after_id = None
+        now = self.clock()
+        for task in list(self.tasks):
+            limit = self.MAX_CATCH_UP if task.policy == self.CATCH_UP else 1
+            runs = 0
+            while (runs < limit and task.due <= now and
+                   not task.paused and not task.cancelled):
+                task.due += task.interval
+                runs += 1
+                try:
+                    task.callback()
+                except Exception:
+                    # A broken game must not stop the other timers
+                    log.exception("Scheduled task %r failed, cancelling it", task.callback)
+                    self.cancel(task)
+            if task.due <= now and not task.paused:
+                # Too far behind: drop the missed ticks and stay on the grid
+                missed = int((now - task.due) // task.interval) + 1
+                task.due += missed * task.interval
+        self.arm()
+
+
+class GameApp:
+    def __init__(self, startup_report=False):
+        self.startup_report = startup_report
+        self.startup_timings = [('imports', time.perf_counter() - STARTUP_T0)]
+        
         self.root = tk.Tk()
         self.root.title("Game Center")
         self.root.geometry("800x600")
+        self.mark_startup('tk root')
         
         # Initialize database
         self.init_database()
+        self.score_recorder = ScoreRecorder(DB_PATH)
+        self.mark_startup('database')
         
         # Theme settings
         self.theme = {
@@ -36,11 +1243,66 @@ class GameApp:
         self.current_theme = 'light'
         
         self.current_user = None
+        self.current_frame = None
+        self.play_started = {}
+        self.ai_executor = None
+        self.password_hasher = PasswordHasher()
+        self.credential_cache = CredentialCache()
+        self.login_limiter = LoginRateLimiter()
+        self.credential_executor = None
+        self.login_pending = False
+        self.signup_pending = False
+        self.word_bank = None
+        self.word_bank_loader = None
+        self.word_bank_waiting = []
+        self.word_importer = None
+        self.scheduler = GameScheduler(self.root)
+        self.pomodoro_task = None
+        self.events = EventBus()
+        
+        # Login screen numbers are served from memory
+        self.community_stats = CommunityStats(self.conn)
+        self.usernames = UsernameIndex(self.conn)
+        self.username_check_id = None
+        self.events.subscribe('score', self.community_stats.add_score)
+        self.events.subscribe('account_created', self.community_stats.add_user)
+        self.events.subscribe('account_created', self.usernames.add)
+        self.events.subscribe('account_deleted', self.usernames.remove)
+        self.events.subscribe('account_deleted', self.community_stats.remove_user)
+        self.events.subscribe('account_deleted', self.credential_cache.invalidate)
+        self.events.subscribe('password_changed', self.credential_cache.invalidate)
+        self.events.subscribe('scores_cleared', lambda username: self.community_stats.invalidate())
+        
+        self.theme_var = tk.StringVar(value='light')
         self.create_frames()
         self.show_login_frame()
+        self.mark_startup('login frame')
+        self.root.after_idle(self.mark_first_paint)
+        
+    def mark_startup(self, label):
+        self.startup_timings.append((label, time.perf_counter() - STARTUP_T0))
+        
+    def mark_first_paint(self):
+        # Flush pending geometry/redraw work so the time covers the first paint
+        self.root.update_idletasks()
+        self.mark_startup('first paint')
+        if self.startup_report:
+            self.print_startup_report()
+        # Build the 2048 move tables and the word bank now rather than when
+        # their windows open
+        threading.Thread(target=game_2048.tables, name='2048-tables', daemon=True).start()
+        self.load_word_bank()
+            
+    def print_startup_report(self):
+        print("Startup timing (seconds since process start):")
+        for label, elapsed in self.startup_timings:
+            print(f"  {label:<14} {elapsed:8.3f}")
+        print("Frames built:")
+        for name, elapsed in self.frames.build_times.items():
+            print(f"  {name:<14} {elapsed:8.3f}")
         
     def init_database(self):
-        self.conn = sqlite3.connect('gameapp.db')
+        self.conn = sqlite3.connect(DB_PATH)
         self.cursor = self.conn.cursor()
         
         # First, check if the users table exists and its structure
@@ -56,7 +1318,7 @@ class GameApp:
             if 'failed_attempts' not in columns:
                 self.cursor.execute('ALTER TABLE users ADD COLUMN failed_attempts INTEGER DEFAULT 0')
             if 'last_attempt' not in columns:
-                self.cursor.execute('ALTER TABLE users ADD COLUMN last_attempt DATETIME')
+                self.cursor.execute('ALTER TABLE users ADD COLUMN last_attempt INTEGER')
         else:
             # Create users table with all columns
             self.cursor.execute('''
@@ -66,7 +1328,7 @@ class GameApp:
                     theme TEXT,
                     created_at DATETIME,
                     failed_attempts INTEGER DEFAULT 0,
-                    last_attempt DATETIME
+                    last_attempt INTEGER
                 )
             ''')
         
@@ -151,20 +1413,106 @@ class GameApp:
         
         self.conn.commit()
         
-    def hash_password(self, password):
-        return password
-        
+        self.upgrade_schema()
+        self.audit_query_plans()
+        
+    def upgrade_schema(self):
+        self.cursor.execute('PRAGMA user_version')
+        version = self.cursor.fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise RuntimeError(f"Database schema v{version} is newer than this app (v{SCHEMA_VERSION})")
+        
+        for target in range(version + 1, SCHEMA_VERSION + 1):
+            # Each step commits together with its version bump
+            with self.conn:
+                self.cursor.execute('BEGIN')
+                for statement in SCHEMA_MIGRATIONS[target - 1]:
+                    self.cursor.execute(statement)
+                self.cursor.execute(f'PRAGMA user_version = {target}')
+                
+    def audit_query_plans(self):
+        # Fail loudly if any of the app's queries would scan a whole table
+        problems = []
+        for name, query in APP_QUERIES.items():
+            params = (None,) * query.count('?')
+            self.cursor.execute('EXPLAIN QUERY PLAN ' + query, params)
+            for row in self.cursor.fetchall():
+                detail = row[-1]
+                if FULL_SCAN_RE.match(detail):
+                    problems.append(f"{name}: {detail}")
+        if problems:
+            raise RuntimeError("Query plan regression (full table scan):\n" + "\n".join(problems))
+        
+    def get_credential_executor(self):
+        # hashlib releases the GIL while hashing, so threads are enough to
+        # keep the Tk thread responsive
+        if self.credential_executor is None:
+            self.credential_executor = futures.ThreadPoolExecutor(
+                max_workers=CREDENTIAL_WORKERS, thread_name_prefix='credentials')
+        return self.credential_executor
+
+    def run_credential_job(self, callback, function, *args):
+        # Runs function(*args) on a credential worker and passes its result
+        # to callback on the Tk thread (None if it raised)
+        future = self.get_credential_executor().submit(function, *args)
+        self.root.after(CREDENTIAL_POLL_MS, self.poll_credential_job, future, callback)
+
+    def poll_credential_job(self, future, callback):
+        if not future.done():
+            self.root.after(CREDENTIAL_POLL_MS, self.poll_credential_job, future, callback)
+            return
+        try:
+            result = future.result()
+        except Exception:
+            log.exception("Credential job failed")
+            result = None
+        callback(result)
+
+    def start_play_clock(self, game, widget):
+        # One clock per game window (widget is anything inside it), so two
+        # open windows of the same game keep their own times
+        for key, (started, window) in list(self.play_started.items()):
+            if not window.winfo_exists():
+                del self.play_started[key]
+        window = widget.winfo_toplevel()
+        self.play_started[(game, str(window))] = (time.monotonic(), window)
+        
+    def record_score(self, game, score, widget):
+        # Queued for the background writer, never commits on the Tk thread.
+        # The game_stats trigger picks up the elapsed play time from here.
+        clock = self.play_started.pop((game, str(widget.winfo_toplevel())), None)
+        duration = round(time.monotonic() - clock[0]) if clock else 0
+        date = datetime.now()
+        self.score_recorder.record(self.current_user, game, score, duration, date)
+        self.events.publish('score', username=self.current_user, game=game,
+                            score=score, date=date)
+
+    def when_scores_saved(self, callback):
+        # Calls callback on the Tk thread once every score recorded so far
+        # has been committed (or given up on). The writer is polled with
+        # root.after rather than waited on.
+        target = self.score_recorder.recorded
+        def poll():
+            if self.score_recorder.settled >= target:
+                callback()
+            else:
+                self.root.after(SCORE_POLL_MS, poll)
+        poll()
+
     def create_frames(self):
+        # Frames are only built the first time show_frame() needs them
+        self.frames = FrameRegistry()
+        
         # Authentication Frames
-        self.login_frame = self.create_login_frame()
-        self.signup_frame = self.create_signup_frame()
+        self.frames.register('login', self.create_login_frame)
+        self.frames.register('signup', self.create_signup_frame)
         
         # Main App Frames
-        self.dashboard_frame = self.create_dashboard_frame()
-        self.settings_frame = self.create_settings_frame()
-        self.games_frame = self.create_game_frames()  # Fixed method name
-        self.utilities_frame = self.create_utilities_frame()
-        self.stats_frame = self.create_stats_frame()
+        self.frames.register('dashboard', self.create_dashboard_frame)
+        self.frames.register('settings', self.create_settings_frame)
+        self.frames.register('games', self.create_game_frames)
+        self.frames.register('utilities', self.create_utilities_frame)
+        self.frames.register('stats', self.create_stats_frame)
 
 
     def create_login_frame(self):
@@ -212,7 +1560,7 @@ class GameApp:
         signup_frame.pack(fill='x', pady=5)
         ttk.Label(signup_frame, text="Don't have an account?").pack(side='left', padx=5)
         signup_link = ttk.Button(signup_frame, text="Create Account",
-                               command=lambda: self.show_frame(self.signup_frame))
+                               command=lambda: self.show_frame('signup'))
         signup_link.pack(side='left')
         
         # Quick stats display
@@ -255,11 +1603,11 @@ class GameApp:
                 self.cursor.execute('SELECT username, password FROM users')
                 users = self.cursor.fetchall()
                 
-                text_widget.insert(tk.END, "Username | Password\n")
+                text_widget.insert(tk.END, "Username | Password storage\n")
                 text_widget.insert(tk.END, "-" * 30 + "\n")
                 
                 for username, password in users:
-                    text_widget.insert(tk.END, f"{username} | {password}\n")
+                    text_widget.insert(tk.END, f"{username} | {self.password_hasher.describe(password)}\n")
                 
                 text_widget.configure(state='disabled')
                 
@@ -376,11 +1724,11 @@ class GameApp:
         back_frame.pack(fill='x', pady=5)
         ttk.Label(back_frame, text="Already have an account?").pack(side='left', padx=5)
         back_btn = ttk.Button(back_frame, text="Login", 
-                            command=lambda: self.show_frame(self.login_frame))
+                            command=lambda: self.show_frame('login'))
         back_btn.pack(side='left')
         
         # Bind events for real-time validation
-        self.signup_username.bind('<KeyRelease>', self.check_username_availability)
+        self.signup_username.bind('<KeyRelease>', self.schedule_username_check)
         self.signup_password.bind('<KeyRelease>', self.check_password_strength)
         self.signup_confirm.bind('<KeyRelease>', self.check_passwords_match)
         
@@ -412,19 +1760,19 @@ class GameApp:
         
         # Create buttons with icons and descriptions
         game_btn = ttk.Button(buttons_frame, text="🎮 Games", 
-                          command=lambda: self.show_frame(self.games_frame))
+                          command=lambda: self.show_frame('games'))
         game_btn.pack(side='left', padx=10)
         
         utils_btn = ttk.Button(buttons_frame, text="🛠 Utilities", 
-                           command=lambda: self.show_frame(self.utilities_frame))
+                           command=lambda: self.show_frame('utilities'))
         utils_btn.pack(side='left', padx=10)
         
         stats_btn = ttk.Button(buttons_frame, text="📊 Stats", 
-                           command=lambda: self.show_frame(self.stats_frame))
+                           command=lambda: self.show_frame('stats'))
         stats_btn.pack(side='left', padx=10)
         
         settings_btn = ttk.Button(buttons_frame, text="⚙ Settings", 
-                              command=lambda: self.show_frame(self.settings_frame))
+                              command=lambda: self.show_frame('settings'))
         settings_btn.pack(side='left', padx=10)
         
         # Recent Activity Feed
@@ -442,53 +1790,85 @@ class GameApp:
                                        font=('Arial', 10))
         self.challenge_label.pack(pady=5)
         
-        # Start the dashboard updates
-        self.update_dashboard_elements()
+        # Refresh only when the data behind the dashboard changes
+        self.dashboard_user = None
+        self.dashboard_dirty = True
+        self.events.subscribe('score', self.on_dashboard_score)
+        self.events.subscribe('scores_cleared', self.on_dashboard_reset)
+        self.events.subscribe('session', self.on_dashboard_reset)
         
         return frame
 
     def update_dashboard_elements(self):
-        if hasattr(self, 'welcome_label'):
-            # Update quick stats
-            self.cursor.execute('''
-                SELECT COUNT(*) from scores WHERE username=?
-            ''', (self.current_user,))
-            games_played = self.cursor.fetchone()[0]
-            
-            self.cursor.execute('''
-                SELECT MAX(score) from scores WHERE username=? AND game="typing"
-            ''', (self.current_user,))
-            best_typing = self.cursor.fetchone()[0] or 0
-            
-            stats_text = f"Games Played: {games_played}\n"
-            stats_text += f"Best Typing Score: {best_typing} WPM"
-            self.quick_stats_label.config(text=stats_text)
-            
-            # Update activity feed
-            self.cursor.execute('''
-                SELECT game, score, date FROM scores 
-                WHERE username=? ORDER BY date DESC LIMIT 3
-            ''', (self.current_user,))
-            activities = self.cursor.fetchall()
-            
-            activity_text = "Recent Games:\n"
-            for game, score, date in activities:
-                activity_text += f"• {game.title()}: Score {score}\n"
+        # Full reload from the database, done once per login or reset
+        unsaved = self.score_recorder.unsaved()
+        self.cursor.execute(APP_QUERIES['user_games_played'], (self.current_user,))
+        self.dashboard_games_played = self.cursor.fetchone()[0] or 0
+        
+        self.cursor.execute(APP_QUERIES['user_best_score'], (self.current_user, 'typing'))
+        row = self.cursor.fetchone()
+        self.dashboard_best_typing = row[0] if row else 0
+        
+        self.cursor.execute(APP_QUERIES['user_recent_games'], (self.current_user,))
+        self.dashboard_recent = [(game, score) for game, score, date in self.cursor.fetchall()]
+        
+        # Pick the daily challenge
+        challenges = [
+            "Complete a typing game with score > 30 WPM",
+            "Solve the puzzle in less than 50 moves",
+            "Get a perfect score in Memory Game",
+            "Play all available games today"
+        ]
+        self.challenge_label.config(text=random.choice(challenges))
+        
+        self.dashboard_user = self.current_user
+        self.render_dashboard()
+        if unsaved:
+            # Some scores are still queued, so the numbers may be short.
+            # Reload once the writer has caught up.
+            self.dashboard_user = None
+            self.when_scores_saved(self.reload_dashboard)
             
-            self.activity_text.delete(1.0, tk.END)
-            self.activity_text.insert(tk.END, activity_text)
+    def reload_dashboard(self):
+        if self.current_user is not None and self.dashboard_user is None:
+            self.update_dashboard_elements()
+        
+    def render_dashboard(self):
+        stats_text = f"Games Played: {self.dashboard_games_played}\n"
+        stats_text += f"Best Typing Score: {self.dashboard_best_typing} WPM"
+        self.quick_stats_label.config(text=stats_text)
+        
+        activity_text = "Recent Games:\n"
+        for game, score in self.dashboard_recent:
+            activity_text += f"• {game.title()}: Score {score}\n"
+        
+        self.activity_text.delete(1.0, tk.END)
+        self.activity_text.insert(tk.END, activity_text)
+        self.dashboard_dirty = False
+        
+    def refresh_dashboard(self):
+        if self.dashboard_user != self.current_user:
+            self.update_dashboard_elements()
+        elif self.dashboard_dirty:
+            self.render_dashboard()
             
-            # Update daily challenge
-            challenges = [
-                "Complete a typing game with score > 30 WPM",
-                "Solve the puzzle in less than 50 moves",
-                "Get a perfect score in Memory Game",
-                "Play all available games today"
-            ]
-            self.challenge_label.config(text=random.choice(challenges))
+    def on_dashboard_score(self, username, game, score, date):
+        if username != self.dashboard_user:
+            return
+        # Patch the cached values from the event instead of re-querying
+        self.dashboard_games_played += 1
+        if game == 'typing':
+            self.dashboard_best_typing = max(self.dashboard_best_typing or 0, score)
+        self.dashboard_recent = [(game, score)] + self.dashboard_recent[:2]
+        self.dashboard_dirty = True
+        if self.current_frame == 'dashboard':
+            self.render_dashboard()
             
-            # Schedule next update
-            self.root.after(5000, self.update_dashboard_elements)
+    def on_dashboard_reset(self, username):
+        # Forces a reload the next time the dashboard is shown
+        self.dashboard_user = None
+        if self.current_frame == 'dashboard' and self.current_user:
+            self.update_dashboard_elements()
 
 
     def create_settings_frame(self):
@@ -502,8 +1882,8 @@ class GameApp:
         
         # Username display
         ttk.Label(info_frame, text="Username:").pack(anchor='w')
-        username_label = ttk.Label(info_frame, text=self.current_user, font=('Arial', 10, 'bold'))
-        username_label.pack(anchor='w', pady=(0, 10))
+        self.settings_username_label = ttk.Label(info_frame, text=self.current_user, font=('Arial', 10, 'bold'))
+        self.settings_username_label.pack(anchor='w', pady=(0, 10))
         
         # Password display with toggle
         ttk.Label(info_frame, text="Password:").pack(anchor='w')
@@ -515,12 +1895,12 @@ class GameApp:
         password_label.pack(side='left')
         
         def toggle_password():
-            # Get actual password from database
+            # Only the hash is stored, so show how the password is kept
             self.cursor.execute('SELECT password FROM users WHERE username=?', (self.current_user,))
-            current_pass = self.cursor.fetchone()[0]
+            stored = self.cursor.fetchone()[0]
             
             if self.password_var.get().startswith('●'):
-                self.password_var.set(current_pass)
+                self.password_var.set(self.password_hasher.describe(stored))
                 toggle_btn.config(text="Hide")
             else:
                 self.password_var.set('●' * 8)
@@ -537,7 +1917,6 @@ class GameApp:
         theme_frame = ttk.Frame(frame)
         theme_frame.pack(fill='x', pady=10)
         ttk.Label(theme_frame, text="Theme:").pack(side='left')
-        self.theme_var = tk.StringVar(value='light')
         ttk.Radiobutton(theme_frame, text="Light", variable=self.theme_var, 
                        value='light', command=self.toggle_theme).pack(side='left', padx=10)
         ttk.Radiobutton(theme_frame, text="Dark", variable=self.theme_var, 
@@ -560,7 +1939,7 @@ class GameApp:
         buttons_frame = ttk.Frame(frame)
         buttons_frame.pack(pady=20)
         ttk.Button(buttons_frame, text="Back to Dashboard", 
-                  command=lambda: self.show_frame(self.dashboard_frame)).pack(side='left', padx=10)
+                  command=lambda: self.show_frame('dashboard')).pack(side='left', padx=10)
         ttk.Button(buttons_frame, text="Logout", 
                   command=self.logout).pack(side='left')
         
@@ -640,7 +2019,7 @@ class GameApp:
         
         # Back button
         ttk.Button(games_frame, text="Back to Dashboard", 
-                  command=lambda: self.show_frame(self.dashboard_frame)).pack(pady=10)
+                  command=lambda: self.show_frame('dashboard')).pack(pady=10)
         
         return games_frame
 
@@ -751,7 +2130,9 @@ class GameApp:
         back_frame = ttk.Frame(frame)
         back_frame.pack(side='bottom', fill='x', pady=10)
         ttk.Button(back_frame, text="Back to Dashboard", 
-                  command=lambda: self.show_frame(self.dashboard_frame)).pack()
+                  command=lambda: self.show_frame('dashboard')).pack()
+        
+        self.events.subscribe('todo', self.on_todo_changed)
         
         return frame
 
@@ -765,83 +2146,127 @@ class GameApp:
         self.stats_text.pack(pady=10)
         
         ttk.Button(frame, text="Back to Dashboard", 
-                  command=lambda: self.show_frame(self.dashboard_frame)).pack(pady=20)
+                  command=lambda: self.show_frame('dashboard')).pack(pady=20)
         
         return frame
         
-    def show_frame(self, frame):
-        for f in (self.login_frame, self.signup_frame, self.dashboard_frame,
-                 self.settings_frame, self.games_frame, self.utilities_frame,
-                 self.stats_frame):
+    def show_frame(self, name):
+        frame = self.frames.get(name)
+        for f in self.frames.built():
             f.pack_forget()
         frame.pack(fill='both', expand=True)
+        self.current_frame = name
         
-        if frame == self.dashboard_frame:
+        if name == 'dashboard':
             self.update_welcome_message()
-        elif frame == self.utilities_frame:
+            self.refresh_dashboard()
+        elif name == 'settings':
+            self.settings_username_label.config(text=self.current_user)
+        elif name == 'utilities':
             self.update_todo_list()
-        elif frame == self.stats_frame:
+        elif name == 'stats':
             self.update_stats()
             
     def show_login_frame(self):
-        self.show_frame(self.login_frame)
+        self.show_frame('login')
         self.login_username.delete(0, tk.END)
         self.login_password.delete(0, tk.END)
         
     def login(self):
+        if self.login_pending:
+            return
         username = self.login_username.get()
-        password = self.hash_password(self.login_password.get())
+        password = self.login_password.get()
         
-        # Check for too many failed attempts
-        self.cursor.execute('''
-            SELECT failed_attempts, last_attempt 
-            FROM users WHERE username=?
-        ''', (username,))
-        result = self.cursor.fetchone()
-        
-        if result and result[0] >= 3:
-            last_attempt = datetime.strptime(result[1], '%Y-%m-%d %H:%M:%S.%f')
-            time_diff = datetime.now() - last_attempt
-            
-            if time_diff.total_seconds() < 300:  # 5 minutes lockout
-                messagebox.showerror("Error", "Account temporarily locked. Try again later.")
-                return
-            else:
-                # Reset failed attempts after lockout period
-                self.cursor.execute('''
-                    UPDATE users SET failed_attempts=0 
-                    WHERE username=?
-                ''', (username,))
-                self.conn.commit()
+        # Bursts of failures are turned away before the database is read
+        wait = self.login_limiter.retry_after(username)
+        if wait:
+            messagebox.showerror("Error", f"Too many failed attempts. Try again in {wait} seconds.")
+            return
         
-        # Attempt login
-        self.cursor.execute('SELECT * FROM users WHERE username=? AND password=?',
-                          (username, password))
+        # One read covers the stored lockout and the credentials. An expired
+        # lockout is cleared by the next write instead of a write of its own.
+        self.cursor.execute(APP_QUERIES['user_login'], (username,))
         user = self.cursor.fetchone()
+        if user is None:
+            # Checked against a stand-in hash so an unknown username takes
+            # as long to reject as a wrong password
+            self.login_pending = True
+            self.run_credential_job(lambda result: self.finish_unknown_login(username),
+                                    self.password_hasher.verify, password, None)
+            return
+        failed_attempts, last_attempt = user[2] or 0, user[3] or 0
+        if (failed_attempts >= LOGIN_MAX_FAILURES and
+                int(time.time()) - last_attempt < LOGIN_LOCKOUT_SECONDS):
+            # Same message as the in-memory limit, which unknown usernames
+            # reach too, so a lockout does not reveal that the account exists
+            self.login_limiter.lock(username, last_attempt + LOGIN_LOCKOUT_SECONDS)
+            wait = self.login_limiter.retry_after(username)
+            messagebox.showerror("Error", f"Too many failed attempts. Try again in {wait} seconds.")
+            return
         
-        if user:
-            # Reset failed attempts on successful login
-            self.cursor.execute('''
-                UPDATE users SET failed_attempts=0 
-                WHERE username=?
-            ''', (username,))
+        # Attempt login, the hash is checked on a credential worker
+        if self.credential_cache.check(username, password, user[0]):
+            # Verified recently, the lockout check above still applied
+            self.finish_login(username, password, user, (True, False))
+            return
+        self.login_pending = True
+        self.run_credential_job(lambda result: self.finish_login(username, password, user, result),
+                                self.password_hasher.verify, password, user[0])
+        
+    def finish_unknown_login(self, username):
+        self.login_pending = False
+        self.login_failed(username, exists=False)
+        
+    def finish_login(self, username, password, user, result):
+        self.login_pending = False
+        if not result or not result[0]:
+            self.login_failed(username)
+            return
+        stored, theme, failed_attempts = user[:3]
+        self.login_limiter.success(username)
+        
+        # Clear a stored lockout that has run out (only write if needed)
+        if failed_attempts:
+            self.cursor.execute('UPDATE users SET failed_attempts=0 WHERE username=?',
+                              (username,))
             self.conn.commit()
-            
-            self.current_user = username
-            self.current_theme = user[2]
-            self.theme_var.set(self.current_theme)
-            self.apply_theme()
-            self.show_frame(self.dashboard_frame)
+        
+        if result[1]:
+            # Plain text or outdated hash, store a fresh one in the background
+            self.run_credential_job(
+                lambda new_hash: self.store_rehashed_password(username, password, stored, new_hash),
+                self.password_hasher.hash, password)
         else:
-            # Increment failed attempts
+            self.credential_cache.add(username, password, stored)
+        
+        self.current_user = username
+        self.events.publish('session', username=username)
+        self.current_theme = theme
+        self.theme_var.set(self.current_theme)
+        self.apply_theme()
+        self.show_frame('dashboard')
+        
+    def login_failed(self, username, exists=True):
+        # Failures are counted in memory. The database only hears about the
+        # one that locks the account, so the lockout survives a restart.
+        if self.login_limiter.failure(username) and exists:
             self.cursor.execute('''
-                UPDATE users SET 
-                    failed_attempts = COALESCE(failed_attempts, 0) + 1,
-                    last_attempt = ?
+                UPDATE users SET failed_attempts=?, last_attempt=?
                 WHERE username=?
-            ''', (datetime.now(), username))
+            ''', (LOGIN_MAX_FAILURES, int(time.time()), username))
             self.conn.commit()
-            messagebox.showerror("Error", "Invalid credentials")      
+        messagebox.showerror("Error", "Invalid credentials")
+        
+    def store_rehashed_password(self, username, password, old_hash, new_hash):
+        # Skipped if the password was changed while the new hash was computed
+        if new_hash is None:
+            return
+        self.cursor.execute('UPDATE users SET password=? WHERE username=? AND password=?',
+                          (new_hash, username, old_hash))
+        self.conn.commit()
+        if self.cursor.rowcount:
+            self.credential_cache.add(username, password, new_hash)
 
     def create_account(self):
         username = self.signup_username.get()
@@ -852,24 +2277,45 @@ class GameApp:
             messagebox.showerror("Error", "Please fill all fields")
             return
             
+        # The username index and availability check assume this length
+        if len(username) < USERNAME_MIN_LENGTH:
+            messagebox.showerror("Error", f"Username must be at least {USERNAME_MIN_LENGTH} characters")
+            return
+            
         if password != confirm:
             messagebox.showerror("Error", "Passwords don't match")
             return
             
+        if self.signup_pending:
+            return
+        self.signup_pending = True
+        self.run_credential_job(
+            lambda hashed_password: self.finish_create_account(username, hashed_password),
+            self.password_hasher.hash, password)
+        
+    def finish_create_account(self, username, hashed_password):
+        self.signup_pending = False
+        if hashed_password is None:
+            messagebox.showerror("Error", "Could not create account, please try again")
+            return
+            
         try:
-            hashed_password = self.hash_password(password)
             self.cursor.execute('''
                 INSERT INTO users (username, password, theme, created_at)
                 VALUES (?, ?, ?, ?)
             ''', (username, hashed_password, 'light', datetime.now()))
             self.conn.commit()
+            self.events.publish('account_created', username=username)
             messagebox.showinfo("Success", "Account created successfully!")
             self.show_login_frame()
         except sqlite3.IntegrityError:
+            # Registered elsewhere since the index was built
+            self.usernames.reload()
             messagebox.showerror("Error", "Username already exists")
             
     def logout(self):
         self.current_user = None
+        self.events.publish('session', username=None)
         self.show_login_frame()
         
     def toggle_theme(self):
@@ -911,32 +2357,47 @@ class GameApp:
                 messagebox.showerror("Error", "Please enter your password", parent=dialog)
                 return
                 
-            # Verify password
-            password_hash = self.hash_password(password)
+            # Verify password on a credential worker
             self.cursor.execute('SELECT password FROM users WHERE username=?', 
                               (self.current_user,))
             stored_hash = self.cursor.fetchone()[0]
+            delete_btn.config(state='disabled')
+            self.run_credential_job(finish_delete, self.password_hasher.verify,
+                                    password, stored_hash)
             
-            if password_hash != stored_hash:
+        def finish_delete(result):
+            if not dialog.winfo_exists():
+                return
+            delete_btn.config(state='normal')
+            if not result or not result[0]:
                 messagebox.showerror("Error", "Incorrect password", parent=dialog)
                 return
                 
             if messagebox.askyesno("Final Confirmation", 
                                  "Are you absolutely sure you want to delete your account?\n"
                                  "All your data will be permanently lost!", parent=dialog):
-                # Delete all user data
+                # Delete all user data (write out queued scores first so
+                # none land after the delete)
+                if not self.score_recorder.flush(SCORE_FLUSH_TIMEOUT):
+                    messagebox.showerror("Error", "Scores are still being saved, "
+                                         "please try again in a moment.", parent=dialog)
+                    return
                 self.cursor.execute('DELETE FROM todos WHERE username=?', (self.current_user,))
                 self.cursor.execute('DELETE FROM notes WHERE username=?', (self.current_user,))
                 self.cursor.execute('DELETE FROM scores WHERE username=?', (self.current_user,))
+                self.cursor.execute('DELETE FROM game_stats WHERE username=?', (self.current_user,))
                 self.cursor.execute('DELETE FROM users WHERE username=?', (self.current_user,))
                 self.conn.commit()
+                self.events.publish('todo', username=self.current_user)
+                self.events.publish('account_deleted', username=self.current_user)
                 
                 dialog.destroy()
                 messagebox.showinfo("Account Deleted", "Your account has been permanently deleted.")
                 self.logout()
         
-        ttk.Button(dialog, text="Delete Account", command=confirm_delete,
-                  style='Danger.TButton').pack(pady=10)
+        delete_btn = ttk.Button(dialog, text="Delete Account", command=confirm_delete,
+                               style='Danger.TButton')
+        delete_btn.pack(pady=10)
         ttk.Button(dialog, text="Cancel", command=dialog.destroy).pack()
 
     def show_change_password_dialog(self):
@@ -971,35 +2432,59 @@ class GameApp:
                 messagebox.showerror("Error", "New passwords don't match", parent=dialog)
                 return
                 
-            # Verify current password
-            current_hash = self.hash_password(current)
+            # Verify the current password and hash the new one on a
+            # credential worker
             self.cursor.execute('SELECT password FROM users WHERE username=?', 
                               (self.current_user,))
             stored_hash = self.cursor.fetchone()[0]
             
-            if current_hash != stored_hash:
+            def verify_and_hash():
+                if not self.password_hasher.verify(current, stored_hash)[0]:
+                    return False
+                return self.password_hasher.hash(new)
+                
+            change_btn.config(state='disabled')
+            self.run_credential_job(finish_change, verify_and_hash)
+            
+        def finish_change(new_hash):
+            if not dialog.winfo_exists():
+                return
+            change_btn.config(state='normal')
+            if new_hash is None:
+                messagebox.showerror("Error", "Could not change password, please try again",
+                                     parent=dialog)
+                return
+            if new_hash is False:
                 messagebox.showerror("Error", "Current password is incorrect", parent=dialog)
                 return
                 
             # Update password
-            new_hash = self.hash_password(new)
             self.cursor.execute('UPDATE users SET password=? WHERE username=?',
                               (new_hash, self.current_user))
             self.conn.commit()
+            self.events.publish('password_changed', username=self.current_user)
             
             messagebox.showinfo("Success", "Password changed successfully!", parent=dialog)
             dialog.destroy()
             
-        ttk.Button(dialog, text="Change Password", 
-                  command=change_password).pack(pady=10)
+        change_btn = ttk.Button(dialog, text="Change Password", 
+                               command=change_password)
+        change_btn.pack(pady=10)
 
     def reset_account_data(self):
         if messagebox.askyesno("Confirm Reset", 
                               "Are you sure you want to reset all your data? This cannot be undone!"):
+            if not self.score_recorder.flush(SCORE_FLUSH_TIMEOUT):
+                messagebox.showerror("Error", "Scores are still being saved, "
+                                     "please try again in a moment.")
+                return
             self.cursor.execute('DELETE FROM todos WHERE username=?', (self.current_user,))
             self.cursor.execute('DELETE FROM notes WHERE username=?', (self.current_user,))
             self.cursor.execute('DELETE FROM scores WHERE username=?', (self.current_user,))
+            self.cursor.execute('DELETE FROM game_stats WHERE username=?', (self.current_user,))
             self.conn.commit()
+            self.events.publish('todo', username=self.current_user)
+            self.events.publish('scores_cleared', username=self.current_user)
             messagebox.showinfo("Success", "Account data has been reset!")
 
     def animate_login_banner(self):
@@ -1021,43 +2506,11 @@ class GameApp:
 
     def update_login_stats(self):
         try:
-            # Get total registered users
-            self.cursor.execute('SELECT COUNT(*) FROM users')
-            total_users = self.cursor.fetchone()[0]
-            
-            # Get total games played
-            self.cursor.execute('SELECT COUNT(*) FROM scores')
-            total_games = self.cursor.fetchone()[0]
-            
-            # Get most popular game
-            self.cursor.execute('''
-                SELECT game, COUNT(*) as count 
-                FROM scores 
-                GROUP BY game 
-                ORDER BY count DESC 
-                LIMIT 1
-            ''')
-            result = self.cursor.fetchone()
-            most_played = result[0].title() if result else "None"
-            
-            # Get highest score
-            self.cursor.execute('''
-                SELECT username, game, score 
-                FROM scores 
-                ORDER BY score DESC 
-                LIMIT 1
-            ''')
-            high_score = self.cursor.fetchone()
-            
-            # Format stats text with emojis
-            stats_text = f"👥 Total Users: {total_users}\n"
-            stats_text += f"🎮 Games Played: {total_games}\n"
-            stats_text += f"🏆 Most Popular: {most_played}\n"
-            
-            if high_score:
-                stats_text += f"⭐ Best Score: {high_score[0]} ({high_score[1]}: {high_score[2]})"
-            
-            self.stats_label.config(text=stats_text)
+            # Render from the cache, SQLite is only hit once the TTL expires
+            # (the event counters stay in use while scores are still queued)
+            if self.community_stats.is_stale() and not self.score_recorder.unsaved():
+                self.community_stats.reconcile()
+            self.stats_label.config(text=self.community_stats.summary_text())
             
             # Schedule next update (every 30 seconds)
             self.root.after(30000, self.update_login_stats)
@@ -1073,17 +2526,29 @@ class GameApp:
         else:
             self.login_password.configure(show="*")
 
+    def schedule_username_check(self, event=None):
+        # Only check once typing pauses, not on every keystroke
+        if self.username_check_id is not None:
+            self.root.after_cancel(self.username_check_id)
+        self.username_check_id = self.root.after(USERNAME_CHECK_DELAY_MS,
+                                                 self.check_username_availability)
+        
     def check_username_availability(self, event=None):
+        self.username_check_id = None
         username = self.signup_username.get()
-        if len(username) < 3:
+        if len(username) < USERNAME_MIN_LENGTH:
             self.username_status.configure(text="❓")
             return
         
-        self.cursor.execute('SELECT username FROM users WHERE username=?', (username,))
-        if self.cursor.fetchone():
-            self.username_status.configure(text="❌")
-        else:
-            self.username_status.configure(text="✅")
+        # Served from the in-memory index, SQLite only settles a possible hit.
+        # A miss can be a name taken on another kiosk since startup, so it is
+        # shown as probable and signup has the final say.
+        if self.usernames.probably_free(username):
+            self.username_status.configure(text="✅ probably available")
+            return
+        self.cursor.execute('SELECT 1 FROM users WHERE username=?', (username,))
+        available = self.cursor.fetchone() is None
+        self.username_status.configure(text="✅" if available else "❌")
 
     def check_password_strength(self, event=None):
         password = self.signup_password.get()
@@ -1125,6 +2590,7 @@ class GameApp:
         game_window.geometry("400x500")
         
         # Game variables
+        self.start_play_clock('memory', game_window)
         self.cards = []
         self.flipped = []
         self.matched = []
@@ -1185,11 +2651,7 @@ class GameApp:
             
     def game_over(self, window):
         # Save score
-        self.cursor.execute('''
-            INSERT INTO scores (username, game, score, date)
-            VALUES (?, ?, ?, ?)
-        ''', (self.current_user, 'memory', self.moves, datetime.now()))
-        self.conn.commit()
+        self.record_score('memory', self.moves, window)
         
         messagebox.showinfo("Congratulations!", 
                           f"You won in {self.moves} moves!", parent=window)
@@ -1244,17 +2706,22 @@ class GameApp:
         
     def initialize_snake_game(self, window):
         # Validate settings
-        start_length = int(self.snake_length.get())
-        food_count = int(self.food_amount.get())
+        try:
+            start_length = int(self.snake_length.get())
+            food_count = int(self.food_amount.get())
+        except ValueError:
+            messagebox.showerror("Invalid Settings", "Please enter whole numbers.")
+            return
         
-        # Check if snake length is too long for the game area
-        max_length = (400 * 400) // (10 * 10)  # Total grid spaces
-        if start_length > max_length // 2:  # Use half of available space as max
+        # The snake starts on one row, so it must fit within half of it
+        columns = 400 // CELL_SIZE
+        if not 1 <= start_length <= columns // 2:
             messagebox.showerror("Invalid Settings", 
-                               "Snake length is too large for the game area!")
+                               f"Snake length must be between 1 and {columns // 2}!")
             return
             
         # Check if there's enough space for food
+        max_length = (400 * 400) // (10 * 10)  # Total grid spaces
         available_spaces = max_length - start_length
         if food_count > available_spaces // 2:  # Leave some free space
             messagebox.showerror("Invalid Settings", 
@@ -1267,20 +2734,13 @@ class GameApp:
                 widget.pack_forget()
         
         # Game variables
-        self.snake_pos = [(100 - i*10, 100) for i in range(start_length)]
-        self.food_positions = []
-        self.snake_dir = "Right"
-        self.snake_score = 0
+        self.start_play_clock('snake', window)
+        self.snake = SnakeGame(400 // CELL_SIZE, 400 // CELL_SIZE, start_length, food_count)
         self.game_speed = int(self.game_speed_setting.get())
-        self.movement_queue = []
-        self.last_update = time.time()
         
-        # Clear canvas
+        # Clear canvas and draw the initial snake and food
         self.game_canvas.delete('all')
-        
-        # Spawn initial food
-        for _ in range(food_count):
-            self.spawn_food()
+        self.snake_renderer = SnakeRenderer(self.game_canvas, self.snake)
         
         # Controls
         window.bind('<Left>', lambda e: self.change_direction('Left'))
@@ -1292,107 +2752,47 @@ class GameApp:
         window.bind('w', lambda e: self.change_direction('Up'))
         window.bind('s', lambda e: self.change_direction('Down'))
         
-        self.update_snake()
+        # Late frames are dropped rather than replayed as a burst of moves
+        self.snake_task = self.scheduler.every(self.game_speed / 1000, self.update_snake,
+                                               window=window, policy=GameScheduler.SKIP, delay=0)
 
         
-    def spawn_food(self):
-        while True:
-            x = random.randint(1, 39) * 10
-            y = random.randint(1, 39) * 10
-            new_pos = (x, y)
-            if new_pos not in self.food_positions and new_pos not in self.snake_pos:
-                self.food_positions.append(new_pos)
-                self.game_canvas.create_oval(x, y, x+10, y+10, fill='red', tags='food')
-                break
-                
     def change_direction(self, new_dir):
-        opposites = {'Left': 'Right', 'Right': 'Left', 'Up': 'Down', 'Down': 'Up'}
-        
-        if len(self.movement_queue) < 2:  # Limit queue size
-            if not self.movement_queue:
-                current_dir = self.snake_dir
-            else:
-                current_dir = self.movement_queue[-1]
-                
-            if opposites[new_dir] != current_dir:
-                self.movement_queue.append(new_dir)
+        self.snake.queue_direction(new_dir)
                 
     def update_snake(self):
-        current_time = time.time()
-        
-        if self.movement_queue and (current_time - self.last_update) >= (self.game_speed / 1000.0):
-            self.snake_dir = self.movement_queue.pop(0)
-            self.last_update = current_time
-            
-        head = self.snake_pos[0]
-        
-        # Calculate new head position
-        if self.snake_dir == 'Left':
-            new_head = (head[0] - 10, head[1])
-        elif self.snake_dir == 'Right':
-            new_head = (head[0] + 10, head[1])
-        elif self.snake_dir == 'Up':
-            new_head = (head[0], head[1] - 10)
-        else:  # Down
-            new_head = (head[0], head[1] + 10)
-            
-        # Check for collisions
-        if (new_head in self.snake_pos[:-1] or 
-            new_head[0] < 0 or new_head[0] >= 400 or 
-            new_head[1] < 0 or new_head[1] >= 400):
+        step = self.snake.step()
+        if not step.alive:
+            self.scheduler.cancel(self.snake_task)
             self.game_over_snake()
             return
             
-        # Update snake position
-        self.snake_pos.insert(0, new_head)
-        
         # Check if food is eaten
-        if new_head in self.food_positions:
-            self.food_positions.remove(new_head)
-            self.snake_score += 1
-            self.snake_score_label.config(text=f"Score: {self.snake_score}")
-            self.game_canvas.delete('food')
-            # Redraw remaining food
-            for fx, fy in self.food_positions:
-                self.game_canvas.create_oval(fx, fy, fx+10, fy+10, fill='red', tags='food')
-            # Spawn new food
-            self.spawn_food()
+        if step.eaten:
+            self.snake_score_label.config(text=f"Score: {self.snake.score}")
             if self.game_speed > 50:
                 self.game_speed -= 2
-        else:
-            self.snake_pos.pop()
-            
-        # Update canvas
-        self.game_canvas.delete('snake')
-        for x, y in self.snake_pos:
-            self.game_canvas.create_rectangle(x, y, x+10, y+10, fill='green', tags='snake')
+                self.scheduler.set_interval(self.snake_task, self.game_speed / 1000)
             
-        # Schedule next update
-        self.game_canvas.after(self.game_speed, self.update_snake)
+        # Update canvas: only the head, tail and eaten food items change
+        self.snake_renderer.apply(step)
         
     def game_over_snake(self):
         # Save score
-        self.cursor.execute('''
-            INSERT INTO scores (username, game, score, date)
-            VALUES (?, ?, ?, ?)
-        ''', (self.current_user, 'snake', self.snake_score, datetime.now()))
-        self.conn.commit()
+        self.record_score('snake', self.snake.score, self.game_canvas)
         
         messagebox.showinfo("Game Over", 
-                          f"Game Over! Your score: {self.snake_score}")
+                          f"Game Over! Your score: {self.snake.score}")
         self.game_canvas.master.destroy()
 
     def start_typing_game(self):
+        if not self.word_bank_ready(self.start_typing_game):
+            return
         game_window = tk.Toplevel(self.root)
         game_window.title("Typing Game")
         game_window.geometry("600x400")
         
-        # Word list
-        self.typing_words = [
-            "python", "programming", "computer", "algorithm", "database",
-            "interface", "software", "developer", "keyboard", "function",
-            "variable", "network", "security", "application", "framework"
-        ]
+        self.typing_level = self.add_word_level_selector(game_window)
         
         # Add custom words section
         custom_frame = ttk.Frame(game_window)
@@ -1401,6 +2801,10 @@ class GameApp:
         self.custom_word_entry.pack(side='left', padx=5)
         ttk.Button(custom_frame, text="Add Word", 
                   command=self.add_custom_word).pack(side='left')
+        ttk.Button(custom_frame, text="📂 Import List", 
+                  command=lambda: self.import_word_list(game_window)).pack(side='left', padx=5)
+        self.import_status_label = ttk.Label(game_window, text="", font=('Arial', 10))
+        self.import_status_label.pack()
         
         self.current_word = ""
         self.typing_score = 0
@@ -1429,10 +2833,61 @@ class GameApp:
         ttk.Button(game_window, text="Start Game", 
                   command=self.start_typing_round).pack(pady=10)
 
+    def import_word_list(self, window):
+        if self.word_importer is not None:
+            return
+        path = filedialog.askopenfilename(
+            parent=window, title="Import Word List",
+            filetypes=[("Word lists", "*.txt *.csv"), ("All files", "*")])
+        if not path:
+            return
+        self.word_importer = WordImporter(DB_PATH, path, self.word_bank.words)
+        self.word_importer.start()
+        self.import_status_label.config(text="Importing...")
+        self.root.after(WORD_IMPORT_POLL_MS, self.poll_word_import)
+
+    def poll_word_import(self):
+        importer = self.word_importer
+        if importer is None:
+            return
+        finished = False
+        status = None
+        while True:
+            try:
+                kind, rows, lines, added, detail = importer.events.get_nowait()
+            except queue.Empty:
+                break
+            # Committed rows join the in-memory index on the Tk thread
+            for word, hint, difficulty, length, letter_score in rows:
+                if word not in self.word_bank:
+                    self.word_bank.remember(word, hint, difficulty, length)
+            if kind == 'progress':
+                status = f"Importing... {added:,} new words ({detail:.0%})"
+            elif kind == 'done':
+                status = f"Imported {added:,} new words from {lines:,} lines"
+                finished = True
+            elif kind == 'cancelled':
+                status = f"Import cancelled after {added:,} new words"
+                finished = True
+            else:
+                status = f"Import failed after {added:,} words: {detail}"
+                finished = True
+                
+        if status and self.import_status_label.winfo_exists():
+            self.import_status_label.config(text=status)
+        if finished:
+            self.word_importer = None
+        else:
+            self.root.after(WORD_IMPORT_POLL_MS, self.poll_word_import)
+
     def add_custom_word(self):
-        word = self.custom_word_entry.get().strip().lower()
-        if word and word not in self.typing_words:
-            self.typing_words.append(word)
+        word = normalize_word(self.custom_word_entry.get())
+        try:
+            added = word and self.word_bank.add(word)
+        except sqlite3.Error as e:
+            messagebox.showerror("Error", f"Could not save the word: {e}")
+            return
+        if added:
             self.custom_word_entry.delete(0, tk.END)
             messagebox.showinfo("Success", f"Added word: {word}")
 
@@ -1440,17 +2895,19 @@ class GameApp:
     def start_typing_round(self):
         if not self.typing_game_active:
             self.typing_game_active = True
+            self.start_play_clock('typing', self.word_label)
             self.typing_score = 0
             self.time_left = 60
             self.typing_score_label.config(text="Score: 0")
             self.typing_entry.delete(0, tk.END)
             self.typing_entry.focus()
             self.next_word()
-            self.update_typing_timer()
+            self.typing_task = self.scheduler.every(1.0, self.update_typing_timer,
+                                                window=self.word_label.winfo_toplevel(), delay=0)
             
     def next_word(self):
         if self.typing_game_active:
-            self.current_word = random.choice(self.typing_words)
+            self.current_word = self.pick_word(self.typing_level)
             self.word_label.config(text=self.current_word)
             
     def check_word(self):
@@ -1467,17 +2924,13 @@ class GameApp:
             self.typing_timer_label.config(text=f"Time: {self.time_left}")
             if self.time_left > 0:
                 self.time_left -= 1
-                self.word_label.after(1000, self.update_typing_timer)
             else:
                 self.typing_game_active = False
+                self.scheduler.cancel(self.typing_task)
                 self.word_label.config(text="Game Over!")
                 
                 # Save score
-                self.cursor.execute('''
-                    INSERT INTO scores (username, game, score, date)
-                    VALUES (?, ?, ?, ?)
-                ''', (self.current_user, 'typing', self.typing_score, datetime.now()))
-                self.conn.commit()
+                self.record_score('typing', self.typing_score, self.word_label)
                 
                 messagebox.showinfo("Game Over", 
                                   f"Time's up! Your final score: {self.typing_score} words",
@@ -1496,9 +2949,12 @@ class GameApp:
         style.configure('Paused.TButton', background='gray')
         
         # Game variables
-        self.puzzle_moves = 0
         self.puzzle_tiles = []
-        self.puzzle_numbers = list(range(1, 16)) + [None]
+        self.puzzle = SlidingPuzzle(4)
+        self.puzzle_timer = None
+        self.puzzle_future = None
+        self.puzzle_playback = None
+        self.puzzle_assisted = False
         self.game_paused = False
         self.game_time = 0
         self.current_theme = 'default'
@@ -1513,6 +2969,12 @@ class GameApp:
         self.grid_size.set('4x4')
         self.grid_size.pack(side='left', padx=5)
         
+        # Scramble level (Easy/Medium start a few moves from solved)
+        ttk.Label(control_frame, text="Level:").pack(side='left', padx=5)
+        self.puzzle_level = ttk.Combobox(control_frame, values=['Easy', 'Medium', 'Hard'], width=7)
+        self.puzzle_level.set('Hard')
+        self.puzzle_level.pack(side='left', padx=5)
+        
         # Theme selector
         ttk.Label(control_frame, text="Theme:").pack(side='left', padx=5)
         self.theme_choice = ttk.Combobox(control_frame, values=['Default', 'Blue', 'Green'], width=8)
@@ -1542,8 +3004,8 @@ class GameApp:
         self.puzzle_moves_label = ttk.Label(stats_frame, text="Moves: 0", font=('Arial', 12))
         self.puzzle_moves_label.pack(side='left', padx=10)
         
-        self.timer_label = ttk.Label(stats_frame, text="Time: 0:00", font=('Arial', 12))
-        self.timer_label.pack(side='right', padx=10)
+        self.puzzle_timer_label = ttk.Label(stats_frame, text="Time: 0:00", font=('Arial', 12))
+        self.puzzle_timer_label.pack(side='right', padx=10)
         
         # Best score display
         self.best_score_label = ttk.Label(stats_frame, text="Best: --", font=('Arial', 12))
@@ -1557,6 +3019,13 @@ class GameApp:
                   command=self.reset_puzzle).pack(side='left', padx=5)
         ttk.Button(button_frame, text="Reset Current", 
                   command=self.reset_current_puzzle).pack(side='left', padx=5)
+        ttk.Button(button_frame, text="💡 Hint", 
+                  command=lambda: self.request_puzzle_solution('hint')).pack(side='left', padx=5)
+        ttk.Button(button_frame, text="🤖 Solve", 
+                  command=lambda: self.request_puzzle_solution('solve')).pack(side='left', padx=5)
+        
+        self.puzzle_hint_label = ttk.Label(game_window, text="", font=('Arial', 12))
+        self.puzzle_hint_label.pack(pady=5)
         
         # Add keyboard controls
         game_window.bind('<Left>', lambda e: self.handle_keyboard('Left'))
@@ -1564,10 +3033,11 @@ class GameApp:
         game_window.bind('<Up>', lambda e: self.handle_keyboard('Up'))
         game_window.bind('<Down>', lambda e: self.handle_keyboard('Down'))
         game_window.bind('<space>', lambda e: self.toggle_pause())
+        game_window.bind('<Destroy>', 
+                        lambda e: self.stop_puzzle_solver() if e.widget is game_window else None)
         
         # Initialize game
         self.initialize_puzzle()
-        self.update_timer()
         self.update_best_score()
         
     def show_tutorial(self):
@@ -1583,28 +3053,18 @@ class GameApp:
             "- Try to solve row by row")
 
     def handle_keyboard(self, direction):
-        if self.game_paused:
+        if self.game_paused or self.puzzle_playback is not None:
             return
             
-        empty_pos = self.puzzle_numbers.index(None)
-        size = int(self.grid_size.get()[0])
-        
-        if direction == 'Left' and empty_pos % size < size - 1:
-            self.move_tile(empty_pos + 1)
-        elif direction == 'Right' and empty_pos % size > 0:
-            self.move_tile(empty_pos - 1)
-        elif direction == 'Up' and empty_pos < len(self.puzzle_numbers) - size:
-            self.move_tile(empty_pos + size)
-        elif direction == 'Down' and empty_pos >= size:
-            self.move_tile(empty_pos - size)
+        position = self.puzzle.tile_for_direction(direction)
+        if position is not None:
+            self.move_tile(position)
 
     def update_best_score(self):
         # Get best score from database
-        self.cursor.execute('''
-            SELECT MIN(score) FROM scores 
-            WHERE username = ? AND game = 'puzzle'
-        ''', (self.current_user,))
-        best_score = self.cursor.fetchone()[0]
+        self.cursor.execute(APP_QUERIES['user_lowest_score'], (self.current_user, 'puzzle'))
+        row = self.cursor.fetchone()
+        best_score = row[0] if row else None
         if best_score:
             self.best_score_label.config(text=f"Best: {best_score}")
 
@@ -1615,33 +3075,44 @@ class GameApp:
         self.puzzle_tiles.clear()
         
         # Reset game state
-        self.puzzle_moves = 0
+        self.stop_puzzle_solver()
+        self.start_play_clock('puzzle', self.puzzle_frame)
         self.game_time = 0
         self.game_paused = False
         size = int(self.grid_size.get()[0])
-        self.puzzle_numbers = list(range(1, size*size)) + [None]
-        random.shuffle(self.puzzle_numbers)
+        self.puzzle = SlidingPuzzle(size)
+        self.puzzle.shuffle(self.puzzle_level.get().lower())
+        self.puzzle_assisted = False
+        self.puzzle_moves_label.config(text="Moves: 0")
+        
+        # Restart the clock for the new board
+        self.scheduler.cancel(self.puzzle_timer)
+        self.puzzle_timer = self.scheduler.every(1.0, self.update_puzzle_timer,
+                                                 window=self.puzzle_frame.winfo_toplevel(), delay=0)
         
         # Create grid of tiles
         for i in range(size*size):
             row, col = i // size, i % size
             btn = ttk.Button(self.puzzle_frame, width=5)
-            if self.puzzle_numbers[i]:
-                btn.configure(text=str(self.puzzle_numbers[i]))
-            else:
-                btn.configure(text="")
+            self.set_tile_text(btn, self.puzzle.tiles[i])
             btn.position = i
-            btn.configure(command=lambda b=btn: self.move_tile(b.position))
+            btn.configure(command=lambda b=btn: self.click_tile(b.position))
             btn.grid(row=row, column=col, padx=2, pady=2)
             self.puzzle_tiles.append(btn)
             
     def toggle_pause(self):
         self.game_paused = not self.game_paused
         if self.game_paused:
+            self.scheduler.pause(self.puzzle_timer)
+            if self.puzzle_playback is not None:
+                self.scheduler.pause(self.puzzle_playback)
             self.pause_button.configure(text="▶️ Resume")
             for tile in self.puzzle_tiles:
                 tile.configure(state='disabled', style='Paused.TButton')
         else:
+            self.scheduler.resume(self.puzzle_timer)
+            if self.puzzle_playback is not None:
+                self.scheduler.resume(self.puzzle_playback)
             self.pause_button.configure(text="⏸️ Pause")
             for tile in self.puzzle_tiles:
                 tile.configure(state='normal', style='TButton')
@@ -1660,62 +3131,54 @@ class GameApp:
             style.configure('TButton', background='white')
             style.configure('Moving.TButton', background='lightblue')
             
-    def update_timer(self):
-        if not self.game_paused:
-            mins, secs = divmod(self.game_time, 60)
-            self.timer_label.configure(text=f"Time: {mins}:{secs:02d}")
-            self.game_time += 1
-        self.timer_label.after(1000, self.update_timer)
+    def update_puzzle_timer(self):
+        mins, secs = divmod(self.game_time, 60)
+        self.puzzle_timer_label.configure(text=f"Time: {mins}:{secs:02d}")
+        self.game_time += 1
         
     def reset_puzzle(self):
         self.initialize_puzzle()
         
     def reset_current_puzzle(self):
-        size = int(self.grid_size.get()[0])
-        self.puzzle_numbers = list(range(1, size*size)) + [None]
-        random.shuffle(self.puzzle_numbers)
+        self.stop_puzzle_solver()
+        self.puzzle.shuffle(self.puzzle_level.get().lower())
+        self.puzzle_assisted = False
+        self.puzzle_moves_label.config(text="Moves: 0")
         for i, btn in enumerate(self.puzzle_tiles):
-            if self.puzzle_numbers[i]:
-                btn.configure(text=str(self.puzzle_numbers[i]))
-            else:
-                btn.configure(text="")
+            self.set_tile_text(btn, self.puzzle.tiles[i])
+            
+    def set_tile_text(self, btn, number):
+        btn.configure(text=str(number) if number is not None else "")
 
         
+    def click_tile(self, position):
+        # Tiles are locked while the solver is playing
+        if self.puzzle_playback is None:
+            self.move_tile(position)
+        
     def move_tile(self, position):
-        empty_pos = self.puzzle_numbers.index(None)
-        row, col = position // 4, position % 4
-        empty_row, empty_col = empty_pos // 4, empty_pos % 4
+        empty_pos = self.puzzle.move(position)
+        if self.puzzle_playback is None:
+            self.puzzle_hint_label.config(text="")
         
-        # Check if move is valid (adjacent to empty tile)
-        if (abs(row - empty_row) == 1 and col == empty_col) or \
-           (abs(col - empty_col) == 1 and row == empty_row):
+        # Move is valid if the tile was adjacent to the empty tile
+        if empty_pos is not None:
             
             # Visual feedback for valid move
             self.puzzle_tiles[position].config(style='Moving.TButton')
             self.puzzle_tiles[position].after(100, lambda: self.puzzle_tiles[position].config(style='TButton'))
             
-            # Swap tiles
-            self.puzzle_numbers[position], self.puzzle_numbers[empty_pos] = \
-                self.puzzle_numbers[empty_pos], self.puzzle_numbers[position]
-            
             # Update buttons with animation
             def update_tiles():
-                if self.puzzle_numbers[empty_pos] is not None:
-                    self.puzzle_tiles[empty_pos].config(text=str(self.puzzle_numbers[empty_pos]))
-                else:
-                    self.puzzle_tiles[empty_pos].config(text="")
-                if self.puzzle_numbers[position] is not None:
-                    self.puzzle_tiles[position].config(text=str(self.puzzle_numbers[position]))
-                else:
-                    self.puzzle_tiles[position].config(text="")
+                self.set_tile_text(self.puzzle_tiles[empty_pos], self.puzzle.tiles[empty_pos])
+                self.set_tile_text(self.puzzle_tiles[position], self.puzzle.tiles[position])
             
             self.puzzle_tiles[position].after(50, update_tiles)
             
-            self.puzzle_moves += 1
-            self.puzzle_moves_label.config(text=f"Moves: {self.puzzle_moves}")
+            self.puzzle_moves_label.config(text=f"Moves: {self.puzzle.moves}")
             
             # Check for win with visual feedback
-            if self.check_puzzle_win():
+            if self.puzzle.is_solved():
                 for tile in self.puzzle_tiles:
                     tile.config(style='Winner.TButton')
                 self.puzzle_tiles[0].after(500, lambda: self.puzzle_game_over())
@@ -1724,21 +3187,93 @@ class GameApp:
             self.puzzle_tiles[position].config(style='Invalid.TButton')
             self.puzzle_tiles[position].after(100, lambda: self.puzzle_tiles[position].config(style='TButton'))
 
-    def check_puzzle_win(self):
-        return self.puzzle_numbers[:-1] == list(range(1, 16))
-        
     def puzzle_game_over(self):
+        if self.puzzle_assisted:
+            # Boards finished by the solver do not count
+            messagebox.showinfo("Solved", 
+                              f"The solver finished the puzzle ({self.puzzle.moves} moves in total).")
+            return
+            
         # Save score
-        self.cursor.execute('''
-            INSERT INTO scores (username, game, score, date)
-            VALUES (?, ?, ?, ?)
-        ''', (self.current_user, 'puzzle', self.puzzle_moves, datetime.now()))
-        self.conn.commit()
+        self.record_score('puzzle', self.puzzle.moves, self.puzzle_frame)
         
         messagebox.showinfo("Congratulations!", 
-                          f"You solved the puzzle in {self.puzzle_moves} moves!")
+                          f"You solved the puzzle in {self.puzzle.moves} moves!")
+        
+    def request_puzzle_solution(self, mode, budget=None):
+        # mode is 'hint' (show the next move) or 'solve' (play every move).
+        # Hints try a short search first and only retry with the full budget
+        # when that does not finish.
+        if self.puzzle_future is not None or self.puzzle_playback is not None:
+            return
+        if self.game_paused or self.puzzle.is_solved():
+            return
+        if budget is None:
+            budget = PUZZLE_HINT_BUDGET if mode == 'hint' else PUZZLE_SOLVE_BUDGET
+        self.puzzle_mode = mode
+        self.puzzle_budget = budget
+        self.puzzle_board = list(self.puzzle.tiles)
+        self.puzzle_future = self.get_ai_executor().submit(
+            puzzle_solver.solve, self.puzzle_board, self.puzzle.size, budget)
+        self.puzzle_hint_label.config(text="Thinking...")
+        self.root.after(AI_POLL_MS, self.poll_puzzle_solution)
+        
+    def poll_puzzle_solution(self):
+        future = self.puzzle_future
+        if future is None:
+            return
+        if not future.done():
+            self.root.after(AI_POLL_MS, self.poll_puzzle_solution)
+            return
+        self.puzzle_future = None
+        if not self.puzzle_frame.winfo_exists():
+            return
+            
+        try:
+            solution = future.result()
+        except Exception:
+            solution = None
+        if self.puzzle.tiles != self.puzzle_board:
+            # The board changed while the search ran
+            self.puzzle_hint_label.config(text="")
+            return
+        if solution is None and self.puzzle_budget < PUZZLE_SOLVE_BUDGET:
+            self.request_puzzle_solution(self.puzzle_mode, PUZZLE_SOLVE_BUDGET)
+            return
+        if not solution:
+            self.puzzle_hint_label.config(text="No solution found in time")
+            return
+            
+        if self.puzzle_mode == 'hint':
+            position = solution[0]
+            self.puzzle_hint_label.config(
+                text=f"Hint: move {self.puzzle.tiles[position]} ({len(solution)} moves left)")
+            self.puzzle_tiles[position].config(style='Moving.TButton')
+            self.puzzle_tiles[position].after(600, lambda: self.puzzle_tiles[position].config(style='TButton'))
+        else:
+            self.puzzle_assisted = True
+            self.puzzle_solution = solution
+            self.puzzle_hint_label.config(text=f"Solving: {len(solution)} moves")
+            self.puzzle_playback = self.scheduler.every(PUZZLE_PLAYBACK_INTERVAL, self.play_puzzle_solution,
+                                                        window=self.puzzle_frame.winfo_toplevel())
+            
+    def play_puzzle_solution(self):
+        position = self.puzzle_solution.pop(0)
+        if not self.puzzle_solution:
+            self.stop_puzzle_solver()
+        self.move_tile(position)
+        
+    def stop_puzzle_solver(self):
+        # A search that is still running is ignored when it comes back
+        if self.puzzle_future is not None:
+            self.puzzle_future.cancel()
+            self.puzzle_future = None
+        self.scheduler.cancel(self.puzzle_playback)
+        self.puzzle_playback = None
                     
     def start_word_scramble(self):
+        if not self.word_bank_ready(self.start_word_scramble):
+            return
         game_window = tk.Toplevel(self.root)
         game_window.title("Word Scramble")
         game_window.geometry("400x500")
@@ -1747,24 +3282,7 @@ class GameApp:
         self.scramble_time = 60
         self.game_active = False
         
-        # Word bank with hints
-        self.word_bank = {
-            "python": "A popular programming language named after a snake",
-            "programming": "Writing instructions for computers",
-            "computer": "An electronic device that processes data",
-            "algorithm": "A step-by-step procedure to solve a problem",
-            "database": "A structured collection of data",
-            "interface": "A point where two systems meet and interact",
-            "software": "Programs and other operating information",
-            "developer": "Someone who creates computer programs",
-            "keyboard": "Device used to input text",
-            "function": "A reusable block of code",
-            "variable": "A container for storing data values",
-            "network": "Interconnected computers sharing resources",
-            "security": "Protection against cyber threats",
-            "application": "A program designed for end users",
-            "framework": "A platform for developing software applications"
-        }
+        self.scramble_level = self.add_word_level_selector(game_window)
         
         # Game widgets
         ttk.Label(game_window, text="Unscramble the word:", 
@@ -1796,27 +3314,23 @@ class GameApp:
         ttk.Button(game_window, text="Start Game", 
                   command=self.start_scramble_round).pack(pady=10)
 
-    def scramble_word(self, word):
-        chars = list(word)
-        while ''.join(chars) == word:  # Ensure word is actually scrambled
-            random.shuffle(chars)
-        return ''.join(chars)
-
     def start_scramble_round(self):
         if not self.game_active:
             self.game_active = True
+            self.start_play_clock('scramble', self.scrambled_label)
             self.scramble_score = 0
             self.scramble_time = 60
             self.scramble_score_label.config(text="Score: 0")
             self.scramble_entry.delete(0, tk.END)
             self.scramble_entry.focus()
+            self.scramble_task = self.scheduler.every(1.0, self.update_scramble_timer,
+                                                window=self.scrambled_label.winfo_toplevel(), delay=0)
             self.next_scrambled_word()
-            self.update_scramble_timer()
 
     def show_hint(self):
         if self.game_active:
             # Show hint for current word
-            hint = self.word_bank[self.current_word]
+            hint = self.word_bank.hint(self.current_word) or "No hint for this word"
             self.hint_label.config(text=f"Hint: {hint}")
             # Deduct half a point for using hint
             self.scramble_score -= 0.5
@@ -1824,15 +3338,34 @@ class GameApp:
 
     def next_scrambled_word(self):
         if self.game_active:
-            self.current_word = random.choice(list(self.word_bank.keys()))
-            scrambled = self.scramble_word(self.current_word)
+            level = self.scramble_level.get().lower()
+            if level not in WORD_DIFFICULTIES or not self.word_bank.scramble_levels[level]:
+                level = None
+            # Only a word whose every rotation is another answer needs a redraw
+            scrambled = None
+            for _ in range(10):
+                self.current_word = self.word_bank.sample_scramble(level)
+                if self.current_word is None:
+                    break
+                scrambled = self.word_bank.scramble(self.current_word)
+                if scrambled:
+                    break
+            if not scrambled:
+                # Nothing in the bank can be scrambled at this level
+                self.game_active = False
+                self.scheduler.cancel(self.scramble_task)
+                self.scrambled_label.config(text="")
+                messagebox.showinfo("Word Scramble", "There are no words to scramble at this "
+                                    "level. Add some words or pick another level.",
+                                    parent=self.scrambled_label.winfo_toplevel())
+                return
             self.scrambled_label.config(text=scrambled)
             self.hint_label.config(text="")  # Clear previous hint
 
     def check_scrambled_word(self):
         if self.game_active:
             answer = self.scramble_entry.get().strip().lower()
-            if answer == self.current_word:
+            if self.word_bank.is_anagram(answer, self.current_word):
                 self.scramble_score += 1
                 self.scramble_score_label.config(text=f"Score: {self.scramble_score}")
             self.scramble_entry.delete(0, tk.END)
@@ -1843,17 +3376,13 @@ class GameApp:
             self.scramble_timer_label.config(text=f"Time: {self.scramble_time}")
             if self.scramble_time > 0:
                 self.scramble_time -= 1
-                self.scrambled_label.after(1000, self.update_scramble_timer)
             else:
                 self.game_active = False
+                self.scheduler.cancel(self.scramble_task)
                 self.scrambled_label.config(text="Game Over!")
                 
                 # Save score
-                self.cursor.execute('''
-                    INSERT INTO scores (username, game, score, date)
-                    VALUES (?, ?, ?, ?)
-                ''', (self.current_user, 'scramble', self.scramble_score, datetime.now()))
-                self.conn.commit()
+                self.record_score('scramble', self.scramble_score, self.scrambled_label)
                 
                 messagebox.showinfo("Game Over", 
                                   f"Time's up! Your final score: {self.scramble_score} words",
@@ -1912,11 +3441,13 @@ class GameApp:
     def start_color_round(self):
         if not self.color_active:
             self.color_active = True
+            self.start_play_clock('color_match', self.color_word)
             self.color_score = 0
             self.color_time = 60
             self.color_score_label.config(text="Score: 0")
             self.next_color()
-            self.update_color_timer()
+            self.color_task = self.scheduler.every(1.0, self.update_color_timer,
+                                                window=self.color_word.winfo_toplevel(), delay=0)
 
     def next_color(self):
         if self.color_active:
@@ -1938,17 +3469,13 @@ class GameApp:
             self.color_timer_label.config(text=f"Time: {self.color_time}")
             if self.color_time > 0:
                 self.color_time -= 1
-                self.color_word.after(1000, self.update_color_timer)
             else:
                 self.color_active = False
+                self.scheduler.cancel(self.color_task)
                 self.color_word.config(text="Game Over!")
                 
                 # Save score
-                self.cursor.execute('''
-                    INSERT INTO scores (username, game, score, date)
-                    VALUES (?, ?, ?, ?)
-                ''', (self.current_user, 'color_match', self.color_score, datetime.now()))
-                self.conn.commit()
+                self.record_score('color_match', self.color_score, self.color_word)
                 
                 messagebox.showinfo("Game Over", 
                                   f"Time's up! Your final score: {self.color_score}",
@@ -1992,6 +3519,7 @@ class GameApp:
     def start_pattern_round(self):
         if not self.pattern_active:
             self.pattern_active = True
+            self.start_play_clock('pattern', self.pattern_status)
             self.pattern_score = 0
             self.current_pattern = []
             self.pattern_score_label.config(text="Score: 0")
@@ -2045,11 +3573,7 @@ class GameApp:
         self.pattern_status.config(text="Game Over!")
         
         # Save score
-        self.cursor.execute('''
-            INSERT INTO scores (username, game, score, date)
-            VALUES (?, ?, ?, ?)
-        ''', (self.current_user, 'pattern', self.pattern_score, datetime.now()))
-        self.conn.commit()
+        self.record_score('pattern', self.pattern_score, self.pattern_status)
         
         messagebox.showinfo("Game Over", 
                           f"Game Over! Your score: {self.pattern_score} patterns",
@@ -2088,6 +3612,7 @@ class GameApp:
     def start_reaction_round(self):
         if not self.reaction_active:
             self.reaction_active = True
+            self.start_play_clock('reaction', self.reaction_area)
             self.reaction_scores = []
             self.reaction_area.config(bg='red')
             self.reaction_status.config(text="Wait for green...")
@@ -2144,11 +3669,7 @@ class GameApp:
         avg_score = sum(self.reaction_scores) / len(self.reaction_scores)
         
         # Save score (using average reaction time)
-        self.cursor.execute('''
-            INSERT INTO scores (username, game, score, date)
-            VALUES (?, ?, ?, ?)
-        ''', (self.current_user, 'reaction', round(avg_score), datetime.now()))
-        self.conn.commit()
+        self.record_score('reaction', round(avg_score), self.reaction_area)
         
         messagebox.showinfo("Game Over", 
                           f"Game Over!\nAverage reaction time: {round(avg_score)}ms\n"
@@ -2156,19 +3677,13 @@ class GameApp:
                           parent=self.reaction_area.winfo_toplevel())
 
     def start_hangman(self):
+        if not self.word_bank_ready(self.start_hangman):
+            return
         game_window = tk.Toplevel(self.root)
         game_window.title("Hangman")
         game_window.geometry("400x600")
         
-        self.word_list = [
-            "python", "programming", "computer", "algorithm", "database",
-            "interface", "software", "developer", "keyboard", "function",
-            "variable", "network", "security", "application", "framework"
-        ]
-        
-        self.hangman_tries = 6
-        self.current_hangman_word = ""
-        self.guessed_letters = set()
+        self.hangman_level = self.add_word_level_selector(game_window)
         
         # Game widgets
         self.hangman_canvas = tk.Canvas(game_window, width=200, height=250)
@@ -2185,12 +3700,14 @@ class GameApp:
         letters_frame.pack(pady=10)
         
         # Create letter buttons
+        self.letter_buttons = {}
         row = 0
         col = 0
         for letter in 'abcdefghijklmnopqrstuvwxyz':
             btn = ttk.Button(letters_frame, text=letter.upper(),
                            command=lambda l=letter: self.guess_letter(l))
             btn.grid(row=row, column=col, padx=2, pady=2)
+            self.letter_buttons[letter] = btn
             col += 1
             if col > 6:
                 col = 0
@@ -2205,80 +3722,66 @@ class GameApp:
         self.hangman_canvas.delete("all")
         # Base
         self.hangman_canvas.create_line(40, 230, 160, 230)
-        if self.hangman_tries < 6:  # Pole
+        if self.hangman.tries < 6:  # Pole
             self.hangman_canvas.create_line(100, 230, 100, 50)
-        if self.hangman_tries < 5:  # Top
+        if self.hangman.tries < 5:  # Top
             self.hangman_canvas.create_line(100, 50, 140, 50)
-        if self.hangman_tries < 4:  # Rope
+        if self.hangman.tries < 4:  # Rope
             self.hangman_canvas.create_line(140, 50, 140, 70)
-        if self.hangman_tries < 3:  # Head
+        if self.hangman.tries < 3:  # Head
             self.hangman_canvas.create_oval(130, 70, 150, 90)
-        if self.hangman_tries < 2:  # Body
+        if self.hangman.tries < 2:  # Body
             self.hangman_canvas.create_line(140, 90, 140, 150)
             self.hangman_canvas.create_line(140, 110, 120, 130)  # Arms
             self.hangman_canvas.create_line(140, 110, 160, 130)
-        if self.hangman_tries < 1:  # Legs
+        if self.hangman.tries < 1:  # Legs
             self.hangman_canvas.create_line(140, 150, 120, 180)
             self.hangman_canvas.create_line(140, 150, 160, 180)
 
     def start_hangman_round(self):
-        self.current_hangman_word = random.choice(self.word_list)
-        self.guessed_letters = set()
-        self.hangman_tries = 6
+        self.start_play_clock('hangman', self.hangman_canvas)
+        self.hangman = HangmanGame(self.pick_word(self.hangman_level))
+        self.tries_label.config(text=f"Tries left: {self.hangman.tries}")
         self.update_word_display()
         self.draw_hangman()
         
         # Reset letter buttons
-        for widget in self.word_display.master.winfo_children():
-            if isinstance(widget, ttk.Frame):
-                for button in widget.winfo_children():
-                    button.configure(state='normal')
+        for button in self.letter_buttons.values():
+            button.configure(state='normal')
 
     def update_word_display(self):
-        display = ""
-        for letter in self.current_hangman_word:
-            if letter in self.guessed_letters:
-                display += letter.upper() + " "
-            else:
-                display += "_ "
-        self.word_display.config(text=display.strip())
+        self.word_display.config(text=self.hangman.masked())
 
     def guess_letter(self, letter):
-        if letter not in self.guessed_letters:
-            self.guessed_letters.add(letter)
-            
-            # Disable the button
-            for widget in self.word_display.master.winfo_children():
-                if isinstance(widget, ttk.Frame):
-                    for button in widget.winfo_children():
-                        if button['text'].lower() == letter:
-                            button.configure(state='disabled')
-            
-            if letter not in self.current_hangman_word:
-                self.hangman_tries -= 1
-                self.tries_label.config(text=f"Tries left: {self.hangman_tries}")
-                self.draw_hangman()
-                
-                if self.hangman_tries == 0:
-                    self.hangman_game_over(False)
+        hit = self.hangman.guess(letter)
+        if hit is None:
+            return
             
-            self.update_word_display()
+        # Disable the button
+        self.letter_buttons[letter].configure(state='disabled')
+        
+        if not hit:
+            self.tries_label.config(text=f"Tries left: {self.hangman.tries}")
+            self.draw_hangman()
             
-            # Check for win
-            if all(letter in self.guessed_letters for letter in self.current_hangman_word):
-                self.hangman_game_over(True)
+            if self.hangman.lost:
+                self.hangman_game_over(False)
+        
+        self.update_word_display()
+        
+        # Check for win
+        if self.hangman.won:
+            self.hangman_game_over(True)
 
     def hangman_game_over(self, won):
-        score = len(self.guessed_letters) if won else 0
+        score = len(self.hangman.guessed) if won else 0
+        for button in self.letter_buttons.values():
+            button.configure(state='disabled')
         
         # Save score
-        self.cursor.execute('''
-            INSERT INTO scores (username, game, score, date)
-            VALUES (?, ?, ?, ?)
-        ''', (self.current_user, 'hangman', score, datetime.now()))
-        self.conn.commit()
+        self.record_score('hangman', score, self.hangman_canvas)
         
-        message = "Congratulations! You won!" if won else f"Game Over! The word was: {self.current_hangman_word}"
+        message = "Congratulations! You won!" if won else f"Game Over! The word was: {self.hangman.word}"
         messagebox.showinfo("Game Over", message,
                           parent=self.word_display.winfo_toplevel())
 
@@ -2317,6 +3820,7 @@ class GameApp:
     def start_math_round(self):
         if not self.math_active:
             self.math_active = True
+            self.start_play_clock('math_quiz', self.math_score_label)
             self.math_score = 0
             self.total_questions = 0
             self.math_time = 60
@@ -2324,7 +3828,8 @@ class GameApp:
             self.math_entry.delete(0, tk.END)
             self.math_entry.focus()
             self.next_question()
-            self.update_math_timer()
+            self.math_task = self.scheduler.every(1.0, self.update_math_timer,
+                                                window=self.question_label.winfo_toplevel(), delay=0)
 
     def next_question(self):
         if self.math_active:
@@ -2369,20 +3874,16 @@ class GameApp:
             self.math_timer_label.config(text=f"Time: {self.math_time}")
             if self.math_time > 0:
                 self.math_time -= 1
-                self.question_label.after(1000, self.update_math_timer)
             else:
                 self.math_active = False
+                self.scheduler.cancel(self.math_task)
                 self.question_label.config(text="Game Over!")
                 
                 # Calculate accuracy percentage
                 accuracy = (self.math_score / self.total_questions * 100) if self.total_questions > 0 else 0
                 
                 # Save score
-                self.cursor.execute('''
-                    INSERT INTO scores (username, game, score, date)
-                    VALUES (?, ?, ?, ?)
-                ''', (self.current_user, 'math_quiz', self.math_score, datetime.now()))
-                self.conn.commit()
+                self.record_score('math_quiz', self.math_score, self.math_score_label)
                 
                 messagebox.showinfo("Game Over", 
                                   f"Time's up!\nFinal Score: {self.math_score}/{self.total_questions}\n"
@@ -2394,15 +3895,24 @@ class GameApp:
         game_window.title("Tic Tac Toe")
         game_window.geometry("400x500")
         
-        self.current_player = 'X'
-        self.board = [''] * 9
-        self.game_over = False
-        self.moves_made = 0
+        self.start_play_clock('tictactoe', game_window)
+        self.tictactoe = TicTacToe()
         
         # Game widgets
         ttk.Label(game_window, text="Tic Tac Toe", 
                  font=('Arial', 16, 'bold')).pack(pady=10)
         
+        # Opponent selector (the computer plays O)
+        opponent_frame = ttk.Frame(game_window)
+        opponent_frame.pack(pady=5)
+        ttk.Label(opponent_frame, text="Opponent:").pack(side='left', padx=5)
+        self.tictactoe_opponent = ttk.Combobox(opponent_frame, 
+                                             values=['Two Players', 'Easy', 'Medium', 'Hard'], 
+                                             width=12, state='readonly')
+        self.tictactoe_opponent.set('Two Players')
+        self.tictactoe_opponent.pack(side='left', padx=5)
+        self.tictactoe_opponent.bind('<<ComboboxSelected>>', lambda e: self.reset_board())
+        
         self.status_label = ttk.Label(game_window, 
                                     text="Player X's turn", 
                                     font=('Arial', 12))
@@ -2424,46 +3934,47 @@ class GameApp:
         ttk.Button(game_window, text="New Game", 
                   command=self.reset_board).pack(pady=10)
 
+    def tictactoe_difficulty(self):
+        # None in two-player mode, otherwise the computer's difficulty
+        opponent = self.tictactoe_opponent.get().lower()
+        return opponent if opponent in tictactoe_ai.DIFFICULTIES else None
+
     def make_move(self, position):
-        if not self.game_over and self.board[position] == '':
-            self.board[position] = self.current_player
-            self.buttons[position].config(text=self.current_player)
-            self.moves_made += 1
-            
-            if self.check_winner():
-                self.game_over = True
-                self.status_label.config(text=f"Player {self.current_player} wins!")
-                self.save_tictactoe_score(True)
-            elif self.moves_made == 9:
-                self.game_over = True
-                self.status_label.config(text="It's a draw!")
-                self.save_tictactoe_score(False)
-            else:
-                self.current_player = 'O' if self.current_player == 'X' else 'X'
-                self.status_label.config(text=f"Player {self.current_player}'s turn")
-
-    def check_winner(self):
-        # Check rows, columns and diagonals
-        win_combinations = [
-            [0, 1, 2], [3, 4, 5], [6, 7, 8],  # Rows
-            [0, 3, 6], [1, 4, 7], [2, 5, 8],  # Columns
-            [0, 4, 8], [2, 4, 6]  # Diagonals
-        ]
+        difficulty = self.tictactoe_difficulty()
+        if difficulty and self.tictactoe.current_player == 'O':
+            return
+        self.play_tictactoe(position)
         
-        for combo in win_combinations:
-            if (self.board[combo[0]] == self.board[combo[1]] == 
-                self.board[combo[2]] == self.current_player):
-                # Highlight winning combination
-                for pos in combo:
-                    self.buttons[pos].config(bg='lightgreen')
-                return True
-        return False
+        # The computer answers straight away from its precomputed table
+        if difficulty and not self.tictactoe.over and self.tictactoe.current_player == 'O':
+            self.play_tictactoe(tictactoe_ai.choose_move(self.tictactoe.board, difficulty))
+
+    def play_tictactoe(self, position):
+        player = self.tictactoe.current_player
+        if not self.tictactoe.play(position):
+            return
+        self.buttons[position].config(text=player)
+        
+        if self.tictactoe.winner:
+            # Highlight winning combination
+            for pos in self.tictactoe.winning_line:
+                self.buttons[pos].config(bg='lightgreen')
+            if self.tictactoe_difficulty():
+                won = player == 'X'
+                self.status_label.config(text="You win!" if won else "Computer wins!")
+            else:
+                won = True
+                self.status_label.config(text=f"Player {player} wins!")
+            self.save_tictactoe_score(won)
+        elif self.tictactoe.over:
+            self.status_label.config(text="It's a draw!")
+            self.save_tictactoe_score(False)
+        else:
+            self.status_label.config(text=f"Player {self.tictactoe.current_player}'s turn")
 
     def reset_board(self):
-        self.current_player = 'X'
-        self.board = [''] * 9
-        self.game_over = False
-        self.moves_made = 0
+        self.start_play_clock('tictactoe', self.status_label)
+        self.tictactoe.reset()
         self.status_label.config(text="Player X's turn")
         
         for button in self.buttons:
@@ -2471,20 +3982,16 @@ class GameApp:
 
     def save_tictactoe_score(self, won):
         score = 1 if won else 0
-        self.cursor.execute('''
-            INSERT INTO scores (username, game, score, date)
-            VALUES (?, ?, ?, ?)
-        ''', (self.current_user, 'tictactoe', score, datetime.now()))
-        self.conn.commit()
+        self.record_score('tictactoe', score, self.status_label)
 
     def start_2048(self):
         game_window = tk.Toplevel(self.root)
         game_window.title("2048")
-        game_window.geometry("400x500")
+        game_window.geometry("400x580")
         
-        self.score_2048 = 0
-        self.board_2048 = [[0] * 4 for _ in range(4)]
-        self.game_2048_over = False
+        self.game_2048 = Game2048()
+        self.autoplay_2048 = False
+        self.ai_2048_future = None
         
         # Game widgets
         ttk.Label(game_window, text="2048", font=('Arial', 24, 'bold')).pack(pady=10)
@@ -2514,27 +4021,167 @@ class GameApp:
         game_window.bind('<Up>', lambda e: self.move_2048('up'))
         game_window.bind('<Down>', lambda e: self.move_2048('down'))
         
+        # Hint and autoplay controls
+        ai_frame = ttk.Frame(game_window)
+        ai_frame.pack(pady=5)
+        ttk.Button(ai_frame, text="💡 Hint", 
+                  command=self.request_2048_move).pack(side='left', padx=5)
+        self.autoplay_button_2048 = ttk.Button(ai_frame, text="▶️ Autoplay", 
+                                             command=self.toggle_2048_autoplay)
+        self.autoplay_button_2048.pack(side='left', padx=5)
+        
+        self.hint_label_2048 = ttk.Label(game_window, text="", font=('Arial', 12))
+        self.hint_label_2048.pack(pady=5)
+        
         ttk.Button(game_window, text="New Game", 
                   command=self.new_game_2048).pack(pady=10)
         
+        game_window.bind('<Destroy>', 
+                        lambda e: self.stop_2048_autoplay() if e.widget is game_window else None)
+        
         self.new_game_2048()
         
     def new_game_2048(self):
-        self.score_2048 = 0
-        self.game_2048_over = False
-        self.board_2048 = [[0] * 4 for _ in range(4)]
+        self.start_play_clock('2048', self.board_frame_2048)
+        self.stop_2048_autoplay()
+        self.game_2048.reset()
         self.score_label_2048.config(text="Score: 0")
-        self.add_new_tile()
-        self.add_new_tile()
+        self.hint_label_2048.config(text="")
         self.update_board_2048()
         
-    def add_new_tile(self):
-        empty_cells = [(i, j) for i in range(4) for j in range(4) 
-                      if self.board_2048[i][j] == 0]
-        if empty_cells:
-            i, j = random.choice(empty_cells)
-            self.board_2048[i][j] = 2 if random.random() < 0.9 else 4
+    def load_word_bank(self):
+        # Reads and indexes the bank on a background thread; poll_word_bank
+        # hands it to the Tk thread
+        if self.word_bank is not None or self.word_bank_loader is not None:
+            return
+        self.word_bank_loader = queue.Queue()
+        def load(loader=self.word_bank_loader):
+            try:
+                loader.put(read_word_bank(DB_PATH))
+            except Exception:
+                log.exception("Loading the word bank in the background failed")
+                loader.put(None)
+        threading.Thread(target=load, name='word-bank', daemon=True).start()
+        self.root.after(WORD_BANK_POLL_MS, self.poll_word_bank)
+
+    def poll_word_bank(self):
+        try:
+            bank = self.word_bank_loader.get_nowait()
+        except queue.Empty:
+            self.root.after(WORD_BANK_POLL_MS, self.poll_word_bank)
+            return
+        self.word_bank_loader = None
+        if bank is None:
+            # Try again here so the word games still open
+            bank = WordBank(self.conn)
+        else:
+            bank.attach(self.conn)
+        self.word_bank = bank
+        waiting, self.word_bank_waiting = self.word_bank_waiting, []
+        for callback in waiting:
+            callback()
+
+    def word_bank_ready(self, opener):
+        # True when the bank is loaded. Otherwise opener (a word game's
+        # start method) is called again once it is, and False is returned.
+        if self.word_bank is not None:
+            return True
+        if opener not in self.word_bank_waiting:
+            self.word_bank_waiting.append(opener)
+        self.load_word_bank()
+        return False
+
+    def pick_word(self, combobox):
+        # Random word at the level picked in a word game's Level box, or any
+        # word if the bank has none at that level
+        level = combobox.get().lower()
+        if level in WORD_DIFFICULTIES:
+            word = self.word_bank.sample(level)
+            if word:
+                return word
+        return self.word_bank.sample()
+
+    def add_word_level_selector(self, parent):
+        frame = ttk.Frame(parent)
+        frame.pack(pady=5)
+        ttk.Label(frame, text="Level:").pack(side='left', padx=5)
+        combobox = ttk.Combobox(frame, values=['Any', 'Easy', 'Medium', 'Hard'], 
+                                width=8, state='readonly')
+        combobox.set('Any')
+        combobox.pack(side='left', padx=5)
+        return combobox
+
+    def get_ai_executor(self):
+        # Searches run in a separate process so the Tk thread never blocks
+        if self.ai_executor is None:
+            self.ai_executor = futures.ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context('spawn'),
+                initializer=ai_2048.warm_up)
+        return self.ai_executor
+        
+    def request_2048_move(self):
+        if self.game_2048.over or self.ai_2048_future is not None:
+            return
+        self.ai_2048_board = self.game_2048.bits
+        self.ai_2048_future = self.get_ai_executor().submit(
+            ai_2048.best_move, self.ai_2048_board, AI_2048_DEPTH, AI_2048_TIME_BUDGET)
+        if not self.autoplay_2048:
+            self.hint_label_2048.config(text="Thinking...")
+        self.root.after(AI_POLL_MS, self.poll_2048_move)
+        
+    def poll_2048_move(self):
+        future = self.ai_2048_future
+        if future is None:
+            return
+        if not future.done():
+            self.root.after(AI_POLL_MS, self.poll_2048_move)
+            return
+        self.ai_2048_future = None
+        if not self.board_frame_2048.winfo_exists():
+            return
+            
+        try:
+            direction = future.result()
+        except Exception:
+            self.stop_2048_autoplay()
+            self.hint_label_2048.config(text="Hint unavailable")
+            return
+            
+        if self.game_2048.bits != self.ai_2048_board:
+            # The board changed while the search ran, so the answer is stale
+            if self.autoplay_2048:
+                self.request_2048_move()
+            return
+        if direction is None:
+            self.stop_2048_autoplay()
+            self.hint_label_2048.config(text="No moves left")
+            return
+            
+        if self.autoplay_2048:
+            self.move_2048(direction)
+            if self.autoplay_2048:
+                self.request_2048_move()
+        else:
+            self.hint_label_2048.config(text=f"Hint: {ARROWS[direction]} {direction.title()}")
+            
+    def toggle_2048_autoplay(self):
+        if self.autoplay_2048:
+            self.stop_2048_autoplay()
+        else:
+            self.autoplay_2048 = True
+            self.autoplay_button_2048.config(text="⏹️ Stop")
+            self.hint_label_2048.config(text="Autoplay")
+            self.request_2048_move()
             
+    def stop_2048_autoplay(self):
+        # A search that is still running is ignored when it comes back
+        self.autoplay_2048 = False
+        if self.ai_2048_future is not None:
+            self.ai_2048_future.cancel()
+            self.ai_2048_future = None
+        if self.autoplay_button_2048.winfo_exists():
+            self.autoplay_button_2048.config(text="▶️ Autoplay")
+        
     def update_board_2048(self):
         colors = {
             0: ('#CCC0B3', '#776E65'),
@@ -2551,9 +4198,10 @@ class GameApp:
             2048: ('#EDC22E', '#F9F6F2')
         }
         
+        board = self.game_2048.board
         for i in range(4):
             for j in range(4):
-                value = self.board_2048[i][j]
+                value = board[i][j]
                 bg_color = colors.get(value, colors[0])[0]
                 fg_color = colors.get(value, colors[0])[1]
                 self.cells_2048[i][j].config(
@@ -2563,86 +4211,25 @@ class GameApp:
                 )
                 
     def move_2048(self, direction):
-        if self.game_2048_over:
+        if self.game_2048.over:
             return
             
-        # Store the current board state
-        old_board = [row[:] for row in self.board_2048]
-        
-        # Merge tiles
-        if direction == 'left':
-            self.merge_left()
-        elif direction == 'right':
-            self.reverse_board()
-            self.merge_left()
-            self.reverse_board()
-        elif direction == 'up':
-            self.transpose_board()
-            self.merge_left()
-            self.transpose_board()
-        else:  # down
-            self.transpose_board()
-            self.reverse_board()
-            self.merge_left()
-            self.reverse_board()
-            self.transpose_board()
-            
-        # Check if board changed
-        if any(old_board[i][j] != self.board_2048[i][j] 
-               for i in range(4) for j in range(4)):
-            self.add_new_tile()
-            
+        self.game_2048.step(direction)
+        self.score_label_2048.config(text=f"Score: {self.game_2048.score}")
+        if not self.autoplay_2048:
+            self.hint_label_2048.config(text="")
         self.update_board_2048()
         
         # Check for game over
-        if self.is_game_over():
-            self.game_2048_over = True
+        if self.game_2048.over:
+            self.stop_2048_autoplay()
             self.save_2048_score()
             messagebox.showinfo("Game Over", 
-                              f"Game Over! Final Score: {self.score_2048}",
+                              f"Game Over! Final Score: {self.game_2048.score}",
                               parent=self.board_frame_2048.winfo_toplevel())
             
-    def merge_left(self):
-        for i in range(4):
-            # Merge same numbers
-            line = [n for n in self.board_2048[i] if n != 0]
-            for j in range(len(line) - 1):
-                if line[j] == line[j + 1]:
-                    line[j] *= 2
-                    self.score_2048 += line[j]
-                    line[j + 1] = 0
-            line = [n for n in line if n != 0]
-            # Fill with zeros
-            line.extend([0] * (4 - len(line)))
-            self.board_2048[i] = line
-            self.score_label_2048.config(text=f"Score: {self.score_2048}")
-            
-    def reverse_board(self):
-        for i in range(4):
-            self.board_2048[i].reverse()
-            
-    def transpose_board(self):
-        self.board_2048 = list(map(list, zip(*self.board_2048)))
-        
-    def is_game_over(self):
-        # Check for empty cells
-        if any(0 in row for row in self.board_2048):
-            return False
-            
-        # Check for possible merges
-        for i in range(4):
-            for j in range(3):
-                if (self.board_2048[i][j] == self.board_2048[i][j + 1] or
-                    self.board_2048[j][i] == self.board_2048[j + 1][i]):
-                    return False
-        return True
-        
     def save_2048_score(self):
-        self.cursor.execute('''
-            INSERT INTO scores (username, game, score, date)
-            VALUES (?, ?, ?, ?)
-        ''', (self.current_user, '2048', self.score_2048, datetime.now()))
-        self.conn.commit()
+        self.record_score('2048', self.game_2048.score, self.board_frame_2048)
 
     def update_welcome_message(self):
         self.welcome_label.config(text=f"Welcome, {self.current_user}!")
@@ -2657,6 +4244,10 @@ class GameApp:
             ''', (self.current_user, task, False, datetime.now()))
             self.conn.commit()
             self.todo_entry.delete(0, tk.END)
+            self.events.publish('todo', username=self.current_user)
+
+    def on_todo_changed(self, username):
+        if self.current_frame == 'utilities':
             self.update_todo_list()
 
     def update_todo_list(self):
@@ -2677,49 +4268,58 @@ class GameApp:
             messagebox.showinfo("Success", "Note saved successfully!")
 
     def start_timer(self):
-        if not hasattr(self, 'timer_running'):
-            self.timer_running = True
+        if self.pomodoro_task is None:
             self.remaining_time = 25 * 60  # 25 minutes in seconds
-            self.update_timer()
+            self.pomodoro_task = self.scheduler.every(1.0, self.update_timer, delay=0)
+        else:
+            self.scheduler.resume(self.pomodoro_task)
 
     def stop_timer(self):
-        if hasattr(self, 'timer_running'):
-            self.timer_running = False
+        if self.pomodoro_task is not None:
+            self.scheduler.pause(self.pomodoro_task)
 
     def reset_timer(self):
-        self.timer_running = False
+        self.scheduler.cancel(self.pomodoro_task)
+        self.pomodoro_task = None
         self.remaining_time = 25 * 60
         self.timer_label.config(text="25:00")
 
     def update_timer(self):
-        if hasattr(self, 'timer_running') and self.timer_running:
-            minutes = self.remaining_time // 60
-            seconds = self.remaining_time % 60
-            self.timer_label.config(text=f"{minutes:02d}:{seconds:02d}")
-            
-            if self.remaining_time > 0:
-                self.remaining_time -= 1
-                self.root.after(1000, self.update_timer)
-            else:
-                self.timer_running = False
-                messagebox.showinfo("Time's Up!", "Pomodoro session completed!")
-                self.timer_label.config(text="25:00")
+        minutes = self.remaining_time // 60
+        seconds = self.remaining_time % 60
+        self.timer_label.config(text=f"{minutes:02d}:{seconds:02d}")
+        
+        if self.remaining_time > 0:
+            self.remaining_time -= 1
+        else:
+            self.reset_timer()
+            messagebox.showinfo("Time's Up!", "Pomodoro session completed!")
 
     def update_stats(self):
+        # Shown straight away, and again once queued scores are committed
+        saving = self.score_recorder.unsaved() > 0
+        self.render_stats(saving)
+        if saving:
+            self.when_scores_saved(lambda: self.render_stats(False))
+
+    def render_stats(self, saving):
+        if self.current_user is None:
+            return
         self.stats_text.delete("1.0", tk.END)
         
         # Get game scores
-        self.cursor.execute('''
-            SELECT game, COUNT(*) as games_played, MIN(score) as best_score
-            FROM scores WHERE username=?
-            GROUP BY game
-        ''', (self.current_user,))
+        self.cursor.execute(APP_QUERIES['user_game_summary'], (self.current_user,))
         
         stats = "Game Statistics:\n\n"
-        for game, played, best in self.cursor.fetchall():
+        if saving:
+            stats += "(Recent games are still being saved and may be missing)\n\n"
+        for game, played, high, low, total_time in self.cursor.fetchall():
+            best = low if game in LOWER_IS_BETTER else high
+            mins, secs = divmod(total_time or 0, 60)
             stats += f"{game.title()}:\n"
             stats += f"Games Played: {played}\n"
-            stats += f"Best Score: {best}\n\n"
+            stats += f"Best Score: {best}\n"
+            stats += f"Time Played: {mins}:{secs:02d}\n\n"
             
         self.stats_text.insert("1.0", stats)
 
@@ -2742,8 +4342,15 @@ class GameApp:
 
     def run(self):
         self.root.mainloop()
+        if self.word_importer is not None:
+            self.word_importer.cancel(timeout=10)
+        if self.ai_executor is not None:
+            self.ai_executor.shutdown(wait=False, cancel_futures=True)
+        if self.credential_executor is not None:
+            self.credential_executor.shutdown(wait=True, cancel_futures=True)
+        self.score_recorder.shutdown()
         self.conn.close()
 
 if __name__ == "__main__":
-    app = GameApp()
+    app = GameApp(startup_report='--startup-report' in sys.argv)
     app.run()
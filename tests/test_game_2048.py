@@ -0,0 +1,102 @@
+"""Packed 2048 moves against the original list implementation."""
+import random
+
+from engines import game_2048
+from engines.game_2048 import DIRECTIONS, Game2048
+
+
+def merge_left(board):
+    # The list version the game used before the packed board
+    score = 0
+    rows = []
+    for row in board:
+        line = [n for n in row if n != 0]
+        for j in range(len(line) - 1):
+            if line[j] == line[j + 1]:
+                line[j] *= 2
+                score += line[j]
+                line[j + 1] = 0
+        line = [n for n in line if n != 0]
+        line.extend([0] * (4 - len(line)))
+        rows.append(line)
+    return rows, score
+
+
+def reverse(board):
+    return [row[::-1] for row in board]
+
+
+def transpose(board):
+    return [list(row) for row in zip(*board)]
+
+
+def list_move(board, direction):
+    if direction == 'left':
+        return merge_left(board)
+    if direction == 'right':
+        rows, score = merge_left(reverse(board))
+        return reverse(rows), score
+    if direction == 'up':
+        rows, score = merge_left(transpose(board))
+        return transpose(rows), score
+    rows, score = merge_left(reverse(transpose(board)))
+    return transpose(reverse(rows)), score
+
+
+def list_game_over(board):
+    if any(0 in row for row in board):
+        return False
+    for i in range(4):
+        for j in range(3):
+            if board[i][j] == board[i][j + 1] or board[j][i] == board[j + 1][i]:
+                return False
+    return True
+
+
+def random_board(rng):
+    # Exponents up to 14, so every merge stays within the 32768 cap
+    return [[rng.choice([0, 0, 0] + [1 << k for k in range(1, 15)]) for _ in range(4)]
+            for _ in range(4)]
+
+
+def test_moves_match_list_version():
+    rng = random.Random(2048)
+    for _ in range(20000):
+        rows = random_board(rng)
+        board = game_2048.from_rows(rows)
+        for direction in DIRECTIONS:
+            expected_rows, expected_score = list_move(rows, direction)
+            moved, score = game_2048.move(board, direction)
+            assert game_2048.to_rows(moved) == expected_rows, (rows, direction)
+            assert score == expected_score, (rows, direction)
+        assert game_2048.is_game_over(board) == list_game_over(rows), rows
+
+
+def test_played_games_match_list_version():
+    # Whole games, so the boards are the kind that actually come up
+    rng = random.Random(4)
+    for seed in range(50):
+        game = Game2048(rng=random.Random(seed))
+        rows = game.board
+        while not game.over:
+            direction = rng.choice(DIRECTIONS)
+            expected_rows, _ = list_move(rows, direction)
+            score = game.score
+            moved = game.apply(direction)
+            assert game.board == expected_rows
+            assert moved == (expected_rows != rows)
+            assert game.score - score == list_move(rows, direction)[1]
+            if moved:
+                game.spawn_tile()
+            game.over = game.is_game_over()
+            assert game.over == list_game_over(game.board)
+            rows = game.board
+
+
+def test_32768_is_the_largest_tile():
+    board = game_2048.from_rows([[32768, 32768, 0, 0], [0] * 4, [0] * 4, [0] * 4])
+    moved, score = game_2048.move(board, 'left')
+    assert moved == board and score == 0
+    board = game_2048.from_rows([[16384, 16384, 0, 0], [0] * 4, [0] * 4, [0] * 4])
+    moved, score = game_2048.move(board, 'left')
+    assert game_2048.to_rows(moved)[0] == [32768, 0, 0, 0] and score == 32768
@@ -0,0 +1,21 @@
+"""Hangman engine guesses."""
+from engines.hangman import HangmanGame
+
+
+def test_guesses_after_a_loss_are_ignored():
+    game = HangmanGame('ab', tries=2)
+    assert game.guess('x') is False
+    assert game.guess('y') is False
+    assert game.lost
+    assert game.guess('z') is None
+    assert game.guess('a') is None
+    assert game.tries == 0
+
+
+def test_guesses_after_a_win_are_ignored():
+    game = HangmanGame('ab')
+    assert game.guess('a') is True
+    assert game.guess('b') is True
+    assert game.won
+    assert game.guess('c') is None
+    assert game.tries == 6
@@ -0,0 +1,19 @@
+"""Pattern database loading."""
+import pytest
+
+from engines import puzzle_pdb, puzzle_solver
+
+
+@pytest.mark.parametrize('contents', [b'', b'PDB1\x04\x03', b'junk' * 100])
+def test_damaged_file_falls_back_to_linear_conflict(tmp_path, monkeypatch, contents):
+    path = tmp_path / 'puzzle_pdb_4.bin'
+    path.write_bytes(contents)
+    monkeypatch.setattr(puzzle_pdb, 'path_for', lambda size: str(path))
+    monkeypatch.setattr(puzzle_pdb, '_loaded', {})
+    assert puzzle_pdb.load(4) is None
+    # Remembered, not retried on every call
+    path.unlink()
+    assert puzzle_pdb.load(4) is None and 4 in puzzle_pdb._loaded
+
+    tiles = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, None, 15]
+    assert puzzle_solver.solve(tiles, 4) == [15]
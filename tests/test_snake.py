@@ -0,0 +1,42 @@
+"""Snake engine start position and movement."""
+import random
+
+import pytest
+
+from engines.snake import SnakeGame
+
+
+@pytest.mark.parametrize('start_length', [1, 3, 10, 12, 19, 20])
+def test_start_body_fits_the_board(start_length):
+    game = SnakeGame(40, 40, start_length, 1, rng=random.Random(0))
+    assert len(game.body) == start_length
+    assert all(0 <= x < 40 and 0 <= y < 40 for x, y in game.body)
+    assert len(game.free) + len(game.body) + len(game.food) == 40 * 40
+    # At least half the row is ahead of the head
+    assert game.step().alive
+
+
+@pytest.mark.parametrize('start_length', [0, 21, 40, 800])
+def test_start_length_that_does_not_fit_is_rejected(start_length):
+    with pytest.raises(ValueError):
+        SnakeGame(40, 40, start_length, 1)
+
+
+def test_runs_into_the_wall_at_the_end_of_the_row():
+    game = SnakeGame(40, 40, 20, 0)
+    steps = 0
+    while game.step().alive:
+        steps += 1
+    assert steps == 40 - 20
+
+
+def test_two_quick_turns_are_taken_on_consecutive_ticks():
+    game = SnakeGame(40, 40, 3, 0)
+    game.queue_direction('Up')
+    game.queue_direction('Left')
+    head = game.body[0]
+    game.step()
+    assert game.direction == 'Up' and game.body[0] == (head[0], head[1] - 1)
+    game.step()
+    assert game.direction == 'Left' and game.body[0] == (head[0] - 1, head[1] - 1)
+    assert not game.movement_queue
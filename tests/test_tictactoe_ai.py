@@ -0,0 +1,146 @@
+"""The precomputed Tic Tac Toe table against a plain minimax search."""
+import random
+
+import pytest
+
+from engines import tictactoe_ai
+from engines.tictactoe import WIN_COMBINATIONS
+
+
+def winner(board):
+    for a, b, c in WIN_COMBINATIONS:
+        if board[a] and board[a] == board[b] == board[c]:
+            return board[a]
+    return None
+
+
+def minimax(board, mark):
+    # Best score for mark to move, scored like the table: 10 - moves
+    # already made for a win, 0 for a draw, negated for the other side
+    filled = 9 - board.count('')
+    best = None
+    for position in range(9):
+        if board[position]:
+            continue
+        board[position] = mark
+        if winner(board):
+            value = 10 - filled
+        elif filled == 8:
+            value = 0
+        else:
+            value = -minimax(board, 'O' if mark == 'X' else 'X')
+        board[position] = ''
+        if best is None or value > best:
+            best = value
+    return best
+
+
+def brute_force_scores(board):
+    mark = 'X' if board.count('X') == board.count('O') else 'O'
+    filled = 9 - board.count('')
+    scores = {}
+    for position in range(9):
+        if board[position]:
+            continue
+        board[position] = mark
+        if winner(board):
+            scores[position] = 10 - filled
+        elif filled == 8:
+            scores[position] = 0
+        else:
+            scores[position] = -minimax(board, 'O' if mark == 'X' else 'X')
+        board[position] = ''
+    return scores
+
+
+def reachable_positions():
+    # Every position that can come up in a game and still has a move left
+    seen = set()
+    stack = [('',) * 9]
+    while stack:
+        board = stack.pop()
+        if board in seen or winner(board) or '' not in board:
+            continue
+        seen.add(board)
+        mark = 'X' if board.count('X') == board.count('O') else 'O'
+        for position in range(9):
+            if not board[position]:
+                stack.append(board[:position] + (mark,) + board[position + 1:])
+    return seen
+
+
+POSITIONS = sorted(reachable_positions())
+
+
+@pytest.fixture(scope='module')
+def monkeypatch_module(tmp_path_factory):
+    # The cached table goes to a temporary directory, not the user's cache
+    cache = tmp_path_factory.mktemp('cache')
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(tictactoe_ai, 'cache_dir', lambda: str(cache))
+        yield patch
+
+
+@pytest.fixture(scope='module', params=['solved', 'loaded'])
+def table(request, monkeypatch_module):
+    # Check both a fresh solve and whatever load() returns (possibly the
+    # cached file)
+    if request.param == 'solved':
+        monkeypatch_module.setattr(tictactoe_ai, '_table', tictactoe_ai.solve())
+    else:
+        monkeypatch_module.setattr(tictactoe_ai, '_table', None)
+    return tictactoe_ai.load()
+
+
+def test_every_position_matches_minimax(table):
+    assert len(POSITIONS) == 4520
+    for board in POSITIONS:
+        assert tictactoe_ai.move_scores(list(board)) == brute_force_scores(list(board)), board
+
+
+def test_table_has_one_entry_per_symmetry_class(table):
+    assert len(table) == 627
+
+
+def test_hard_opponent_never_loses():
+    rng = random.Random(17)
+    for _ in range(200):
+        board = [''] * 9
+        mark = 'X'
+        while not winner(board) and '' in board:
+            if mark == 'O':
+                position = tictactoe_ai.choose_move(board, 'hard', rng)
+            else:
+                position = rng.choice([i for i in range(9) if not board[i]])
+            board[position] = mark
+            mark = 'O' if mark == 'X' else 'X'
+        assert winner(board) != 'X'
+
+
+@pytest.mark.parametrize('damage', ['truncate', 'flip_score', 'flip_checksum'])
+def test_damaged_cache_file_is_rebuilt(tmp_path, monkeypatch, damage):
+    monkeypatch.setattr(tictactoe_ai, 'cache_dir', lambda: str(tmp_path / 'cache'))
+    monkeypatch.setattr(tictactoe_ai, '_table', None)
+    expected = tictactoe_ai.load()
+    path = tictactoe_ai.path_for()
+    data = bytearray(open(path, 'rb').read())
+    if damage == 'truncate':
+        data = data[:100]
+    elif damage == 'flip_score':
+        data[len(tictactoe_ai.MAGIC) + 5] ^= 1
+    else:
+        data[-1] ^= 1
+    open(path, 'wb').write(data)
+
+    monkeypatch.setattr(tictactoe_ai, '_table', None)
+    assert tictactoe_ai.load() == expected
+    monkeypatch.setattr(tictactoe_ai, '_table', None)
+    assert tictactoe_ai._read(path) == expected
+
+
+def test_unwritable_cache_keeps_the_table_in_memory(tmp_path, monkeypatch):
+    blocker = tmp_path / 'file'
+    blocker.write_bytes(b'')
+    monkeypatch.setattr(tictactoe_ai, 'cache_dir', lambda: str(blocker / 'cache'))
+    monkeypatch.setattr(tictactoe_ai, '_table', None)
+    assert len(tictactoe_ai.load()) == tictactoe_ai.ENTRIES